@@ -1,3 +1,5 @@
+__version__ = "0.2.18"
+
 import os
 import sys
 TOP_LEVEL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)))
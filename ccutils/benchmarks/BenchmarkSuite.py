@@ -0,0 +1,329 @@
+import sys
+import json
+import platform
+import datetime
+import tracemalloc
+import timeit
+import ccutils
+from ccutils.ccparser import CiscoIosParser, CiscoIosInterfaceLine, ConfigToJson
+from ccutils.utils import CiscoRange
+from ccutils.utils.common_utils import get_logger
+from ccutils.benchmarks.config_generator import generate_config
+
+
+class BenchmarkSuite(object):
+    """
+    Benchmarks of parsing stages on synthetic IOS config (see :func:`ccutils.benchmarks.generate_config`).
+
+    Each stage is run `repeat` times (on fresh objects where the stage would otherwise be served from cache) and
+    the best time is reported, along with throughput and (when `memory` is enabled) peak memory allocated by one
+    extra run of the stage, traced by :mod:`tracemalloc`. Results are plain dictionaries which can be saved as
+    JSON and compared across versions with :meth:`compare`.
+
+    Examples:
+
+        Example::
+
+            from ccutils.benchmarks import BenchmarkSuite
+
+            suite = BenchmarkSuite(interfaces=2000, repeat=3)
+            results = suite.run()
+            print(suite.format_report(results))
+            suite.save(results, "results.json")
+
+        Or from command line::
+
+            python -m ccutils.benchmarks --interfaces 2000 --output results.json --compare baseline.json
+
+    """
+
+    STAGES = (
+        "generate",
+        "parse",
+        "fix_indents",
+        "create_cfg_line_objects",
+        "interface_properties",
+        "config_to_json",
+        "to_json",
+        "to_yaml",
+        "cisco_range"
+    )
+
+    def __init__(self, interfaces=1000, vlans=200, vrfs=10, service_instances=2, ntp_servers=4, aaa_servers=2,
+                 repeat=3, memory=True, verbosity=3):
+        """
+
+        Args:
+            interfaces (:obj:`int`, optional): Number of interfaces of the generated config
+            vlans (:obj:`int`, optional): Number of VLANs of the generated config
+            vrfs (:obj:`int`, optional): Number of VRFs of the generated config
+            service_instances (:obj:`int`, optional): Number of service instances per trunk with service instances
+            ntp_servers (:obj:`int`, optional): Number of NTP servers of the generated config
+            aaa_servers (:obj:`int`, optional): Number of TACACS+ and RADIUS servers of the generated config
+            repeat (:obj:`int`, optional): Number of runs of each stage, the best one is reported
+            memory (:obj:`bool`, optional): Measure peak memory of each stage (by one extra run)
+            verbosity (:obj:`int`, optional): Logging output level of the suite. Parsers are created with verbosity
+                2 (errors only), as some properties log deprecation warnings.
+
+        """
+        self.logger = get_logger(name="BenchmarkSuite", verbosity=verbosity)
+        self.params = {
+            "interfaces": interfaces,
+            "vlans": vlans,
+            "vrfs": vrfs,
+            "service_instances": service_instances,
+            "ntp_servers": ntp_servers,
+            "aaa_servers": aaa_servers
+        }
+        self.repeat = max(1, repeat)
+        self.memory = memory
+        self.config_lines = None
+
+    def _measure(self, func, setup=None, lines=None, items=None, memory=None):
+        """
+        Run `func(*setup())` `repeat` times and return timing results.
+
+        Args:
+            func: Function to measure
+            setup: Function returning tuple of arguments for `func`, not included in the time
+            lines (int): Number of config lines processed by one run, for ``lines_per_s``
+            items (int): Number of items (configs, interfaces, ...) processed by one run, for ``items_per_s``
+            memory (bool): Measure peak memory, defaults to ``self.memory``
+
+        Returns:
+            dict: Timing results
+
+        """
+        times = []
+        for _ in range(self.repeat):
+            args = setup() if setup else ()
+            start = timeit.default_timer()
+            func(*args)
+            times.append(timeit.default_timer() - start)
+        best = min(times)
+        result = {
+            "time": best,
+            "mean": sum(times) / len(times),
+            "repeat": len(times)
+        }
+        if lines is not None:
+            result["lines_per_s"] = lines / best if best else None
+        if items is not None:
+            result["items"] = items
+            result["items_per_s"] = items / best if best else None
+        if self.memory if memory is None else memory:
+            args = setup() if setup else ()
+            tracemalloc.start()
+            try:
+                func(*args)
+                result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return result
+
+    def _parse(self):
+        return CiscoIosParser(config=list(self.config_lines), verbosity=2)
+
+    @staticmethod
+    def get_interface_properties():
+        """
+        Return names of public properties of :class:`CiscoIosInterfaceLine`.
+
+        Returns:
+            list: Sorted list of property names
+
+        """
+        names = set()
+        for cls in CiscoIosInterfaceLine.__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, property) and not name.startswith("_"):
+                    names.add(name)
+        return sorted(names)
+
+    def bench_generate(self):
+        result = self._measure(func=lambda: generate_config(**self.params))
+        self.config_lines = generate_config(**self.params)
+        result["lines"] = len(self.config_lines)
+        result["lines_per_s"] = len(self.config_lines) / result["time"] if result["time"] else None
+        return result
+
+    def bench_parse(self):
+        return self._measure(func=self._parse, lines=len(self.config_lines), items=1)
+
+    def bench_fix_indents(self):
+        return self._measure(func=lambda config: config.fix_indents(), setup=lambda: (self._parse(), ), lines=len(self.config_lines))
+
+    def bench_create_cfg_line_objects(self):
+        return self._measure(func=lambda config: config._create_cfg_line_objects(), setup=lambda: (self._parse(), ), lines=len(self.config_lines))
+
+    def bench_interface_properties(self):
+        """
+        Time each public property of all interfaces, on interfaces with empty cache (so the time includes
+        the properties the measured one depends on).
+
+        Returns:
+            dict: Results as ``{property name: results}``
+        """
+        config = self._parse()
+        interfaces = list(config.interface_lines)
+
+        def setup():
+            for interface in interfaces:
+                interface.clear_cache()
+            return ()
+
+        def get_all(name):
+            for interface in interfaces:
+                getattr(interface, name)
+
+        results = {}
+        for name in self.get_interface_properties():
+            try:
+                results[name] = self._measure(func=lambda: get_all(name), setup=setup, items=len(interfaces), memory=False)
+            except Exception as e:
+                self.logger.debug("Property {} failed: {}".format(name, repr(e)))
+                results[name] = {"error": repr(e)}
+        return results
+
+    def bench_config_to_json(self):
+        return self._measure(func=lambda config: ConfigToJson(config=config, verbosity=2), setup=lambda: (self._parse(), ), lines=len(self.config_lines), items=1)
+
+    def bench_to_json(self):
+        ctj = ConfigToJson(config=self._parse(), verbosity=2)
+        return self._measure(func=ctj.to_json, items=len(ctj.data["interfaces"]))
+
+    def bench_to_yaml(self):
+        ctj = ConfigToJson(config=self._parse(), verbosity=2)
+        return self._measure(func=ctj.to_yaml, items=len(ctj.data["interfaces"]))
+
+    def bench_cisco_range(self):
+        config = self._parse()
+        # Allowed VLANs of trunks (except "none") and interface ranges
+        regex = r"^ switchport trunk allowed vlan (?:add )?(\d\S*)"
+        texts = [x.re_search(regex=regex, group=1) for x in config.find_objects(regex=regex)]
+        texts.extend("GigabitEthernet1/0/1-{}".format(x % 48 + 1) for x in range(len(texts)))
+
+        def run():
+            for text in texts:
+                crange = CiscoRange(text=text)
+                crange.compressed_list
+                list(crange)
+        return self._measure(func=run, items=len(texts))
+
+    def run(self, stages=None):
+        """
+        Run benchmarks.
+
+        Args:
+            stages (:obj:`list`, optional): Names of stages to run (see :attr:`STAGES`), defaults to all. The config is
+                always generated.
+
+        Returns:
+            dict: Results as ``{"meta": {...}, "stages": {stage: results}, "properties": {property: results}}``.
+            Times are in seconds, memory in bytes.
+
+        """
+        stages = [x for x in self.STAGES if stages is None or x in stages or x == "generate"]
+        results = {
+            "meta": self.get_meta(),
+            "stages": {},
+            "properties": {}
+        }
+        for stage in stages:
+            self.logger.info("Running stage {}".format(stage))
+            result = getattr(self, "bench_{}".format(stage))()
+            if stage == "interface_properties":
+                results["properties"] = result
+                result = {"time": sum(x.get("time", 0) for x in result.values())}
+            results["stages"][stage] = result
+        results["meta"]["lines"] = len(self.config_lines)
+        return results
+
+    def get_meta(self):
+        return {
+            "ccutils_version": ccutils.__version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "params": dict(self.params),
+            "repeat": self.repeat
+        }
+
+    @staticmethod
+    def save(results, path):
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    @staticmethod
+    def load(path):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def compare(old, new):
+        """
+        Compare times of two results (of the same parameters).
+
+        Args:
+            old (dict): Baseline results
+            new (dict): New results
+
+        Returns:
+            dict: ``{name: {"old": time, "new": time, "ratio": new / old}}`` for stages and properties (prefixed by
+            ``property:``) present in both results
+
+        """
+        comparison = {}
+        for section, prefix in (("stages", ""), ("properties", "property:")):
+            for name, result in new.get(section, {}).items():
+                baseline = old.get(section, {}).get(name)
+                if not baseline or "time" not in baseline or "time" not in result:
+                    continue
+                comparison[prefix + name] = {
+                    "old": baseline["time"],
+                    "new": result["time"],
+                    "ratio": result["time"] / baseline["time"] if baseline["time"] else None
+                }
+        return comparison
+
+    @staticmethod
+    def format_report(results, comparison=None, top=10):
+        """
+        Return human readable report of the results.
+
+        Args:
+            results (dict): Results of :meth:`run`
+            comparison (:obj:`dict`, optional): Comparison from :meth:`compare`
+            top (:obj:`int`, optional): Number of slowest properties to include
+
+        Returns:
+            str: Report
+
+        """
+        meta = results["meta"]
+        lines = [
+            "ccutils {} / Python {} / {} config lines ({})".format(
+                meta["ccutils_version"], meta["python"], meta.get("lines"), ", ".join("{}={}".format(k, v) for k, v in meta["params"].items())
+            ),
+            "{:<28}{:>12}{:>14}{:>14}{:>12}{:>9}".format("stage", "time [ms]", "lines/s", "items/s", "peak [MB]", "ratio")
+        ]
+
+        def format_row(name, result, key):
+            ratio = (comparison or {}).get(key, {}).get("ratio")
+            return "{:<28}{:>12}{:>14}{:>14}{:>12}{:>9}".format(
+                name[:27],
+                "{:.2f}".format(result["time"] * 1000) if "time" in result else "error",
+                "{:.0f}".format(result["lines_per_s"]) if result.get("lines_per_s") else "",
+                "{:.1f}".format(result["items_per_s"]) if result.get("items_per_s") else "",
+                "{:.2f}".format(result["peak_memory"] / 1e6) if "peak_memory" in result else "",
+                "{:.2f}".format(ratio) if ratio else ""
+            )
+
+        for name, result in results["stages"].items():
+            lines.append(format_row(name, result, name))
+        properties = sorted(((k, v) for k, v in results["properties"].items() if "time" in v), key=lambda x: -x[1]["time"])
+        if properties:
+            lines.append("slowest interface properties:")
+            for name, result in properties[:top]:
+                lines.append(format_row("  " + name, result, "property:" + name))
+        return "\n".join(lines)
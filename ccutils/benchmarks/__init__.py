@@ -0,0 +1,2 @@
+from ccutils.benchmarks.config_generator import generate_config
+from ccutils.benchmarks.BenchmarkSuite import BenchmarkSuite
@@ -0,0 +1,48 @@
+import argparse
+import sys
+from ccutils.benchmarks import BenchmarkSuite
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="python -m ccutils.benchmarks", description="Benchmark ccutils on synthetic IOS config.")
+    parser.add_argument("--interfaces", type=int, default=1000)
+    parser.add_argument("--vlans", type=int, default=200)
+    parser.add_argument("--vrfs", type=int, default=10)
+    parser.add_argument("--service-instances", type=int, default=2)
+    parser.add_argument("--ntp-servers", type=int, default=4)
+    parser.add_argument("--aaa-servers", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Do not measure peak memory")
+    parser.add_argument("--stages", nargs="*", choices=BenchmarkSuite.STAGES, help="Stages to run, defaults to all")
+    parser.add_argument("--output", help="Save results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=None, help="Exit with 1 if any stage is slower than baseline by this ratio")
+    args = parser.parse_args(args=args)
+
+    suite = BenchmarkSuite(
+        interfaces=args.interfaces,
+        vlans=args.vlans,
+        vrfs=args.vrfs,
+        service_instances=args.service_instances,
+        ntp_servers=args.ntp_servers,
+        aaa_servers=args.aaa_servers,
+        repeat=args.repeat,
+        memory=not args.no_memory
+    )
+    results = suite.run(stages=args.stages)
+    comparison = None
+    if args.compare:
+        comparison = suite.compare(old=suite.load(args.compare), new=results)
+    print(suite.format_report(results=results, comparison=comparison))
+    if args.output:
+        suite.save(results=results, path=args.output)
+    if comparison and args.threshold:
+        slower = [k for k, v in comparison.items() if not k.startswith("property:") and v["ratio"] and v["ratio"] > args.threshold]
+        if slower:
+            print("Slower than baseline: {}".format(", ".join(slower)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
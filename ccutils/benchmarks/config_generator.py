@@ -0,0 +1,156 @@
+import random
+
+
+def generate_config(interfaces=1000, vlans=200, vrfs=10, service_instances=2, ntp_servers=4, aaa_servers=2, seed=0):
+    """
+    Generate synthetic Cisco IOS config, to be used for benchmarking.
+
+    Every 8th interface is an SVI (with VRF, IPv4 address and HSRP), every 8th a trunk with service instances, the
+    remaining ones alternate between access ports and trunks. SVIs use the generated VLANs first, then the remaining
+    VLAN IDs; when all 4094 IDs are used, the L3 interfaces are routed ports instead. Output is deterministic for
+    given arguments.
+
+    Args:
+        interfaces (:obj:`int`, optional): Number of interfaces
+        vlans (:obj:`int`, optional): Number of VLANs (VLAN IDs start at 2, so at most 4093)
+        vrfs (:obj:`int`, optional): Number of VRFs
+        service_instances (:obj:`int`, optional): Number of service instances on each trunk with service instances
+        ntp_servers (:obj:`int`, optional): Number of NTP servers
+        aaa_servers (:obj:`int`, optional): Number of TACACS+ and RADIUS servers (each)
+        seed (:obj:`int`, optional): Seed of the random generator
+
+    Returns:
+        list: List of config lines
+
+    """
+    rng = random.Random(seed)
+    vlan_ids = list(range(2, 2 + min(vlans, 4093))) or [1]
+    # IDs of SVIs, generated VLANs first
+    svi_ids = vlan_ids + sorted(set(range(1, 4095)) - set(vlan_ids))
+    vrf_names = ["VRF-{}".format(i) for i in range(vrfs)]
+    lines = [
+        "version 15.2",
+        "hostname BENCH-SW-{}".format(seed),
+        "!",
+        "ip domain name example.com",
+        "ip name-server 10.0.0.1 10.0.0.2",
+        "!"
+    ]
+    # VRFs
+    for i, vrf in enumerate(vrf_names):
+        lines.extend([
+            "vrf definition {}".format(vrf),
+            " rd 65000:{}".format(i + 1),
+            " description Synthetic VRF {}".format(i),
+            " !",
+            " address-family ipv4",
+            "  route-target export 65000:{}".format(i + 1),
+            "  route-target import 65000:{}".format(i + 1),
+            " exit-address-family",
+            "!"
+        ])
+    # AAA
+    lines.append("aaa new-model")
+    for protocol in ["tacacs+", "radius"]:
+        name = protocol.rstrip("+").upper()
+        lines.append("aaa group server {} {}-GROUP".format(protocol, name))
+        for i in range(aaa_servers):
+            lines.append(" server name {}-{}".format(name, i))
+        lines.append(" ip {} source-interface Loopback0".format(protocol.rstrip("+")))
+    lines.extend([
+        "aaa authentication login default group TACACS-GROUP local",
+        "aaa authorization exec default group TACACS-GROUP if-authenticated",
+        "aaa accounting exec default start-stop group TACACS-GROUP",
+        "!"
+    ])
+    for i in range(aaa_servers):
+        lines.extend([
+            "tacacs server TACACS-{}".format(i),
+            " address ipv4 10.0.{}.1".format(i),
+            " key 7 36A03A8A4C00E81F03D62D8B04BBBF4D",
+            " timeout 10",
+            "radius server RADIUS-{}".format(i),
+            " address ipv4 10.1.{}.1 auth-port 1812 acct-port 1813".format(i),
+            " timeout 2",
+            " key Test123"
+        ])
+    lines.append("!")
+    # NTP and logging
+    for i in range(ntp_servers):
+        vrf = " vrf {}".format(vrf_names[i % len(vrf_names)]) if vrf_names and i % 2 else ""
+        lines.append("ntp server{} 10.2.{}.{} key {}{}".format(vrf, i // 250, i % 250 + 1, i % 4 + 1, " prefer" if i == 0 else ""))
+    lines.extend([
+        "ntp source Loopback0",
+        "logging host 10.3.0.1",
+        "logging source-interface Loopback0",
+        "!"
+    ])
+    # VLANs
+    for vlan_id in vlan_ids:
+        lines.extend(["vlan {}".format(vlan_id), " name VLAN-{}".format(vlan_id), "!"])
+    # Interfaces
+    for i in range(interfaces):
+        kind = i % 8
+        if kind == 0:
+            n = i // 8
+            if n < len(svi_ids):
+                lines.append("interface Vlan{}".format(svi_ids[n]))
+                lines.append(" description SVI {}".format(i))
+            else:
+                lines.append("interface GigabitEthernet{}/{}/{}".format(i // 2304 + 1, (i // 48) % 48, i % 48 + 1))
+                lines.append(" description Routed Port {}".format(i))
+                lines.append(" no switchport")
+            if vrf_names:
+                lines.append(" vrf forwarding {}".format(vrf_names[i % len(vrf_names)]))
+            # Unique /24 subnet for each L3 interface
+            lines.extend([
+                " ip address 10.{}.{}.2 255.255.255.0".format(16 + (n // 256) % 240, n % 256),
+                " standby version 2",
+                " standby 1 ip 10.{}.{}.1".format(16 + (n // 256) % 240, n % 256),
+                " standby 1 priority 110",
+                " standby 1 preempt",
+                " no shutdown"
+            ])
+        else:
+            lines.append("interface GigabitEthernet{}/{}/{}".format(i // 2304 + 1, (i // 48) % 48, i % 48 + 1))
+            lines.append(" description Port {}".format(i))
+            if kind == 1:
+                lines.extend([
+                    " switchport trunk allowed vlan none",
+                    " switchport mode trunk",
+                    " mtu 9000"
+                ])
+                for j in range(service_instances):
+                    vlan_id = vlan_ids[(i + j) % len(vlan_ids)]
+                    lines.extend([
+                        " service instance {} ethernet".format(vlan_id),
+                        "  description SI {}".format(vlan_id),
+                        "  encapsulation dot1q {}".format(vlan_id),
+                        "  rewrite ingress tag pop 1 symmetric",
+                        "  bridge-domain {}".format(vlan_id),
+                        " !"
+                    ])
+            elif kind % 2:
+                allowed = sorted(rng.sample(vlan_ids, min(len(vlan_ids), 8)))
+                lines.extend([
+                    " switchport trunk native vlan {}".format(allowed[0]),
+                    " switchport trunk allowed vlan {}".format(",".join(str(x) for x in allowed)),
+                    " switchport trunk allowed vlan add {}-{}".format(allowed[-1], min(allowed[-1] + 10, 4094)),
+                    " switchport mode trunk",
+                    " storm-control broadcast level 10.00",
+                    " storm-control action shutdown"
+                ])
+            else:
+                lines.extend([
+                    " switchport access vlan {}".format(rng.choice(vlan_ids)),
+                    " switchport mode access",
+                    " switchport voice vlan {}".format(vlan_ids[-1]),
+                    " spanning-tree portfast",
+                    " speed 1000",
+                    " duplex full"
+                ])
+            if i % 5 == 0:
+                lines.append(" shutdown")
+        lines.append("!")
+    lines.append("end")
+    return lines
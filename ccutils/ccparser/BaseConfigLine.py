@@ -2,18 +2,43 @@ import pathlib
 import re
 import json
 import timeit
-import functools
-from ccutils.utils.common_utils import get_logger
+import logging
+from ccutils.utils.common_utils import cached_property, get_query_plan
+from ccutils.utils.RegexRegistry import regex_registry
 
 
 class BaseConfigLine(object):
 
+    # Line objects only hold a reference to the parser and their index, everything else (text, indent, type)
+    # is stored in the parser's columns and read on demand. Values of cached properties are stored in _cache.
+    __slots__ = ("_name", "config", "number", "_cache")
+
     PATTERN_TYPE = type(re.compile(pattern=""))
     _parent_indent_regex = re.compile(pattern=r"[^! ]", flags=re.MULTILINE)
     _child_indent_regex = re.compile(pattern=r"^ \S", flags=re.MULTILINE)
     _grandchild_indent_regex = re.compile(pattern=r"^  \S", flags=re.MULTILINE)
     comment_regex = re.compile(pattern=r"^(\s+)?!.*", flags=re.MULTILINE)
     _interface_regex = re.compile(pattern=r"^interface\s(\S+)", flags=re.MULTILINE)
+    # Single pattern classifying the line as comment or interface in one match, see get_line_class
+    _line_class_regex = re.compile(pattern=r"^(?:(?P<comment>\s*!)|(?P<interface>interface\s\S))")
+
+    # Bits used for storing line types in BaseConfigParser._types
+    COMMENT_BIT = 1
+    PARENT_BIT = 2
+    CHILD_BIT = 4
+    INTERFACE_BIT = 8
+    # In the order they are reported by .type
+    TYPE_BITS = (
+        ("comment", COMMENT_BIT),
+        ("parent", PARENT_BIT),
+        ("child", CHILD_BIT),
+        ("interface", INTERFACE_BIT)
+    )
+    # Cached properties whose values depend on lines outside of the line's top-level section,
+    # invalidated by BaseConfigParser.update even if the section did not change
+    CONFIG_DEPENDENT_PROPERTIES = ()
+    # Logger name: logger, loggers are looked up once per name, not once per line
+    _loggers = {}
 
     def __init__(self, number, text, config, verbosity=3, name="BaseConfigLine"):
         """
@@ -21,22 +46,93 @@ class BaseConfigLine(object):
 
         Args:
             number (int): Index of line in config
-            text (str): Text of the config line
+            text (str): Text of the config line, must be equal to ``config.config_lines_str[number]``
             config (:obj:`BaseConfigParser`): Reference to the parent BaseConfigParser object
-            verbosity (:obj:`int`, optional): Logging output level, defaults to 3: Warning
+            verbosity (:obj:`int`, optional): Logging output level, defaults to 3: Warning. Logger level is set
+                by the parent BaseConfigParser object, kept for backwards compatibility.
 
         """
         self._name = name
-        self.logger = get_logger(name=name, verbosity=verbosity)
-        #print(self.logger.handlers)
         self.config = config
-        self.config_lines_obj = self.config.lines
         self.number = number
-        self.text = text
-        self.indent = len(self.text) - len(self.text.lstrip(" "))
-        self.type = None
-        self.logger.debug("Parsing line: #{}: '{}'".format(self.number, self.text))
+        self._cache = None
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsing line: #{}: '{}'".format(self.number, text))
 
+    @property
+    def logger(self):
+        # Shared by all lines of the same name, see BaseConfigParser._create_cfg_line_objects
+        try:
+            return self._loggers[self._name]
+        except KeyError:
+            logger = self._loggers[self._name] = logging.getLogger(self._name)
+            return logger
+
+    @property
+    def config_lines_obj(self):
+        return self.config.lines
+
+    @property
+    def text(self):
+        return self.config.config_lines_str[self.number]
+
+    @property
+    def indent(self):
+        return self.config._indents[self.number]
+
+    @property
+    def type(self):
+        """
+        Types of the line, as determined by :attr:`get_type` during parsing. ``None`` until the parsing is finished.
+        """
+        if self.number >= len(self.config._types):
+            return None
+        type_bits = self.config._types[self.number]
+        return [name for name, bit in self.TYPE_BITS if type_bits & bit]
+
+    @classmethod
+    def get_line_class(cls, text):
+        """
+        Classify line text using single regex match.
+
+        Args:
+            text (str): Text of the config line
+
+        Returns:
+            str: ``"comment"``, ``"interface"`` or ``None`` for any other line
+
+        """
+        m = cls._line_class_regex.match(text)
+        return m.lastgroup if m else None
+
+    def clear_cache(self, keep=None):
+        """
+        Invalidate all cached properties of the line.
+
+        Args:
+            keep (:obj:`iterable`, optional): Keys (as returned by :meth:`cache_info`) of cached values to keep
+
+        Returns:
+            None
+
+        """
+        if keep and self._cache:
+            keep = set(keep)
+            self._cache = {k: v for k, v in self._cache.items() if k in keep}
+        else:
+            self._cache = None
+
+    def cache_info(self):
+        """
+        Inspect cached properties of the line.
+
+        Returns:
+            dict: Copy of the cache, containing ``name: value`` for properties and
+            ``(name, args, kwargs): value`` for methods called with arguments
+
+        """
+        return dict(self._cache or {})
 
     def return_obj(self):
         return self
@@ -44,7 +140,7 @@ class BaseConfigLine(object):
     def _compile_regex(self, regex, flags=re.MULTILINE):
         pattern = None
         try:
-            pattern = re.compile(pattern=regex, flags=flags)
+            pattern = regex_registry.compile(regex=regex, flags=flags)
         except Exception as e:
             self.logger.error(msg="Error while compiling regex '{}'. Exception: {}".format(regex, repr(e)))
         return pattern
@@ -57,44 +153,33 @@ class BaseConfigLine(object):
             list: List of child config lines (objects)
 
         """
-        children = []
-        line_num = int(self.number) + 1
-        #print(len(self.config.lines))
-        while line_num <= len(self.config.lines) - 1:   # Avoid IndexError
-            if self.config.lines[line_num].indent <= self.indent:
-                break
-            else:
-                children.append(self.config.lines[line_num])
-                line_num += 1
-        return children
+        return self.config.lines[self.number + 1:self.config._section_end[self.number]]
 
     @property
     def get_parent(self):
         if not self.is_child:
-            self.logger.debug("Line is not a child, therefore has no parent. Line: {}".format(self.text))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Line is not a child, therefore has no parent. Line: {}".format(self.text))
             return None
         else:
-            line_num = int(self.number) - 1
-            line = self.config.lines[line_num]
-            while line.indent >= self.indent and line_num > 0:
-                line_num -= 1
-                line = self.config.lines[line_num]
-            return line
+            return self.config.lines[self.number - self.config._parent_offset[self.number]]
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def get_parents(self):
         start = timeit.default_timer()
         parents = []
         if not self.is_child:
-            self.logger.debug("Line is not a child, therefore has no parent. Line: {}".format(self.text))
-            pass
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Line is not a child, therefore has no parent. Line: {}".format(self.text))
         else:
-            parents.insert(0, self.get_parent)
-            while parents[0].get_parent is not None:
-                parents.insert(0, parents[0].get_parent)
-        stop = timeit.default_timer()
-        self.logger.debug("Getting parents of line {} took {} ms".format(str(self), (stop-start)*10e3))
+            number = self.number
+            while self.config._parent_offset[number]:
+                number -= self.config._parent_offset[number]
+                parents.append(self.config.lines[number])
+            parents.reverse()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            stop = timeit.default_timer()
+            self.logger.debug("Getting parents of line {} took {} ms".format(str(self), (stop-start)*10e3))
         return parents
 
     def re_search_children(self, regex, group=None):
@@ -152,12 +237,26 @@ class BaseConfigLine(object):
             pattern = regex
         if not pattern:
             return []
-        children = self.get_children()
-        result = list(filter(lambda x: bool(re.search(pattern=pattern, string=x.text)), children))
+        result = self._search_children(pattern=pattern)
         if group:
             result = [x.re_search(regex=pattern, group=group) for x in result]
         return result
 
+    def _search_children(self, pattern):
+        """
+        Return list of children matching compiled `pattern`. Subclasses may override this to serve results
+        from a cache. Children not containing the (longest) literal substring required by the pattern (see
+        :func:`ccutils.utils.common_utils.get_query_plan`) are skipped without running the regex.
+        """
+        plan = get_query_plan(pattern)
+        children = self.get_children()
+        if plan.substrings:
+            required = plan.substrings[0]
+            children = [x for x in children if required in x.text]
+        if self.config.stats.enabled:
+            self.config.stats.count_regex(pattern=pattern, count=len(children))
+        return [x for x in children if pattern.search(x.text)]
+
     # TODO: Add Tests
     # TODO: Add Examples
     def re_search_children_multipattern(self, regexes: list, group=None, deduplicate: bool = True) -> list:
@@ -236,6 +335,8 @@ class BaseConfigLine(object):
         if pattern is None:
             self.logger.warning("Got invalid regex {}".format(regex))
             return None
+        if self.config.stats.enabled:
+            self.config.stats.count_regex(pattern=pattern)
         m = re.search(pattern=pattern, string=self.text)
         if m:
             if group is None:
@@ -263,7 +364,8 @@ class BaseConfigLine(object):
                     self.logger.error(msg="Given regex '{}' does not contain required group '{}'".format(regex, group))
                     return None
         else:
-            self.logger.debug(msg="Given regex '{}' did not match.".format(regex))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(msg="Given regex '{}' did not match.".format(regex))
             return None
 
     def re_match(self, regex, group=None):
@@ -275,6 +377,8 @@ class BaseConfigLine(object):
 
         if pattern is None:
             return None
+        if self.config.stats.enabled:
+            self.config.stats.count_regex(pattern=pattern)
         m = re.match(pattern=pattern, string=self.text)
         if m:
             if group is None:
@@ -292,7 +396,8 @@ class BaseConfigLine(object):
                     self.logger.error(msg="Given regex '{}' does not contain required group '{}'".format(regex, group))
                     return None
         else:
-            self.logger.debug(msg="Given regex '{}' did not match.".format(regex))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(msg="Given regex '{}' did not match.".format(regex))
             return None
 
     @property
@@ -311,19 +416,17 @@ class BaseConfigLine(object):
             list: List of types
 
         """
-        types = []
-        if re.match(self.comment_regex, self.text):
-            types.append("comment")
+        line_class = self.get_line_class(self.text)
+        if line_class == "comment":
             # If line is comment, it's comment only
-            return types
+            return ["comment"]
+        types = []
         if self.is_parent:
             types.append("parent")
         if self.is_child:
             types.append("child")
-        if self.is_interface:
+        if line_class == "interface":
             types.append("interface")
-        # if re.match(self.comment_regex, self.text):
-        #     types.append("comment")
         return types
 
     @property
@@ -335,13 +438,7 @@ class BaseConfigLine(object):
             bool: True if line is a parent line, False otherwise
 
         """
-        if self.number < len(self.config.lines)-1:
-            if self.config.lines[self.number+1].indent > self.indent:
-                return True
-            else:
-                return False
-        else:
-            return False
+        return self.config._section_end[self.number] > self.number + 1
 
     @property
     def is_child(self):
@@ -359,7 +456,9 @@ class BaseConfigLine(object):
 
     @property
     def is_interface(self):
-        return bool(re.match(self._interface_regex, self.text))
+        if self.number < len(self.config._types):
+            return bool(self.config._types[self.number] & self.INTERFACE_BIT)
+        return self.get_line_class(self.text) == "interface"
 
     def __str__(self):
         return "[{} #{} ({}): '{}']".format(self._name, self.number, self.type, self.text)
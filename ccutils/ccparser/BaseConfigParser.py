@@ -3,13 +3,19 @@ import os
 import re
 import json
 import timeit
-from ccutils.utils.common_utils import get_logger
+import difflib
+import logging
+import weakref
+from array import array
+from ccutils.utils.common_utils import get_logger, cached_property, get_query_plan
 from ccutils.ccparser import BaseConfigLine
 from ccutils.ccparser import BaseInterfaceLine
-from ccutils.utils import CiscoRange
-import functools
+from ccutils.utils import VlanSet, ParseCache, MappedConfigLines, PatternSet, ParserStats, PropertyProfiler, regex_registry
 
-re._MAXCACHE = 1024
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class BaseConfigParser(object):
@@ -23,6 +29,18 @@ class BaseConfigParser(object):
     # Patterns
     _vlan_configuration_regex = re.compile(pattern=r"^vlan configuration (?P<vlan_range>[\d\-,]+)", flags=re.MULTILINE)
     _device_tracking_attach_policy_regex = re.compile(pattern=r"^ device-tracking attach-policy (?P<policy>\S+)")
+    _indent_regex = re.compile(pattern=r" *")
+
+    # Patterns shared with subclasses, see ccutils.utils.RegexRegistry
+    _domain_name_regex = regex_registry.register(name="domain_name", regex=r"^ip domain.name (?P<domain_name>\S+)", flags=re.MULTILINE)
+    _name_servers_regex = regex_registry.register(name="name_servers", regex=r"^ip name.server (?P<name_servers>(?:\d{1,3}\.){3}\d{1,3}(?: (?:\d{1,3}\.){3}\d{1,3})*)", flags=re.MULTILINE)
+    _ipv4_address_regex = regex_registry.register(name="ipv4_address", regex=r"(?:\d{1,3}\.){3}\d{1,3}")
+    _vlan_id_regex = regex_registry.register(name="vlan_id", regex=r"^vlan (?P<vlan_id>\d+)", flags=re.MULTILINE)
+    _vlan_name_regex = regex_registry.register(name="vlan_name", regex=r"^ name (?P<vlan_name>\S+)", flags=re.MULTILINE)
+    _vlan_group_regex = regex_registry.register(name="vlan_group", regex=r"^vlan group (?P<group>\S+) vlan-list (?P<vlan_id>\d+)", flags=re.MULTILINE)
+    _vrf_name_regex = regex_registry.register(name="vrf_name", regex=r"^(?:ip )?vrf(?: definition)? (?P<vrf_name>\S+)", flags=re.MULTILINE)
+    _vrf_rd_child_regex = regex_registry.register(name="vrf_rd_child", regex=r"^ rd (?P<rd>\S+)", flags=re.MULTILINE)
+    _vrf_description_child_regex = regex_registry.register(name="vrf_description_child", regex=r"^ description (?P<description>.*)", flags=re.MULTILINE)
 
     def __init__(self, config=None, verbosity=4, name="BaseConfigParser", **kwargs):
         """
@@ -32,10 +50,25 @@ class BaseConfigParser(object):
             config (:obj:`pathlib.Path` or `str` or `list`): Config file in a form of `pathlib.Path`, or `string`
                 containing the entire config or list of lines of the config file
             verbosity (:obj:`int`, optional): Determines the verbosity of logging output, defaults to 4: Info
+            cache_dir (:obj:`pathlib.Path` or `str`, optional): Directory of on-disk parse cache (see
+                :class:`ccutils.utils.ParseCache`). When set, lines of previously seen configs are loaded from the
+                cache instead of being parsed.
+            memory_map (:obj:`bool`, optional): When `config` is a path, memory-map the file instead of reading it,
+                so that ``config_lines_str`` is :class:`ccutils.utils.MappedConfigLines`, decoding lines only when
+                accessed. Reduces memory usage with large config files. Defaults to ``False``.
+            stats (:obj:`bool`, optional): Record stage timings, regex evaluation counts, cache hits and property
+                compute times to ``stats`` (see :class:`ccutils.utils.ParserStats`). Defaults to ``False``.
+            stats_hook (:obj:`callable`, optional): Hook of ``stats``, called as ``hook(event, name, value)``. Enables
+                ``stats``.
+            profile (:obj:`bool`, optional): Profile public properties of the parser and its interface lines (and
+                :class:`ccutils.ccparser.ConfigToJson` using the parser) to ``profiler`` (see
+                :class:`ccutils.utils.PropertyProfiler`). Enables ``stats``. Properties are wrapped at class level
+                until the parser is garbage collected or ``profiler.detach()`` is called. Defaults to ``False``.
 
         Attributes:
             lines (list): Contains list of all config lines stored as objects (see :class:`ccutils.ccparser.BaseConfigLine`)
-            config_lines_str (list): Contains list of all config lines stored as strings
+            config_lines_str (list): Contains list of all config lines stored as strings (or
+                :class:`ccutils.utils.MappedConfigLines` with `memory_map` enabled)
 
         Examples:
 
@@ -74,11 +107,33 @@ class BaseConfigParser(object):
         self.logger = get_logger(name=name, verbosity=verbosity)
         self.config = config
         self.path = self._check_path(kwargs.get("filepath", None)) if kwargs.get("filepath", None) else None
+        self.parse_cache = ParseCache(cache_dir=kwargs["cache_dir"], verbosity=verbosity) if kwargs.get("cache_dir") else None
+        self.memory_map = kwargs.get("memory_map", False)
+        self.stats = ParserStats(enabled=kwargs.get("stats", False) or kwargs.get("stats_hook") is not None, hook=kwargs.get("stats_hook"))
+        self.profiler = None
+        if kwargs.get("profile", False):
+            self.profiler = PropertyProfiler()
+            self.profiler.attach(target=self.__class__)
+            self.profiler.attach(target=self.INTERFACE_LINE_CLASS)
+            # Restore the classes once the parser is gone
+            weakref.finalize(self, self.profiler.detach)
+            self.stats.profiler = self.profiler
+            self.stats.enable()
 
         self.minimal_results = True
+        # Values of cached properties, see clear_cache
+        self._cache = {}
         #: This is a URI.
         self.lines = []
         self.config_lines_str = []
+        # Per-line columns, built by _create_cfg_line_objects
+        self._indents = array("H")
+        self._parent_offset = array("I")
+        self._section_end = array("I")
+        self._depth = array("H")
+        self._types = array("B")
+        # Keyword index, see _build_keyword_index
+        self._keyword_index = {}
         self.parse()
 
     @property
@@ -99,39 +154,221 @@ class BaseConfigParser(object):
 
         :return: ``None``
         """
-        if self.config:
-            config_lines = []
-            # Determine Config Type
-            if isinstance(self.config, list):
-                self.logger.debug(msg="Treating config as list of config lines.")
-                config_lines = [x for x in self.config if (isinstance(x, str) and x != "")]
-            elif isinstance(self.config, str):
-                path = None
-                if os.path.exists(self.config):
-                    path = pathlib.Path(self.config)
-                if path and path.exists():
-                    self.logger.debug(msg="Treating config as filepath.")
-                    path = self._check_path(filepath=path)
-                    if path:
-                        config_lines = [x for x in path.read_text().split("\n") if x != ""]
-                else:
-                    self.logger.debug(msg="Treating config as multi-line string.")
-                    config_lines = [x for x in self.config.split("\n") if x != ""]
-            elif isinstance(self.config, pathlib.Path):
-                self.logger.debug(msg="Treating config as pathlib Path.")
-                path = self._check_path(filepath=self.config)
+        self.clear_cache()
+        with self.stats.timer("read"):
+            if self.config:
+                self.config_lines_str = self._read_config(config=self.config)
+            else:
+                self._get_clean_config()
+        self._load_lines()
+
+    def _read_config(self, config):
+        """
+        Return list of (non-empty) config lines from `config` passed to :meth:`__init__` or :meth:`update`
+
+        :return: ``list``
+        """
+        config_lines = []
+        # Determine Config Type
+        if isinstance(config, list):
+            self.logger.debug(msg="Treating config as list of config lines.")
+            config_lines = [x for x in config if (isinstance(x, str) and x != "")]
+        elif isinstance(config, str):
+            path = None
+            if os.path.exists(config):
+                path = pathlib.Path(config)
+            if path and path.exists():
+                self.logger.debug(msg="Treating config as filepath.")
+                path = self._check_path(filepath=path)
                 if path:
-                    config_lines = [x for x in path.read_text().split("\n") if x != ""]
+                    config_lines = self._read_path(path=path)
             else:
-                self.logger.error("Invalid value passed as config argument.")
-                raise ValueError("Invalid value passed as config argument.")
-            self.config_lines_str = config_lines
-            self.fix_indents()
-            self._create_cfg_line_objects()
+                self.logger.debug(msg="Treating config as multi-line string.")
+                config_lines = [x for x in config.split("\n") if x != ""]
+        elif isinstance(config, pathlib.Path):
+            self.logger.debug(msg="Treating config as pathlib Path.")
+            path = self._check_path(filepath=config)
+            if path:
+                config_lines = self._read_path(path=path)
         else:
-            self._get_clean_config()
+            self.logger.error("Invalid value passed as config argument.")
+            raise ValueError("Invalid value passed as config argument.")
+        return config_lines
+
+    def _read_path(self, path):
+        """
+        Return (non-empty) lines of config file, memory-mapped if ``self.memory_map`` is set.
+
+        :return: ``list`` or :class:`ccutils.utils.MappedConfigLines`
+        """
+        if self.memory_map:
+            self.logger.debug(msg="Memory-mapping config file.")
+            return MappedConfigLines(path=path)
+        return [x for x in path.read_text().split("\n") if x != ""]
+
+    def update(self, config):
+        """
+        Load new version of the config, re-creating only the top-level sections which changed.
+
+        New config is compared with the loaded one section by section. Line objects of unchanged sections are kept
+        (only renumbered) along with their cached properties, except for properties depending on the rest of the
+        config (see :attr:`BaseConfigLine.CONFIG_DEPENDENT_PROPERTIES`). Cached properties of the parser are cleared.
+        Use :meth:`ConfigToJson.refresh` to update ConfigToJson data accordingly.
+
+        Args:
+            config (:obj:`pathlib.Path` or `str` or `list`): New config, same as in :meth:`__init__`
+
+        Returns:
+            dict: Dictionary with keys ``added`` - list of newly created line objects, ``removed`` - list of texts of
+            the lines which are no longer part of the config (their line objects are discarded)
+
+        """
+        start = timeit.default_timer()
+        old_lines = self.lines
+        old_config_lines = self.config_lines_str
+        old_sections = self._get_sections(old_config_lines)
+        self.config = config
+        config_lines = self._read_config(config=config)
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.get_key(text="\n".join(config_lines), namespace=self.__class__.__name__)
+        self.config_lines_str = config_lines
+        self.fix_indents()
+        new_sections = self._get_sections(self.config_lines_str)
+        old_keys = [tuple(old_config_lines[x] for x in range(*section)) for section in old_sections]
+        new_keys = [tuple(self.config_lines_str[x] for x in range(*section)) for section in new_sections]
+        # Changes are usually local, match the common head and tail directly, as SequenceMatcher gets slow
+        # with many repeated sections (such as "!")
+        head = 0
+        while head < min(len(old_keys), len(new_keys)) and old_keys[head] == new_keys[head]:
+            head += 1
+        tail = 0
+        while tail < min(len(old_keys), len(new_keys)) - head and old_keys[-tail - 1] == new_keys[-tail - 1]:
+            tail += 1
+        matching_sections = [(0, 0, head)]
+        matcher = difflib.SequenceMatcher(None, old_keys[head:len(old_keys) - tail], new_keys[head:len(new_keys) - tail], autojunk=False)
+        for i, j, size in matcher.get_matching_blocks():
+            matching_sections.append((head + i, head + j, size))
+        matching_sections.append((len(old_keys) - tail, len(new_keys) - tail, tail))
+        # New line number: old line object
+        reuse = {}
+        for i, j, size in matching_sections:
+            for old_section, new_section in zip(old_sections[i:i + size], new_sections[j:j + size]):
+                for offset in range(old_section[1] - old_section[0]):
+                    reuse[new_section[0] + offset] = old_lines[old_section[0] + offset]
+        self._cache = {}
+        self._create_cfg_line_objects(reuse=reuse)
+        reused = set(id(x) for x in reuse.values())
+        for line in reuse.values():
+            if line._cache:
+                for name in line.CONFIG_DEPENDENT_PROPERTIES:
+                    line._cache.pop(name, None)
+        result = {
+            "added": [x for x in self.lines if id(x) not in reused],
+            "removed": [old_config_lines[i] for i, x in enumerate(old_lines) if id(x) not in reused]
+        }
+        if cache_key is not None:
+            self.parse_cache.set(key=cache_key, entry=self._get_cache_entry())
+        if self.stats.enabled:
+            self.stats.record_stage(name="update", seconds=timeit.default_timer() - start)
+        self.logger.debug(msg="Updated config in {} ms, reused {} lines, added {}, removed {}.".format((timeit.default_timer()-start)*1000, len(reuse), len(result["added"]), len(result["removed"])))
+        return result
+
+    @staticmethod
+    def _get_sections(config_lines):
+        """
+        Return list of ``(start, end)`` ranges of top-level sections of (indent-fixed) config lines.
+        """
+        starts = [i for i, text in enumerate(config_lines) if not text.startswith(" ")]
+        if config_lines and (not starts or starts[0] != 0):
+            starts.insert(0, 0)
+        return list(zip(starts, starts[1:] + [len(config_lines)]))
+
+    def _load_lines(self):
+        """
+        Create line objects from ``self.config_lines_str``, either by parsing them or from the parse cache.
+
+        :return: ``None``
+        """
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.get_key(text="\n".join(self.config_lines_str), namespace=self.__class__.__name__)
+            entry = self.parse_cache.get(key=cache_key)
+            if self.stats.enabled:
+                self.stats.record_cache(name="parse_cache", hit=entry is not None)
+            if entry is not None:
+                with self.stats.timer("load_cache_entry"):
+                    self._load_cache_entry(entry=entry)
+                return
+        with self.stats.timer("fix_indents"):
             self.fix_indents()
+        with self.stats.timer("create_cfg_line_objects"):
             self._create_cfg_line_objects()
+        if cache_key is not None:
+            self.parse_cache.set(key=cache_key, entry=self._get_cache_entry())
+
+    def _get_cache_entry(self):
+        return {
+            "config_lines_str": list(self.config_lines_str),
+            "indents": self._indents,
+            "parent_offset": self._parent_offset,
+            "section_end": self._section_end,
+            "depth": self._depth,
+            "types": self._types
+        }
+
+    def _load_cache_entry(self, entry):
+        """
+        Restore ``self.config_lines_str``, the per-line columns and line objects from parse cache entry, without
+        running :meth:`fix_indents` and :meth:`_create_cfg_line_objects`.
+
+        :return: ``None``
+        """
+        start = timeit.default_timer()
+        get_logger(name="BaseConfigLine", verbosity=self.verbosity)
+        get_logger(name=self.INTERFACE_LINE_CLASS.__name__, verbosity=self.verbosity)
+        self.config_lines_str = entry["config_lines_str"]
+        self._indents = entry["indents"]
+        self._parent_offset = entry["parent_offset"]
+        self._section_end = entry["section_end"]
+        self._depth = entry["depth"]
+        self._types = entry["types"]
+        self.lines = []
+        for number, text in enumerate(self.config_lines_str):
+            if self._types[number] & BaseConfigLine.INTERFACE_BIT:
+                line = self.INTERFACE_LINE_CLASS(number=number, text=text, config=self, verbosity=self.verbosity)
+            else:
+                line = BaseConfigLine(number=number, text=text, config=self, verbosity=self.verbosity)
+            self.lines.append(line)
+        self._build_keyword_index()
+        self.logger.debug(msg="Loaded {} ConfigLine objects from cache in {} ms.".format(len(self.lines), (timeit.default_timer()-start)*1000))
+
+    def clear_cache(self):
+        """
+        Invalidate all cached properties of the parser and of all its lines. Has to be called whenever the lines
+        change, :meth:`parse` calls it automatically.
+
+        Returns:
+            None
+
+        """
+        self._cache = {}
+        for line in self.lines:
+            line.clear_cache()
+
+    def cache_info(self):
+        """
+        Inspect cached properties of the parser.
+
+        Returns:
+            dict: Dictionary with keys ``parser`` - copy of the parser's cache, ``lines`` - number of lines with
+            cached values
+
+        """
+        return {
+            "parser": dict(self._cache),
+            "lines": len([x for x in self.lines if x._cache])
+        }
 
     def _check_path(self, filepath):
         path = None
@@ -152,13 +389,9 @@ class BaseConfigParser(object):
             self.logger.debug("Path '{}' is existing file.".format(filepath))
             return path
 
-    def _get_indent(self, line):
-        indent_size = len(line) - len(line.lstrip(" "))
-        return indent_size
-
     def _get_clean_config(self, first_line_regex=r"^version \d+\.\d+", last_line_regex=r"^end"):
-        first_regex = re.compile(pattern=first_line_regex, flags=re.MULTILINE)
-        last_regex = re.compile(pattern=last_line_regex, flags=re.MULTILINE)
+        first_regex = regex_registry.compile(regex=first_line_regex, flags=re.MULTILINE)
+        last_regex = regex_registry.compile(regex=last_line_regex, flags=re.MULTILINE)
         all_lines = self.path.read_text().split("\n")
         first = None
         last = None
@@ -184,45 +417,208 @@ class BaseConfigParser(object):
         """
         Function for fixing the indentation level of config lines.
 
+        Indentation of each line is set to its depth (number of spaces is the number of parents), whitespace other
+        than the indentation is removed. Raw indents and depths are computed as integer arrays (using NumPy when
+        available), only the lines which actually change are re-written, so already normalized configs don't
+        allocate any new strings.
+
         :return:
         """
-        indent_map = list(map(self._get_indent, self.config_lines_str))
-        fixed_indent_map = []
-        for i in range(len(indent_map)):
-            if i == 0:
-                fixed_indent_map.append(0)
-                continue
-            if indent_map[i] == 0:
-                fixed_indent_map.append(0)
-                continue
-            if indent_map[i] == indent_map[i-1]:
-                fixed_indent_map.append(fixed_indent_map[-1])
-            elif indent_map[i] > indent_map[i-1]:
-                fixed_indent_map.append(fixed_indent_map[-1]+1)
-            elif indent_map[i] < indent_map[i-1]:
-                fixed_indent_map.append(fixed_indent_map[-1]-1)
-        for i, val in enumerate(fixed_indent_map):
-            self.config_lines_str[i] = " "*val + self.config_lines_str[i].strip()
-            #print(val, "'{}'".format(self.config_lines_str[i]))
-
-    def _create_cfg_line_objects(self):
+        if isinstance(self.config_lines_str, MappedConfigLines):
+            indents = self.config_lines_str.get_indents()
+            unstripped = self.config_lines_str.get_unstripped()
+        else:
+            indents, unstripped = self._get_indents(self.config_lines_str)
+        changed = self._get_changed_indents(indents)
+        for i in sorted(set(changed.keys()).union(unstripped)):
+            self.config_lines_str[i] = " "*changed.get(i, indents[i]) + self.config_lines_str[i].strip()
+
+    def _get_indents(self, config_lines):
+        """
+        Return ``array`` of number of leading spaces of `config_lines` and list of numbers of lines containing other
+        whitespace, which would be removed by ``str.strip()``.
+        """
+        match = self._indent_regex.match
+        indents = array("H")
+        unstripped = []
+        for number, text in enumerate(config_lines):
+            indent = match(text).end()
+            indents.append(indent)
+            if text[indent:indent + 1].isspace() or text[-1:].isspace():
+                unstripped.append(number)
+        return indents, unstripped
+
+    @staticmethod
+    def _get_changed_indents(indents):
+        """
+        Compute fixed indents (depths) from raw `indents`.
+
+        Top-level lines (indent ``0``) have depth ``0``, every other line is one level deeper than the previous line
+        if its indent is bigger, one level shallower if smaller, or at the same level. So depths are cumulative sums
+        of signs of indent differences, restarting at each top-level line.
+
+        Returns:
+            dict: Only the lines whose fixed indent differs from the raw one, as ``{line number: fixed indent}``
+        """
+        if not len(indents):
+            return {}
+        if numpy is not None:
+            raw = numpy.array(indents, dtype=numpy.int64)
+            totals = numpy.cumsum(numpy.sign(numpy.diff(raw, prepend=raw[:1])))
+            numbers = numpy.arange(len(raw))
+            restarts = numpy.maximum.accumulate(numpy.where((raw == 0) | (numbers == 0), numbers, 0))
+            depths = totals - totals[restarts]
+            return {int(i): int(depths[i]) for i in numpy.flatnonzero(depths != raw)}
+        changed = {}
+        depth = 0
+        previous = indents[0]
+        for number, indent in enumerate(indents):
+            if number == 0 or indent == 0:
+                depth = 0
+            elif indent > previous:
+                depth += 1
+            elif indent < previous:
+                depth -= 1
+            previous = indent
+            if depth != indent:
+                changed[number] = depth
+        return changed
+
+    def _create_cfg_line_objects(self, reuse=None):
         """
         Function for generating ``self.lines``.
 
+        Line objects only store their index, all the other per-line data is kept in compact columns (``array``),
+        built in the same pass:
+
+        - ``self._indents`` - indentation level of the line
+        - ``self._parent_offset`` - distance to the parent line (``0`` for top-level lines), so parent of line ``i``
+          is ``self.lines[i - self._parent_offset[i]]``
+        - ``self._section_end`` - index of the first line following the section, so children of line ``i`` are
+          ``self.lines[i+1:self._section_end[i]]``
+        - ``self._depth`` - number of parents of the line
+        - ``self._types`` - bit field of line types, see :attr:`BaseConfigLine.TYPE_BITS`
+
+        Args:
+            reuse (:obj:`dict`, optional): Existing line objects to use instead of creating new ones, as
+                ``{line number: line object}``, see :meth:`update`
+
         """
         start = timeit.default_timer()
+        # Line objects share one logger per class, configure it only once
+        get_logger(name="BaseConfigLine", verbosity=self.verbosity)
+        get_logger(name=self.INTERFACE_LINE_CLASS.__name__, verbosity=self.verbosity)
+        get_line_class = BaseConfigLine.get_line_class
+        self.lines = []
+        indents = self._indents = array("H")
+        parent_offset = self._parent_offset = array("I")
+        section_end = self._section_end = array("I")
+        depth = self._depth = array("H")
+        types = array("B")
+        # Stack of indexes of lines whose section is still open
+        stack = []
         for number, text in enumerate(self.config_lines_str):
-            if re.match(pattern=r"^interface\s\S+", string=text, flags=re.MULTILINE):
-                self.lines.append(self.INTERFACE_LINE_CLASS(number=number, text=text, config=self, verbosity=self.verbosity).return_obj())
+            indent = len(text) - len(text.lstrip(" "))
+            indents.append(indent)
+            line_class = get_line_class(text)
+            line = reuse.get(number) if reuse else None
+            if line is not None:
+                line.number = number
+            elif line_class == "interface":
+                line = self.INTERFACE_LINE_CLASS(number=number, text=text, config=self, verbosity=self.verbosity).return_obj()
             else:
-                self.lines.append(BaseConfigLine(number=number, text=text, config=self, verbosity=self.verbosity).return_obj())
-        for line in self.lines:
-            line.type = line.get_type
+                line = BaseConfigLine(number=number, text=text, config=self, verbosity=self.verbosity).return_obj()
+            if line_class == "interface":
+                type_bits = BaseConfigLine.INTERFACE_BIT
+            elif line_class == "comment":
+                type_bits = BaseConfigLine.COMMENT_BIT
+            else:
+                type_bits = 0
+            self.lines.append(line)
+            # Any line with the same or bigger indent closes the sections of previous lines
+            while len(stack) and indents[stack[-1]] >= indent:
+                section_end[stack.pop()] = number
+            if len(stack):
+                parent_offset.append(number - stack[-1])
+                # Comments are comments only, see BaseConfigLine.get_type
+                if not types[stack[-1]] & BaseConfigLine.COMMENT_BIT:
+                    types[stack[-1]] |= BaseConfigLine.PARENT_BIT
+            else:
+                parent_offset.append(0)
+            if indent > 0 and type_bits != BaseConfigLine.COMMENT_BIT:
+                type_bits |= BaseConfigLine.CHILD_BIT
+            types.append(type_bits)
+            depth.append(len(stack))
+            section_end.append(number + 1)
+            stack.append(number)
+        for number in stack:
+            section_end[number] = len(self.lines)
+        self._types = types
+        self._build_keyword_index()
         self.logger.debug(msg="Created {} ConfigLine objects in {} ms.".format(len(self.lines), (timeit.default_timer()-start)*1000))
 
+    def _build_keyword_index(self):
+        """
+        Build index of line numbers by indent and first word of the line, as ``{indent: {first word: node}}``.
+        Each node is ``[array of line numbers, children]``, where children index the same lines by the second word
+        (``None`` for lines having just one word), making it a trie of leading words. Children are only built when
+        some query needs them, see :meth:`_get_candidate_numbers`.
+
+        :return: ``None``
+        """
+        index = {}
+        indents = self._indents
+        for number, text in enumerate(self.config_lines_str):
+            indent = indents[number]
+            first = text[indent:].split(" ", 1)[0]
+            try:
+                index[indent][first][0].append(number)
+            except KeyError:
+                index.setdefault(indent, {})[first] = [array("I", [number]), None]
+        self._keyword_index = index
+
+    def _get_children_index(self, node):
+        if node[1] is None:
+            children = {}
+            for number in node[0]:
+                text = self.config_lines_str[number]
+                words = text[self._indents[number]:].split(" ", 2)
+                second = words[1] if len(words) > 1 else None
+                if second in children:
+                    children[second].append(number)
+                else:
+                    children[second] = array("I", [number])
+            node[1] = children
+        return node[1]
+
+    def _get_candidate_numbers(self, prefix):
+        """
+        Return sorted numbers of lines which might start with `prefix`, or ``None`` if the prefix cannot be
+        resolved by the keyword index (all lines are candidates).
+        """
+        indent = len(prefix) - len(prefix.lstrip(" "))
+        words = prefix[indent:].split(" ", 2)
+        if words[0] == "":
+            return None
+        first_words = self._keyword_index.get(indent, {})
+        if len(words) == 1:
+            arrays = [node[0] for word, node in first_words.items() if word.startswith(words[0])]
+        elif words[0] not in first_words:
+            return []
+        else:
+            children = self._get_children_index(first_words[words[0]])
+            if len(words) == 2:
+                arrays = [numbers for word, numbers in children.items() if word is not None and word.startswith(words[1])]
+            else:
+                arrays = [children[words[1]]] if words[1] in children else []
+        if len(arrays) == 1:
+            return arrays[0]
+        return sorted(number for numbers in arrays for number in numbers)
+
     def _compile_regex(self, regex, flags=re.MULTILINE):
         """
-        Helper function for compiling `re` patterns from string.
+        Helper function for compiling `re` patterns from string, using the shared
+        :class:`ccutils.utils.RegexRegistry`.
 
         :param str regex: Regex string
         :param flags: Flags for regex pattern, default is re.MULTILINE
@@ -230,7 +626,7 @@ class BaseConfigParser(object):
         """
         pattern = None
         try:
-            pattern = re.compile(pattern=regex, flags=flags)
+            pattern = regex_registry.compile(regex=regex, flags=flags)
         except Exception as e:
             self.logger.error(msg="Error while compiling regex '{}'. Exception: {}".format(regex, repr(e)))
         return pattern
@@ -258,6 +654,11 @@ class BaseConfigParser(object):
 
                 # Returns subset of ``self.lines`` which match specified regex
 
+            Patterns are only tested against lines containing the literal text they require (see
+            :func:`ccutils.utils.common_utils.get_query_plan`). Lines starting with the literal prefix of patterns
+            anchored to the beginning of the line (such as ``^ntp server``) are found using keyword index built at
+            parse time.
+
         """
         pattern = None
         if not isinstance(regex, self.PATTERN_TYPE):
@@ -265,10 +666,22 @@ class BaseConfigParser(object):
         else:
             pattern = regex
         results = []
-        for line in self.lines:
+        lines = self.lines
+        plan = get_query_plan(pattern) if pattern is not None else None
+        if plan is not None and plan.prefix:
+            numbers = self._get_candidate_numbers(prefix=plan.prefix)
+            if numbers is not None:
+                lines = [self.lines[x] for x in numbers]
+        if plan is not None and plan.substrings:
+            required = plan.substrings[0]
+            lines = [x for x in lines if required in x.text]
+        if self.stats.enabled:
+            self.stats.count_regex(pattern=pattern, count=len(lines))
+        for line in lines:
             if re.search(pattern=pattern, string=line.text):
                 results.append(line)
-        self.logger.debug(msg="Matched {} lines for query '{}'".format(len(results), regex))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg="Matched {} lines for query '{}'".format(len(results), regex))
         return results
 
     def get_section_by_parents(self, parents):
@@ -290,6 +703,8 @@ class BaseConfigParser(object):
     def match_to_dict(self, line, patterns):
         """
 
+        All the patterns are searched in a single scan of the line, see :class:`ccutils.utils.PatternSet`.
+
         Args:
             line: Instance of `BaseConfigLine` object
             patterns: List of compiled `re` patterns
@@ -300,9 +715,10 @@ class BaseConfigParser(object):
 
         """
         entry = {}
-
-        for pattern in patterns:
-            match_result = line.re_search(regex=pattern, group="ALL")
+        pattern_set = PatternSet.get(patterns=tuple(patterns))
+        match_results = dict(pattern_set.search(line.text))
+        for index, pattern in enumerate(pattern_set.patterns):
+            match_result = match_results.get(index)
             if match_result is not None:
                 entry.update(match_result)
             else:
@@ -342,12 +758,17 @@ class BaseConfigParser(object):
             entries = []
         else:
             return entries
+        pattern_set = PatternSet.get(patterns=tuple(patterns))
         for candidate in candidates:
             entry = {}
             if isinstance(parent, (str, self.PATTERN_TYPE)):
                 entry.update(self.match_to_dict(line=candidate, patterns=[parent]))
-            for pattern in patterns:
-                updates = candidate.re_search_children(regex=pattern, group="ALL")
+            # Search all the patterns in one pass over the children
+            all_updates = [[] for pattern in pattern_set.patterns]
+            for child in candidate.get_children():
+                for index, groups in pattern_set.search(child.text):
+                    all_updates[index].append(groups)
+            for pattern, updates in zip(pattern_set.patterns, all_updates):
                 if len(updates) == 1:
                     entry.update(updates[0])
                 elif len(updates) == 0:
@@ -363,8 +784,7 @@ class BaseConfigParser(object):
                 entries.append(entry)
         return entries
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def hostname(self):
         hostname = None
         regex = r"^hostname\s(\S+)"
@@ -373,8 +793,7 @@ class BaseConfigParser(object):
             hostname = candidates[0].re_search(regex=regex, group=1)
         return hostname
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def cdp(self):
         if len(self.find_objects(regex="^no cdp run")):
             return False
@@ -384,73 +803,77 @@ class BaseConfigParser(object):
     @property
     def domain_name(self):
         domain_name = None
-        domain_name_regex = re.compile(pattern=r"^ip domain.name (?P<domain_name>\S+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=domain_name_regex)
+        candidates = self.find_objects(regex=self._domain_name_regex)
         if len(candidates):
-            domain_name = candidates[0].re_search(regex=domain_name_regex, group="domain_name")
+            domain_name = candidates[0].re_search(regex=self._domain_name_regex, group="domain_name")
         return domain_name
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def name_servers(self):
         name_servers = []
-        name_servers_regex = re.compile(pattern=r"^ip name.server (?P<name_servers>(?:\d{1,3}\.){3}\d{1,3}(?: (?:\d{1,3}\.){3}\d{1,3})*)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=name_servers_regex)
+        candidates = self.find_objects(regex=self._name_servers_regex)
         for candidate in candidates:
-            name_servers.extend(re.findall(pattern=r"(?:\d{1,3}\.){3}\d{1,3}", string=candidate.text))
+            name_servers.extend(re.findall(pattern=self._ipv4_address_regex, string=candidate.text))
         return name_servers
 
     @property
     def vlans(self):
         vlans = {}
         # Basic VLAN Definition
-        vlan_id_regex = re.compile(pattern=r"^vlan (?P<vlan_id>\d+)", flags=re.MULTILINE)
-        vlan_name_regex = re.compile(pattern=r"^ name (?P<vlan_name>\S+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=vlan_id_regex)
+        candidates = self.find_objects(regex=self._vlan_id_regex)
         for candidate in candidates:
-            vlan_id = candidate.re_search(regex=vlan_id_regex, group="vlan_id")
+            vlan_id = candidate.re_search(regex=self._vlan_id_regex, group="vlan_id")
             vlan_name = None
-            vlan_name_candidate = candidate.re_search_children(regex=vlan_name_regex, group="vlan_name")
+            vlan_name_candidate = candidate.re_search_children(regex=self._vlan_name_regex, group="vlan_name")
             if len(vlan_name_candidate):
                 vlan_name = vlan_name_candidate[0]
             vlans[vlan_id] = {"name": vlan_name}
         # VLAN Configuration
         candidates = self.find_objects(regex=self._vlan_configuration_regex)
         for candidate in candidates:
-            vlan_range = CiscoRange(candidate.re_search(regex=self._vlan_configuration_regex, group="vlan_range"))
+            vlan_range = VlanSet(candidate.re_search(regex=self._vlan_configuration_regex, group="vlan_range"))
             policy = candidate.re_search_children(regex=self._device_tracking_attach_policy_regex, group="policy")
             if len(policy):
-                for vlan_id in vlan_range:
+                for vlan_id in map(str, vlan_range):
                     vlans[vlan_id]["device_tracking_policy"] = policy[0]
         return vlans
 
+    @property
+    def vlan_set(self):
+        """
+        Return IDs of VLANs defined by ``vlan x``, which can be compared with
+        :attr:`BaseInterfaceLine.trunk_allowed_vlan_set` of the interfaces.
+
+        Returns:
+            VlanSet: Set of VLAN IDs
+
+        """
+        candidates = self.find_objects(regex=self._vlan_id_regex)
+        return VlanSet([x.re_search(regex=self._vlan_id_regex, group="vlan_id") for x in candidates])
+
     @property
     def vlan_groups(self):
-        vlan_group_regex = re.compile(pattern=r"^vlan group (?P<group>\S+) vlan-list (?P<vlan_id>\d+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=vlan_group_regex)
-        return [x.re_search(regex=vlan_group_regex, group="ALL") for x in candidates]
+        candidates = self.find_objects(regex=self._vlan_group_regex)
+        return [x.re_search(regex=self._vlan_group_regex, group="ALL") for x in candidates]
 
     @property
     def vrfs(self):
         vrfs = None
-        vrf_name_regex = re.compile(pattern=r"^(?:ip )?vrf(?: definition)? (?P<vrf_name>\S+)", flags=re.MULTILINE)
-        rd_regex = re.compile(pattern=r"^ rd (?P<rd>\S+)", flags=re.MULTILINE)
-        description_regex = re.compile(pattern=r"^ description (?P<description>.*)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=vrf_name_regex)
+        candidates = self.find_objects(regex=self._vrf_name_regex)
         if len(candidates):
             vrfs = {}
         for candidate in candidates:
-            vrf_name = candidate.re_search(regex=vrf_name_regex, group="vrf_name")
+            vrf_name = candidate.re_search(regex=self._vrf_name_regex, group="vrf_name")
             if vrf_name:
                 vrfs[vrf_name] = {}
             else:
                 continue
-            rd_candidates = candidate.re_search_children(regex=rd_regex, group="rd")
+            rd_candidates = candidate.re_search_children(regex=self._vrf_rd_child_regex, group="rd")
             if len(rd_candidates):
                 vrfs[vrf_name]["rd"] = rd_candidates[0]
             else:
                 vrfs[vrf_name]["rd"] = None
-            description_candidates = candidate.re_search_children(regex=description_regex, group="description")
+            description_candidates = candidate.re_search_children(regex=self._vrf_description_child_regex, group="description")
             if len(description_candidates):
                 vrfs[vrf_name]["description"] = description_candidates[0]
             else:
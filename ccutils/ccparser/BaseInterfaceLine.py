@@ -1,15 +1,26 @@
 
 from ccutils.ccparser import BaseConfigLine
-from ccutils.utils import CiscoRange
-from ccutils.utils.common_utils import get_logger, split_interface_name
+from ccutils.utils import VlanSet
+from ccutils.ccparser.InterfaceSnapshot import InterfaceSnapshot
+from ccutils.utils.common_utils import get_logger, split_interface_name, cached_property, cached_method
 import re
-import functools
 
 
 class BaseInterfaceLine(BaseConfigLine):
     """
     Object for retrieving various config options on the interface level.
     """
+    __slots__ = ()
+
+    # Interface level CDP falls back to the global setting, snapshot contains it
+    CONFIG_DEPENDENT_PROPERTIES = ("cdp", "snapshot")
+
+    # Extracts literal leading keyword from source of patterns such as r"^ ip address ..." or r"^\sstandby\s..."
+    _scanner_keyword_regex = re.compile(pattern=r"^\^(?:\\s| )+(?P<keyword>[A-Za-z][A-Za-z0-9\-]*)(?:\\s| |\$)")
+    # Scanner tables (and sets of all their patterns) are built once per class, see _get_scanner_table
+    _scanner_tables = {}
+    _scanner_patterns = {}
+
     _ip_addr_regex = re.compile(pattern=r"^\sip\saddress\s(?P<ip_address>(?:\d{1,3}\.){3}\d{1,3})\s(?P<mask>(?:\d{1,3}\.){3}\d{1,3})(?:\s(?P<secondary>secondary))?", flags=re.MULTILINE)
     _description_regex = re.compile(pattern=r"^\sdescription\s(?P<description>.*)")
     _vrf_regex = re.compile(pattern=r"^(?:\sip)?\svrf\sforwarding\s(?P<vrf>\S+)", flags=re.MULTILINE)
@@ -31,7 +42,7 @@ class BaseInterfaceLine(BaseConfigLine):
     _trunk_encapsulation_regex = re.compile(pattern=r"^ switchport trunk encapsulation (?P<encapsulation>dot1q|isl|negotiate)", flags=re.MULTILINE)
     _switchport_mode_regex = re.compile(pattern=r"^ switchport mode (?P<switchport_mode>access|trunk|dot1q-tunnel|private-vlan|dynamic)")
     _switchport_nonegotiate_regex = re.compile(pattern=r"^ switchport nonegotiate")
-    _trunk_allowed_vlans_regex = re.compile(pattern=r"^ switchport trunk allowed vlan(?: add)? (?P<allowed_vlans>\S+)", flags=re.MULTILINE)
+    _trunk_allowed_vlans_regex = re.compile(pattern=r"^ switchport trunk allowed vlan(?: (?P<action>add|remove|except))? (?P<allowed_vlans>\S+)", flags=re.MULTILINE)
     _access_vlan_regex = re.compile(pattern=r"^ switchport access vlan (?P<access_vlan>\d+)", flags=re.MULTILINE)
     _voice_vlan_regex = re.compile(pattern=r"^ switchport voice vlan (?P<voice_vlan>\d+)")
 
@@ -71,6 +82,9 @@ class BaseInterfaceLine(BaseConfigLine):
     _ospf_network_type_regex = re.compile(pattern=r"^ ip ospf network (?P<network_type>\S+)", flags=re.MULTILINE)
     _ospf_priority_regex = re.compile(pattern=r"^ ip ospf priority (?P<priority>\d+)", flags=re.MULTILINE)
     _ospf_cost_regex = re.compile(pattern=r"^ ip ospf cost (?P<cost>\d+)", flags=re.MULTILINE)
+    _no_ip_address_regex = re.compile(pattern=r"^\sno\sip\saddress", flags=re.MULTILINE)
+    _switchport_mode_line_regex = re.compile(pattern=r"^ (no )?switchport$", flags=re.MULTILINE)
+    _portfast_regex = re.compile(pattern=r"^ spanning-tree portfast")
 
 
 
@@ -88,7 +102,84 @@ class BaseInterfaceLine(BaseConfigLine):
         """
         super(BaseInterfaceLine, self).__init__(number=number, text=text, config=config, verbosity=verbosity, name=name)
 
-    @functools.lru_cache()
+    @classmethod
+    def _get_scanner_table(cls):
+        """
+        Build table of all class-level ``_*_regex`` patterns (except those of :class:`BaseConfigLine`), grouped by
+        the literal keyword the matching line has to start with. Patterns without such keyword (for example
+        ``r"cdp enable"``) are stored under ``None`` and are tried on every child.
+
+        Returns:
+            dict: Dictionary of ``keyword: [patterns]``
+
+        """
+        table = cls._scanner_tables.get(cls)
+        if table is None:
+            table = {}
+            patterns = []
+            for name in dir(cls):
+                if not name.endswith("_regex") or name in vars(BaseConfigLine) or name == "_scanner_keyword_regex":
+                    continue
+                pattern = getattr(cls, name)
+                if isinstance(pattern, cls.PATTERN_TYPE) and pattern not in patterns:
+                    patterns.append(pattern)
+            for pattern in patterns:
+                m = cls._scanner_keyword_regex.match(pattern.pattern)
+                keyword = m.group("keyword") if m and not pattern.flags & re.IGNORECASE else None
+                table.setdefault(keyword, []).append(pattern)
+            table.setdefault(None, [])
+            cls._scanner_tables[cls] = table
+            cls._scanner_patterns[cls] = frozenset(patterns)
+        return table
+
+    @cached_method
+    def scan_children(self):
+        """
+        Walk the children of the interface once and evaluate all the class-level patterns on them, dispatching
+        each child only to patterns which can match its leading keyword. Results are cached and used by
+        :meth:`re_search_children` for these patterns.
+
+        Returns:
+            dict: Dictionary of ``pattern: [matching child lines]``, containing only patterns which matched
+
+        """
+        table = self._get_scanner_table()
+        wildcard = table[None]
+        stats = self.config.stats if self.config.stats.enabled else None
+        results = {}
+        for child in self.get_children():
+            text = child.text
+            keyword = text.split(None, 1)[0] if text.strip() else None
+            for patterns in (table.get(keyword, []), wildcard):
+                for pattern in patterns:
+                    if stats is not None:
+                        stats.count_regex(pattern=pattern)
+                    if pattern.search(text):
+                        results.setdefault(pattern, []).append(child)
+        return results
+
+    def _search_children(self, pattern):
+        if self.__class__ not in self._scanner_patterns:
+            self._get_scanner_table()
+        if pattern in self._scanner_patterns[self.__class__]:
+            return list(self.scan_children().get(pattern, []))
+        return super(BaseInterfaceLine, self)._search_children(pattern=pattern)
+
+    def _get_matched_numbers(self, regexes):
+        """
+        Return numbers of children matching any of `regexes`, taken from :meth:`scan_children` for the class-level
+        patterns.
+        """
+        self._get_scanner_table()
+        scanned = self.scan_children()
+        scanner_patterns = self._scanner_patterns[self.__class__]
+        numbers = set()
+        for regex in regexes:
+            children = scanned.get(regex, ()) if regex in scanner_patterns else self.re_search_children(regex=regex)
+            numbers.update(x.number for x in children)
+        return numbers
+
+    @cached_method
     def get_unprocessed(self, return_type=None):
         """
         Return a list of config lines under the interface, which did not match any of the existing regex patterns.
@@ -154,13 +245,13 @@ class BaseInterfaceLine(BaseConfigLine):
             self._service_instance_encapsulation_string_regex,
             self._service_instance_bridge_domain_regex,
             self._service_instance_service_policy_regex,
-            re.compile(pattern=r"^\sno\sip\saddress", flags=re.MULTILINE),
-            re.compile(pattern=r"^ (no )?switchport$", flags=re.MULTILINE),
-            re.compile(pattern=r"^ spanning-tree portfast")
+            self._no_ip_address_regex,
+            self._switchport_mode_line_regex,
+            self._portfast_regex
         ]
-        for regex in regexes:
-            for child in self.re_search_children(regex=regex):
-                unprocessed_children.remove(child)
+        # Some lines match more than one of the patterns (such as "ip address")
+        processed = self._get_matched_numbers(regexes=regexes)
+        unprocessed_children = [x for x in unprocessed_children if x.number not in processed]
         if return_type == "text":
             return [x.text for x in unprocessed_children]
 
@@ -171,8 +262,19 @@ class BaseInterfaceLine(BaseConfigLine):
             entry[key] = False
         return entry
 
-    @property
-    @functools.lru_cache()
+    @cached_property
+    def snapshot(self):
+        """
+        Return values of all the interface properties used by :class:`ConfigToJson` as
+        :class:`ccutils.ccparser.InterfaceSnapshot`, computed after a single scan of the children.
+
+        Returns:
+            InterfaceSnapshot: Snapshot of the interface
+
+        """
+        return InterfaceSnapshot.from_line(self)
+
+    @cached_property
     def flags(self):
         """
         List of flags/tags describing basic properties of the interface. Used for filtering purposes.
@@ -215,14 +317,12 @@ class BaseInterfaceLine(BaseConfigLine):
             flags.append("virtual")
         return flags
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def interface_name(self):
         self.logger.warning("DEPRECATED: You are using deprecated property .interface_name, use .name instead.")
         return self.name
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def name(self):
         """
         Return name of the interface, such as `GigabitEthernet0/1`.
@@ -236,14 +336,12 @@ class BaseInterfaceLine(BaseConfigLine):
         else:
             return self.re_match(self._interface_regex, group=1)
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def interface_description(self):
         self.logger.warning("DEPRECATED: You are using deprecated property .interface_description, use .description instead.")
         return self.description
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def description(self):
         """
         Returns description of the interface.
@@ -264,8 +362,7 @@ class BaseInterfaceLine(BaseConfigLine):
             else:
                 return None
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def port_mode(self):
         """
         Checks whether the interface is running in switched (**l2**) or routed (**l3**) mode.
@@ -279,8 +376,7 @@ class BaseInterfaceLine(BaseConfigLine):
         else:
             return "l2"
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ip_addresses(self):
         """
         Return list of IP addresses present on the interface
@@ -312,8 +408,7 @@ class BaseInterfaceLine(BaseConfigLine):
             ip_addresses.append(self._val_to_bool(entry=candidate.re_search(regex=self._ip_addr_regex, group="ALL"), key="secondary"))
         return ip_addresses
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def vrf(self):
         """
         Return VRF of the interface
@@ -330,16 +425,14 @@ class BaseInterfaceLine(BaseConfigLine):
             vrf = candidates[0]
         return vrf
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def shutdown(self):
         if len(self.re_search_children(regex=self._shutdown_regex)):
             return True
         else:
             return False
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ospf_priority(self):
         """
         Returns OSPF priority of the interface.
@@ -355,8 +448,7 @@ class BaseInterfaceLine(BaseConfigLine):
             ospf_priority = int(candidates[0])
         return ospf_priority
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ospf(self):
         """
         Return OSPF interface parameters
@@ -416,8 +508,7 @@ class BaseInterfaceLine(BaseConfigLine):
 
         return ospf
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def cdp(self):
         """
         Checks whether CDP is enabled on the interface. This property takes global CDP configuration into account,
@@ -438,13 +529,11 @@ class BaseInterfaceLine(BaseConfigLine):
         else:
             return global_cdp
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def logging_events(self):
         return self.re_search_children(regex=self._logging_event_regex, group="logging_event")
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def standby(self):
         """
         HSRP related configuration. Groups, IP addresses, hello/hold timers, priority and authentication.
@@ -486,8 +575,7 @@ class BaseInterfaceLine(BaseConfigLine):
             data["groups"][entry["standby_group"]]["key_string"] = entry["key_string"]
         return data
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def helper_address(self):
         """
         Return a list of IP addresses specified with **ip helper-address** command (DHCP relay).
@@ -504,8 +592,7 @@ class BaseInterfaceLine(BaseConfigLine):
             helper_address = candidates
         return helper_address
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def native_vlan(self):
         """
         Return Native VLAN of L2 Interface
@@ -522,8 +609,7 @@ class BaseInterfaceLine(BaseConfigLine):
             native_vlan = int(candidates[0])
         return native_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def trunk_encapsulation(self):
         """
         Return encapsulation on trunk interfaces
@@ -540,8 +626,7 @@ class BaseInterfaceLine(BaseConfigLine):
             trunk_encapsulation = candidates[0]
         return trunk_encapsulation
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def encapsulation(self):
         """
         Return encapsulation type and tag for subinterfaces
@@ -564,8 +649,7 @@ class BaseInterfaceLine(BaseConfigLine):
             encapsulation["native"] = True if encapsulation["native"] == "native" else False
         return encapsulation
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def switchport_mode(self):
         """
         Return L2 Mode of interface, either access or trunk
@@ -582,8 +666,7 @@ class BaseInterfaceLine(BaseConfigLine):
             switchport_mode = candidates[0]
         return switchport_mode
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def switchport_nonegotiate(self):
         """
         Check whether the port is running DTP or not. Checks for presence of ``switchport nonegotiate`` command
@@ -598,8 +681,37 @@ class BaseInterfaceLine(BaseConfigLine):
         else:
             return False
 
-    @property
-    @functools.lru_cache()
+    @cached_property
+    def trunk_allowed_vlan_set(self):
+        """
+        Return VLANs allowed with ``switchport trunk allowed vlan x,y,z`` as :class:`ccutils.utils.VlanSet`.
+        Commands with ``add``, ``remove`` and ``except`` are applied in order of the config.
+
+        **Caution:** This does not mean the interface is necessarily a trunk port.
+
+        Returns:
+            VlanSet: Set of allowed VLANs (empty for ``switchport trunk allowed vlan none``)
+
+            Returns ``None`` if absent
+
+        """
+        candidates = self.re_search_children(regex=self._trunk_allowed_vlans_regex, group="ALL")
+        if not len(candidates):
+            return None
+        vlan_set = VlanSet()
+        for candidate in candidates:
+            vlans = VlanSet(candidate["allowed_vlans"])
+            if candidate["action"] == "add":
+                vlan_set = vlan_set | vlans
+            elif candidate["action"] == "remove":
+                vlan_set = vlan_set - vlans
+            elif candidate["action"] == "except":
+                vlan_set = ~vlans
+            else:
+                vlan_set = vlans
+        return vlan_set
+
+    @cached_property
     def trunk_allowed_vlans(self):
         """
         Return a expanded list of VLANs allowed with ``switchport trunk allowed vlan x,y,z``.
@@ -614,22 +726,15 @@ class BaseInterfaceLine(BaseConfigLine):
             Returns "none" if ``switchport trunk allowed vlan none``
 
         """
-        candidates = self.re_search_children(regex=self._trunk_allowed_vlans_regex, group="allowed_vlans")
-        if len(candidates):
-            if len(candidates) == 1:
-                # In case all VLANs are disabled - "switchport trunk allowed vlan none"
-                if candidates[0] == "none":
-                    return "none"
-
-            self.logger.debug("Interface [{}]".format(self.name))
-            candidates = ",".join(candidates)
-            crange = CiscoRange(text=candidates)
-            return crange._list
-        else:
+        vlan_set = self.trunk_allowed_vlan_set
+        if vlan_set is None:
             return None
+        # In case all VLANs are disabled - "switchport trunk allowed vlan none"
+        if not vlan_set:
+            return "none"
+        return [str(x) for x in vlan_set]
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def access_vlan(self):
         """
         Return a number of access VLAN or `None` if the command ``switchport access vlan x`` is not present.
@@ -648,8 +753,7 @@ class BaseInterfaceLine(BaseConfigLine):
             access_vlan = int(candidates[0])
         return access_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def voice_vlan(self):
         """
         Return a number of voice VLAN
@@ -666,8 +770,7 @@ class BaseInterfaceLine(BaseConfigLine):
             voice_vlan = int(candidates[0])
         return voice_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def channel_group(self):
         """
         Return a dictionary describing Port-channel/Etherchannel related configuration
@@ -688,8 +791,7 @@ class BaseInterfaceLine(BaseConfigLine):
             channel_group = candidates[0]
         return channel_group
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def speed(self):
         """
         Return speed of the interface set by command **speed X**
@@ -706,8 +808,7 @@ class BaseInterfaceLine(BaseConfigLine):
             speed = int(candidates[0])
         return speed
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def duplex(self):
         """
         Return duplex of the interface set by command **duplex X**.
@@ -724,8 +825,7 @@ class BaseInterfaceLine(BaseConfigLine):
             duplex = candidates[0]
         return duplex
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def bandwidth(self):
         """
         Return bandwidth of the interface set by command **bandwidth X**.
@@ -742,8 +842,7 @@ class BaseInterfaceLine(BaseConfigLine):
             bandwith = candidates[0]
         return bandwith
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def delay(self):
         """
         Return delay of the interface set by command **delay X**.
@@ -760,8 +859,7 @@ class BaseInterfaceLine(BaseConfigLine):
             delay = candidates[0]
         return delay
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def mtu(self):
         """
         Return MTU of the interface set by command **mtu X**.
@@ -778,8 +876,7 @@ class BaseInterfaceLine(BaseConfigLine):
             mtu = int(candidates[0])
         return mtu
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ip_mtu(self):
         """
         Return IP MTU of the interface set by command **ip mtu X**.
@@ -796,8 +893,7 @@ class BaseInterfaceLine(BaseConfigLine):
             ip_mtu = int(candidates[0])
         return ip_mtu
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tcp_mss(self):
         """
         Return TCP Max Segment Size of the interface set by command **ip tcp adjust-mss X**.
@@ -814,8 +910,7 @@ class BaseInterfaceLine(BaseConfigLine):
             tcp_mss = int(candidates[0])
         return tcp_mss
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def load_interval(self):
         """
         Return Load Interval of the interface set by command **load-interval X**.
@@ -832,8 +927,7 @@ class BaseInterfaceLine(BaseConfigLine):
             load_interval = int(candidates[0])
         return load_interval
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def keepalive(self):
         keepalive = None
         candidates = self.re_search_children(regex=self._keepalive_regex, group="ALL")
@@ -841,8 +935,7 @@ class BaseInterfaceLine(BaseConfigLine):
             keepalive = {k: int(v) for k, v in candidates[0].items()}
         return keepalive
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def service_policy(self):
         """
         Return names of applied service policies
@@ -870,12 +963,11 @@ class BaseInterfaceLine(BaseConfigLine):
         # print(candidates)
         return service_policy
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def service_instances(self):
         service_instances = None
         service_instance_candidates = self.re_search_children(regex=self._service_instance_regex)
-        self.logger.debug("Interface {}: Service Instances Lines: {}".format(self.name, service_instance_candidates))
+        self.logger.debug("Interface %s: Service Instances Lines: %s", self.name, service_instance_candidates)
         if len(service_instance_candidates):
             service_instances = {}
         for service_instance_line in service_instance_candidates:
@@ -920,8 +1012,7 @@ class BaseInterfaceLine(BaseConfigLine):
         # print(service_instances)
         return service_instances
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tunnel_properties(self):
         """
         Return properties related to Tunnel interfaces
@@ -959,8 +1050,7 @@ class BaseInterfaceLine(BaseConfigLine):
             tunnel_properties["ipsec_profile"] = tunnel_ipsec_profile_candidates[0] if tunnel_ipsec_profile_candidates else None
             return tunnel_properties
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def storm_control(self):
         threshold_candidates = self.re_search_children(regex=self._storm_control_threshold_regex, group="ALL")
         action_candidates = self.re_search_children(regex=self._storm_control_action_regex, group="action")
@@ -973,8 +1063,7 @@ class BaseInterfaceLine(BaseConfigLine):
             storm_control["action"] = action_candidates[0]
         return storm_control
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def device_tracking_policy(self):
         device_tracking_policy = None
         candidates = self.re_search_children(regex=self._device_tracking_attach_policy_regex, group="policy")
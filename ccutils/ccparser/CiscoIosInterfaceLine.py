@@ -1,11 +1,10 @@
 from ccutils.ccparser import BaseInterfaceLine
-from ccutils.utils.common_utils import get_logger, split_interface_name, value_to_bool, value_to_int, remove_empty_values, strip_none, strip_false
-from ccutils.utils import CiscoRange
+from ccutils.utils.common_utils import get_logger, split_interface_name, value_to_bool, value_to_int, remove_empty_values, strip_none, strip_false, cached_property, cached_method
 import re
-import functools
 
 class CiscoIosInterfaceLine(BaseInterfaceLine):
 
+    __slots__ = ()
 
     # Regexes
     _ip_addr_regex = re.compile(pattern=r"^\sip\saddress\s(?P<ip_address>(?:\d{1,3}\.){3}\d{1,3})\s(?P<mask>(?:\d{1,3}\.){3}\d{1,3})(?:\s(?P<secondary>secondary))?", flags=re.MULTILINE)
@@ -42,7 +41,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
     _trunk_encapsulation_regex = re.compile(pattern=r"^ switchport trunk encapsulation (?P<encapsulation>dot1q|isl|negotiate)", flags=re.MULTILINE)
     _switchport_mode_regex = re.compile(pattern=r"^ switchport mode (?P<switchport_mode>access|trunk|dot1q-tunnel|private-vlan|dynamic)")
     _switchport_nonegotiate_regex = re.compile(pattern=r"^ switchport nonegotiate")
-    _trunk_allowed_vlans_regex = re.compile(pattern=r"^ switchport trunk allowed vlan(?: add)? (?P<allowed_vlans>\S+)", flags=re.MULTILINE)
+    _trunk_allowed_vlans_regex = re.compile(pattern=r"^ switchport trunk allowed vlan(?: (?P<action>add|remove|except))? (?P<allowed_vlans>\S+)", flags=re.MULTILINE)
     _access_vlan_regex = re.compile(pattern=r"^ switchport access vlan (?P<access_vlan>\d+)", flags=re.MULTILINE)
     _voice_vlan_regex = re.compile(pattern=r"^ switchport voice vlan (?P<voice_vlan>\d+)")
 
@@ -79,6 +78,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
     _service_instance_bridge_domain_regex = re.compile(pattern=r"^  bridge-domain (?P<number>\d+)$", flags=re.MULTILINE)
     _service_instance_service_policy_regex = re.compile(pattern=r"^  service-policy (?P<direction>input|output) (?P<policy_map>\S+)$", flags=re.MULTILINE)
     _service_instance_shutdown_regex = re.compile(pattern=r"^  shutdown$", flags=re.MULTILINE)
+    _service_instance_no_shutdown_regex = re.compile(pattern=r"^  (?:no )?shutdown")
     _service_instance_snmp_trap_regex = re.compile(pattern=r"^  snmp trap (?P<trap>\S+)")
 
     _ospf_process_regex = re.compile(pattern=r"^ ip ospf (?P<process_id>\d+) area (?P<area>\d+)$", flags=re.MULTILINE)
@@ -94,6 +94,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
     _isis_authentication_keychain_regex = re.compile(pattern=r"^ isis authentication key-chain (?P<keychain>\S+)", flags=re.MULTILINE)
 
     _bfd_template_regex = re.compile(pattern=r"^ bfd template (?P<template>\S+)", flags=re.MULTILINE)
+    _unprocessed_comment_regex = re.compile(pattern=r"^\s*!.*", flags=re.MULTILINE)
 
 
 
@@ -105,7 +106,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
     def __init__(self, number, text, config, verbosity=3):
         super(CiscoIosInterfaceLine, self).__init__(number=number, text=text, config=config, verbosity=verbosity, name="CiscoIosInterfaceLine")
 
-    @functools.lru_cache()
+    @cached_method
     def get_unprocessed(self, return_type=None):
         """
         Return a list of config lines under the interface, which did not match any of the existing regex patterns.
@@ -149,7 +150,6 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             self._standby_version_regex,
             self._standby_name_regex,
             self._standby_ipv4_regex,
-            self._standby_auth_regexes,
             self._standby_group_regex,
             self._standby_follow_regex,
             self._standby_track_regex,
@@ -191,14 +191,14 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             self._ipv4_unnumbered_interface_regex,
             self._negotiation_regex,
             self._ip_dhcp_snooping_trust_regex,
-            re.compile(pattern=r"^\s*!.*", flags=re.MULTILINE),
-            re.compile(pattern=r"^\sno\sip\saddress", flags=re.MULTILINE),
-            re.compile(pattern=r"^ (no )?switchport$", flags=re.MULTILINE),
-            re.compile(pattern=r"^ spanning-tree portfast")
+            self._unprocessed_comment_regex,
+            self._no_ip_address_regex,
+            self._switchport_mode_line_regex,
+            self._portfast_regex
         ]
-        for regex in regexes:
-            for child in self.re_search_children(regex=regex):
-                unprocessed_children.remove(child)
+        # Some lines match more than one of the patterns (such as "ip address")
+        processed = self._get_matched_numbers(regexes=regexes)
+        unprocessed_children = [x for x in unprocessed_children if x.number not in processed]
         if return_type == "text":
             return [x.text for x in unprocessed_children]
         elif return_type == "obj":
@@ -206,8 +206,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         else:
             return [x.text for x in unprocessed_children]
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def flags(self):
         """
         List of flags/tags describing basic properties of the interface. Used for filtering purposes.
@@ -250,14 +249,12 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             flags.append("virtual")
         return flags
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def interface_name(self):
         self.logger.warning("DEPRECATED: You are using deprecated property .interface_name, use .name instead.")
         return self.name
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def name(self):
         """
         Return name of the interface, such as `GigabitEthernet0/1`.
@@ -271,14 +268,12 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         else:
             return self.re_match(self._interface_regex, group=1)
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def interface_description(self):
         self.logger.warning("DEPRECATED: You are using deprecated property .interface_description, use .description instead.")
         return self.description
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def description(self):
         """
         Returns description of the interface.
@@ -299,8 +294,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             else:
                 return None
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def port_mode(self):
         """
         Checks whether the interface is running in switched (**l2**) or routed (**l3**) mode.
@@ -316,8 +310,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         else:
             return "l2"
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ip_addresses(self):
         """
         Return list of IP addresses present on the interface
@@ -352,8 +345,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             ip_addresses.append(self._val_to_bool(entry=candidate.re_search(regex=self._ip_addr_regex, group="ALL"), key="secondary"))
         return ip_addresses
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ipv4_addresses(self) -> list:
         """
         Return list of IPv4 addresses present on the interface
@@ -389,8 +381,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             ipv4_addresses = strip_false(ipv4_addresses)
         return ipv4_addresses
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ipv6_addresses(self) -> list:
         """
         Return list of IPv6 addresses present on the interface
@@ -403,13 +394,11 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         """
         raise NotImplementedError("Sorry, this property is waiting to be implemented")
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ip_unnumbered_interface(self):
-        return self.ipv4_unnumbered_interface()
+        return self.ipv4_unnumbered_interface
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ipv4_unnumbered_interface(self):
         ipv4_unnumbered_interface = None
         candidates = self.re_search_children(regex=self._ipv4_unnumbered_interface_regex, group="unnumbered")
@@ -419,8 +408,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
 
 
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def vrf(self):
         """
         Return VRF of the interface
@@ -437,16 +425,14 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             vrf = candidates[0]
         return vrf
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def shutdown(self):
         if len(self.re_search_children(regex=self._shutdown_regex)):
             return True
         else:
             return False
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ospf_priority(self):
         """
         Returns OSPF priority of the interface.
@@ -462,8 +448,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             ospf_priority = int(candidates[0])
         return ospf_priority
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ospf(self):
         """
         Return OSPF interface parameters
@@ -522,8 +507,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
 
         return ospf
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def isis(self):
         """
 
@@ -591,8 +575,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
 
         return isis
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def standby(self):
         standby = {}
         # Get only list of all standby groups
@@ -611,33 +594,33 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         # Standby IPv4
         standby_ipv4_candidates = [value_to_bool(entry=x, keys=["secondary"], keep_none=False) for x in
                                    self.re_search_children(regex=self._standby_ipv4_regex, group="ALL")]
-        self.logger.debug(msg=f"Interface {self.name}:\tIPv4 Candidates: {standby_ipv4_candidates}")
+        self.logger.debug("Interface %s:\tIPv4 Candidates: %s", self.name, standby_ipv4_candidates)
 
         standby_preempt_candidates = [value_to_bool(entry=x, keys=["preempt"], keep_none=False) for x in
                                       self.re_search_children(regex=self._standby_preempt_regex, group="ALL")]
-        self.logger.debug(msg=f"Interface {self.name}:\tPreempt Candidates: {standby_preempt_candidates}")
+        self.logger.debug("Interface %s:\tPreempt Candidates: %s", self.name, standby_preempt_candidates)
 
         standby_timers_candidates = [value_to_bool(entry=x, keys=["timers_msec"], keep_none=False) for x in
                                      self.re_search_children(regex=self._standby_timers_regex, group="ALL")]
-        self.logger.debug(msg=f"Interface {self.name}:\tTimers Candidates: {standby_timers_candidates}")
+        self.logger.debug("Interface %s:\tTimers Candidates: %s", self.name, standby_timers_candidates)
 
         standby_priority_candidates = self.re_search_children(regex=self._standby_priority_regex, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tPriority Candidates: {standby_priority_candidates}")
+        self.logger.debug("Interface %s:\tPriority Candidates: %s", self.name, standby_priority_candidates)
 
         standby_name_candidates = self.re_search_children(regex=self._standby_name_regex, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tName Candidates: {standby_name_candidates}")
+        self.logger.debug("Interface %s:\tName Candidates: %s", self.name, standby_name_candidates)
 
         standby_follow_candidates = self.re_search_children(regex=self._standby_follow_regex, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tFollow Candidates: {standby_follow_candidates}")
+        self.logger.debug("Interface %s:\tFollow Candidates: %s", self.name, standby_follow_candidates)
 
         standby_auth_candidates = self.re_search_children_multipattern(regexes=self._standby_auth_regexes, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tAuth Candidates: {standby_auth_candidates}")
+        self.logger.debug("Interface %s:\tAuth Candidates: %s", self.name, standby_auth_candidates)
 
         standby_track_candidates = self.re_search_children(regex=self._standby_track_regex, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tTrack Candidates: {standby_track_candidates}")
+        self.logger.debug("Interface %s:\tTrack Candidates: %s", self.name, standby_track_candidates)
 
         standby_version_candidates = self.re_search_children(regex=self._standby_version_regex, group="ALL")
-        self.logger.debug(msg=f"Interface {self.name}:\tVersion Candidates: {standby_version_candidates}")
+        self.logger.debug("Interface %s:\tVersion Candidates: %s", self.name, standby_version_candidates)
 
         # Standby Version
         if len(standby_version_candidates):
@@ -733,8 +716,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
 
         return standby
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def bfd(self):
         bfd = {}
         candidates = self.re_search_children(regex=self._bfd_template_regex, group="ALL")
@@ -745,8 +727,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
 
         return bfd
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def cdp(self):
         """
         Checks whether CDP is enabled on the interface. This property takes global CDP configuration into account,
@@ -767,13 +748,11 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         else:
             return global_cdp
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def logging_events(self):
         return self.re_search_children(regex=self._logging_event_regex, group="logging_event")
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def standby_v1(self):
         """
         DEPRECATED: Use ``self.hsrp`` or ``self.standby`` instead
@@ -811,8 +790,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             data["groups"][entry["standby_group"]]["key_string"] = entry["key_string"]
         return data
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def helper_address(self):
         """
         Return a list of IP addresses specified with **ip helper-address** command (DHCP relay).
@@ -829,8 +807,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             helper_address = candidates
         return helper_address
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def native_vlan(self):
         """
         Return Native VLAN of L2 Interface
@@ -847,8 +824,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             native_vlan = int(candidates[0])
         return native_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def trunk_encapsulation(self):
         """
         Return encapsulation on trunk interfaces
@@ -865,8 +841,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             trunk_encapsulation = candidates[0]
         return trunk_encapsulation
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def encapsulation(self):
         """
         Return encapsulation type and tag for subinterfaces
@@ -889,8 +864,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             encapsulation = value_to_bool(encapsulation, keys=["native"])
         return encapsulation
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def switchport_mode(self):
         """
         Return L2 Mode of interface, either access or trunk
@@ -907,8 +881,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             switchport_mode = candidates[0]
         return switchport_mode
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def switchport_nonegotiate(self):
         """
         Check whether the port is running DTP or not. Checks for presence of ``switchport nonegotiate`` command
@@ -923,8 +896,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         else:
             return False
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def trunk_allowed_vlans(self):
         """
         Return a expanded list of VLANs allowed with ``switchport trunk allowed vlan x,y,z``.
@@ -939,22 +911,15 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             Returns "none" if ``switchport trunk allowed vlan none``
 
         """
-        candidates = self.re_search_children(regex=self._trunk_allowed_vlans_regex, group="allowed_vlans")
-        if len(candidates):
-            if len(candidates) == 1:
-                # In case all VLANs are disabled - "switchport trunk allowed vlan none"
-                if candidates[0] == "none":
-                    return "none"
-
-            self.logger.debug("Interface [{}]".format(self.name))
-            candidates = ",".join(candidates)
-            crange = CiscoRange(text=candidates)
-            return crange._list
-        else:
+        vlan_set = self.trunk_allowed_vlan_set
+        if vlan_set is None:
             return None
+        # In case all VLANs are disabled - "switchport trunk allowed vlan none"
+        if not vlan_set:
+            return "none"
+        return [str(x) for x in vlan_set]
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def access_vlan(self):
         """
         Return a number of access VLAN or `None` if the command ``switchport access vlan x`` is not present.
@@ -973,8 +938,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             access_vlan = int(candidates[0])
         return access_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def voice_vlan(self):
         """
         Return a number of voice VLAN
@@ -991,8 +955,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             voice_vlan = int(candidates[0])
         return voice_vlan
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def channel_group(self):
         """
         Return a dictionary describing Port-channel/Etherchannel related configuration
@@ -1013,8 +976,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             channel_group = candidates[0]
         return channel_group
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def speed(self):
         """
         Return speed of the interface set by command **speed X**
@@ -1031,8 +993,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             speed = int(candidates[0])
         return speed
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def duplex(self):
         """
         Return duplex of the interface set by command **duplex X**.
@@ -1049,8 +1010,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             duplex = candidates[0]
         return duplex
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def bandwidth(self):
         """
         Return bandwidth of the interface set by command **bandwidth X**.
@@ -1067,8 +1027,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             bandwith = candidates[0]
         return bandwith
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def delay(self):
         """
         Return delay of the interface set by command **delay X**.
@@ -1085,8 +1044,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             delay = candidates[0]
         return delay
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def mtu(self):
         """
         Return MTU of the interface set by command **mtu X**.
@@ -1103,8 +1061,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             mtu = int(candidates[0])
         return mtu
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ip_mtu(self):
         """
         Return IP MTU of the interface set by command **ip mtu X**.
@@ -1121,8 +1078,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             ip_mtu = int(candidates[0])
         return ip_mtu
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tcp_mss(self):
         """
         Return TCP Max Segment Size of the interface set by command **ip tcp adjust-mss X**.
@@ -1139,8 +1095,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             tcp_mss = int(candidates[0])
         return tcp_mss
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def load_interval(self):
         """
         Return Load Interval of the interface set by command **load-interval X**.
@@ -1157,8 +1112,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             load_interval = int(candidates[0])
         return load_interval
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def keepalive(self):
         keepalive = None
         candidates = self.re_search_children(regex=self._keepalive_regex, group="ALL")
@@ -1166,8 +1120,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             keepalive = {k: int(v) for k, v in candidates[0].items()}
         return keepalive
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def negotiation(self):
         negotiation = None
         candidates = self.re_search_children(regex=self._negotiation_regex, group="negotiation")
@@ -1175,8 +1128,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             negotiation = candidates[0]
         return negotiation
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def service_policy(self):
         """
         Return names of applied service policies
@@ -1204,12 +1156,11 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         # print(candidates)
         return service_policy
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def service_instances(self):
         service_instances = None
         service_instance_candidates = self.re_search_children(regex=self._service_instance_regex)
-        self.logger.debug("Interface {}: Service Instances Lines: {}".format(self.name, service_instance_candidates))
+        self.logger.debug("Interface %s: Service Instances Lines: %s", self.name, service_instance_candidates)
         if len(service_instance_candidates):
             service_instances = {}
         for service_instance_line in service_instance_candidates:
@@ -1266,7 +1217,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
                 self._service_instance_encapsulation_string_regex,
                 self._service_instance_bridge_domain_regex,
                 self._service_instance_service_policy_regex,
-                re.compile(pattern="^  (?:no )?shutdown"),
+                self._service_instance_no_shutdown_regex,
                 self._service_instance_snmp_trap_regex
             ]
             unprocessed_lines = [x.text for x in self.config.section_unprocessed_lines(parent=service_instance_line, check_patterns=check_patterns)]
@@ -1279,8 +1230,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
         # print(service_instances)
         return service_instances
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tunnel_properties(self):
         """
         Return properties related to Tunnel interfaces
@@ -1318,8 +1268,7 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             tunnel_properties["ipsec_profile"] = tunnel_ipsec_profile_candidates[0] if tunnel_ipsec_profile_candidates else None
             return tunnel_properties
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def storm_control(self):
         threshold_candidates = self.re_search_children(regex=self._storm_control_threshold_regex, group="ALL")
         action_candidates = self.re_search_children(regex=self._storm_control_action_regex, group="action")
@@ -1332,16 +1281,14 @@ class CiscoIosInterfaceLine(BaseInterfaceLine):
             storm_control["action"] = action_candidates[0]
         return storm_control
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def device_tracking_policy(self):
         device_tracking_policy = None
         candidates = self.re_search_children(regex=self._device_tracking_attach_policy_regex, group="policy")
         if len(candidates):
             device_tracking_policy = candidates[0]
         return device_tracking_policy
-    @property
-    @functools.lru_cache()
+    @cached_property
     def dhcp_snooping(self):
         dhcp_snooping = {"trust": None}
         trust_candidates = self.re_search_children(regex=self._ip_dhcp_snooping_trust_regex)
@@ -1,8 +1,7 @@
 from ccutils.ccparser import BaseConfigParser
 from ccutils.ccparser import CiscoIosInterfaceLine
-from ccutils.utils import CiscoRange
-from ccutils.utils.common_utils import remove_empty_values, value_to_bool
-import functools
+from ccutils.utils import VlanSet
+from ccutils.utils.common_utils import remove_empty_values, value_to_bool, cached_property, cached_method
 import re
 
 
@@ -31,6 +30,8 @@ class CiscoIosParser(BaseConfigParser):
     _ntp_authentication_keys_regex = re.compile(pattern=r"^ntp authentication-key (?P<key>\d+) (?P<hash_algorithm>\S+) (?P<hash>\S+)(?: (?P<encryption_type>\d+))?".format(_acl_name))
     _ntp_trusted_key_regex = re.compile(pattern=r"ntp trusted-key (?P<key>\d+)")
     _ntp_source_regex = re.compile(pattern="^ntp source (?P<source>{0})".format(_interface_pattern))
+    _ntp_key_regex = re.compile(pattern=r"key (?P<key>\d+)")
+    _ntp_prefer_regex = re.compile(pattern=r"(?P<prefer>prefer)")
 
     _logging_source_interface_regex = re.compile(pattern=r"^logging source-interface (?P<source>{0})".format(_interface_pattern))
     _logging_server_base_regex = re.compile(pattern=r"^logging host (?P<server>{0}|{1})".format(_ip_address_pattern, _host_pattern))
@@ -61,6 +62,10 @@ class CiscoIosParser(BaseConfigParser):
 
     _routing_ospf_process_regex = re.compile(pattern=r"^router ospf (?P<process_id>)( (?P<vrf>\S+))?")
     _routing_isis_process_regex = re.compile(pattern=r"^router isis (?P<process_id>\S+)")
+    _routing_isis_is_type_regex = re.compile(pattern=r"^ is-type (?P<is_type>\S+)")
+    _routing_isis_metric_style_regex = re.compile(pattern=r"^ metric-style (?P<metric_style>\S+)")
+    _routing_isis_fast_flood_regex = re.compile(pattern=r"^ fast-flood (?P<fast_flood>\S+)")
+    _routing_isis_max_lsp_lifetime_regex = re.compile(pattern=r"^ max-lsp-lifetime (?P<max_lsp_lifetime>\S+)")
     _routing_isis_network_id_regex = re.compile(pattern=r"^ net (?P<area_id>\d{2}\.\d{4})\.(?P<system_id>(?:\d{4}\.){2}\d{4})\.(?P<nsel>\d{2})")
     _routing_isis_authentication_mode_candidates_regex = re.compile(pattern=r"^ authentication mode (?P<auth_mode>\S+) (?P<level>level-.)")
     _routing_isis_authentication_keychain_candidates_regex = re.compile(pattern=r"^ authentication key-chain (?P<keychain>\S+) (?P<level>level-.)")
@@ -74,8 +79,7 @@ class CiscoIosParser(BaseConfigParser):
     def __init__(self, config=None, verbosity=4, **kwargs):
         super(CiscoIosParser, self).__init__(config=config, verbosity=verbosity, name="CiscoIosParser", **kwargs)
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def hostname(self):
         hostname = None
         regex = r"^hostname\s(\S+)"
@@ -84,8 +88,7 @@ class CiscoIosParser(BaseConfigParser):
             hostname = candidates[0].re_search(regex=regex, group=1)
         return hostname
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def cdp(self):
         if len(self.find_objects(regex="^no cdp run")):
             return False
@@ -95,14 +98,12 @@ class CiscoIosParser(BaseConfigParser):
     @property
     def domain_name(self):
         domain_name = None
-        domain_name_regex = re.compile(pattern=r"^ip domain.name (?P<domain_name>\S+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=domain_name_regex)
+        candidates = self.find_objects(regex=self._domain_name_regex)
         if len(candidates):
-            domain_name = candidates[0].re_search(regex=domain_name_regex, group="domain_name")
+            domain_name = candidates[0].re_search(regex=self._domain_name_regex, group="domain_name")
         return domain_name
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def name_servers(self):
         name_servers = None
         candidates = self.find_objects(regex=self._name_server_base_regex)
@@ -111,11 +112,10 @@ class CiscoIosParser(BaseConfigParser):
         else:
             return name_servers
         for candidate in candidates:
-            name_servers.extend(re.findall(pattern=r"(?:\d{1,3}\.){3}\d{1,3}", string=candidate.text))
+            name_servers.extend(re.findall(pattern=self._ipv4_address_regex, string=candidate.text))
         return name_servers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_servers(self):
         """
         Property containing DNS servers related data
@@ -139,8 +139,8 @@ class CiscoIosParser(BaseConfigParser):
             self._ntp_server_base_regex,
             self._source_interface_regex,
             self._source_vrf_regex,
-            re.compile("key (?P<key>\d+)"),
-            re.compile("(?P<prefer>prefer)")
+            self._ntp_key_regex,
+            self._ntp_prefer_regex
         ]
         ntp_servers = self.property_autoparse(candidate_pattern=candidate_pattern, patterns=patterns)
         if ntp_servers is not None:
@@ -148,21 +148,19 @@ class CiscoIosParser(BaseConfigParser):
                 server = value_to_bool(entry=server, keys=["prefer"])
         return ntp_servers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_peers(self):
         candidate_pattern = self._ntp_peer_base_regex
         patterns = [
             self._ntp_peer_base_regex,
             self._source_interface_regex,
             self._source_vrf_regex,
-            re.compile("key (?P<key>\d+)")
+            self._ntp_key_regex
         ]
         ntp_peers = self.property_autoparse(candidate_pattern=candidate_pattern, patterns=patterns)
         return ntp_peers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_access_groups(self):
         ntp_access_groups = None
         candidate_pattern = self._ntp_access_group_regex
@@ -177,8 +175,7 @@ class CiscoIosParser(BaseConfigParser):
                 ntp_access_groups.update({match_result["access_type"]: match_result["acl"]})
         return ntp_access_groups
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_authentication_keys(self):
         candidate_pattern = self._ntp_authentication_keys_regex
         patterns = [
@@ -187,8 +184,7 @@ class CiscoIosParser(BaseConfigParser):
         ntp_authentication_keys = self.property_autoparse(candidate_pattern=candidate_pattern, patterns=patterns)
         return ntp_authentication_keys
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_trusted_keys(self):
         candidate_pattern = self._ntp_trusted_key_regex
         patterns = [
@@ -197,8 +193,7 @@ class CiscoIosParser(BaseConfigParser):
         ntp_trusted_keys = self.property_autoparse(candidate_pattern=candidate_pattern, patterns=patterns)
         return ntp_trusted_keys
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp_global_params(self):
         ntp_global_params = {
             "source": None,
@@ -213,8 +208,7 @@ class CiscoIosParser(BaseConfigParser):
             ntp_global_params["authenticate"] = True
         return ntp_global_params
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def ntp(self):
         ntp = {}
         ntp.update(self.ntp_global_params)
@@ -231,8 +225,7 @@ class CiscoIosParser(BaseConfigParser):
             ntp = None
         return ntp
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def logging_servers(self):
         candidate_pattern = self._logging_server_base_regex
         patterns = [
@@ -244,8 +237,7 @@ class CiscoIosParser(BaseConfigParser):
         logging_servers = self.property_autoparse(candidate_pattern=candidate_pattern, patterns=patterns)
         return logging_servers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def logging_global_params(self):
         logging_global_params = {
             "sources": None
@@ -264,8 +256,7 @@ class CiscoIosParser(BaseConfigParser):
             logging_global_params = None
         return logging_global_params
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def logging(self):
         logging = {}
         if self.logging_global_params is not None:
@@ -282,8 +273,7 @@ class CiscoIosParser(BaseConfigParser):
             logging = None
         return logging
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tacacs_servers(self):
         """
 
@@ -330,8 +320,7 @@ class CiscoIosParser(BaseConfigParser):
                 entry = value_to_bool(entry=entry, keys=["single_connection"])
         return tacacs_servers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def radius_servers(self):
         """
 
@@ -383,8 +372,7 @@ class CiscoIosParser(BaseConfigParser):
                 entry = value_to_bool(entry=entry, keys=["single_connection"])
         return radius_servers
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def tacacs_groups(self):
         """
 
@@ -426,8 +414,7 @@ class CiscoIosParser(BaseConfigParser):
                         tacacs_group["servers"] = servers
         return tacacs_groups
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def radius_groups(self):
         """
 
@@ -466,8 +453,7 @@ class CiscoIosParser(BaseConfigParser):
                         radius_group["servers"] = servers
         return radius_groups
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def aaa_login_methods(self):
         aaa_login_methods = None
         candidates = self.find_objects(regex=self._aaa_authentication_login_regex)
@@ -485,8 +471,7 @@ class CiscoIosParser(BaseConfigParser):
                 aaa_login_methods.append(entry)
         return aaa_login_methods
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def aaa_authorization_exec_methods(self):
         aaa_authorization_exec_methods = None
         candidates = self.find_objects(regex=self._aaa_authorization_exec_regex)
@@ -508,23 +493,21 @@ class CiscoIosParser(BaseConfigParser):
     def vlans(self):
         vlans = {}
         # Basic VLAN Definition
-        vlan_id_regex = re.compile(pattern=r"^vlan (?P<vlan_id>\d+)", flags=re.MULTILINE)
-        vlan_name_regex = re.compile(pattern=r"^ name (?P<vlan_name>\S+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=vlan_id_regex)
+        candidates = self.find_objects(regex=self._vlan_id_regex)
         for candidate in candidates:
-            vlan_id = candidate.re_search(regex=vlan_id_regex, group="vlan_id")
+            vlan_id = candidate.re_search(regex=self._vlan_id_regex, group="vlan_id")
             vlan_name = None
-            vlan_name_candidate = candidate.re_search_children(regex=vlan_name_regex, group="vlan_name")
+            vlan_name_candidate = candidate.re_search_children(regex=self._vlan_name_regex, group="vlan_name")
             if len(vlan_name_candidate):
                 vlan_name = vlan_name_candidate[0]
             vlans[vlan_id] = {"name": vlan_name}
         # VLAN Configuration
         candidates = self.find_objects(regex=self._vlan_configuration_regex)
         for candidate in candidates:
-            vlan_range = CiscoRange(candidate.re_search(regex=self._vlan_configuration_regex, group="vlan_range"))
+            vlan_range = VlanSet(candidate.re_search(regex=self._vlan_configuration_regex, group="vlan_range"))
             policy = candidate.re_search_children(regex=self._device_tracking_attach_policy_regex, group="policy")
             if len(policy):
-                for vlan_id in vlan_range:
+                for vlan_id in map(str, vlan_range):
                     # Fix for VLAN 1
                     try:
                         vlans[vlan_id]["device_tracking_policy"] = policy[0]
@@ -535,16 +518,12 @@ class CiscoIosParser(BaseConfigParser):
 
     @property
     def vlan_groups(self):
-        vlan_group_regex = re.compile(pattern=r"^vlan group (?P<group>\S+) vlan-list (?P<vlan_id>\d+)", flags=re.MULTILINE)
-        candidates = self.find_objects(regex=vlan_group_regex)
-        return [x.re_search(regex=vlan_group_regex, group="ALL") for x in candidates]
+        candidates = self.find_objects(regex=self._vlan_group_regex)
+        return [x.re_search(regex=self._vlan_group_regex, group="ALL") for x in candidates]
 
     @property
     def vrfs(self):
         vrfs = None
-        vrf_name_regex = re.compile(pattern=r"^(?:ip )?vrf(?: definition)? (?P<vrf_name>\S+)", flags=re.MULTILINE)
-        rd_regex = re.compile(pattern=r"^ rd (?P<rd>\S+)", flags=re.MULTILINE)
-        description_regex = re.compile(pattern=r"^ description (?P<description>.*)", flags=re.MULTILINE)
         candidates = self.find_objects(regex=self._vrf_definition_regex)
         if len(candidates):
             vrfs = {}
@@ -600,10 +579,10 @@ class CiscoIosParser(BaseConfigParser):
         isis = []
         patterns = [
             self._routing_isis_process_regex,
-            re.compile(pattern=r"^ is-type (?P<is_type>\S+)"),
-            re.compile(pattern=r"^ metric-style (?P<metric_style>\S+)"),
-            re.compile(pattern=r"^ fast-flood (?P<fast_flood>\S+)"),
-            re.compile(pattern=r"^ max-lsp-lifetime (?P<max_lsp_lifetime>\S+)"),
+            self._routing_isis_is_type_regex,
+            self._routing_isis_metric_style_regex,
+            self._routing_isis_fast_flood_regex,
+            self._routing_isis_max_lsp_lifetime_regex,
         ]
         candidates = self.section_property_autoparse(parent=self._routing_isis_process_regex, patterns=patterns, return_with_line=True)
         if len(candidates):
@@ -643,8 +622,7 @@ class CiscoIosParser(BaseConfigParser):
                 unprocessed_lines.append(child)
         return unprocessed_lines
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def all_ipv4_physical_addresses(self):
         """
         Get all physical IPv4 addresses of device config.
@@ -668,7 +646,7 @@ class CiscoIosParser(BaseConfigParser):
                 addresses.extend([x["address"] for x in interface_line.ipv4_addresses])
         return addresses
 
-    @functools.lru_cache()
+    @cached_method
     def vrf_ipv4_physical_addresses(self, vrf="global"):
         """
         Get all physical IPv4 addresses in particular VRF. By default returns all IP addresses from global routing table
@@ -701,8 +679,7 @@ class CiscoIosParser(BaseConfigParser):
             addresses.extend([x["address"] for x in interface.ipv4_addresses])
         return addresses
 
-    @property
-    @functools.lru_cache()
+    @cached_property
     def all_ipv4_standby_addresses(self):
         """
 
@@ -732,7 +709,7 @@ class CiscoIosParser(BaseConfigParser):
                 addresses.extend([x["address"] for x in group["ipv4"]])
         return addresses
 
-    @functools.lru_cache()
+    @cached_method
     def vrf_ipv4_standby_addresses(self, vrf="global"):
         """
 
@@ -1,5 +1,6 @@
 import pathlib
-from ccutils.utils.common_utils import get_logger, load_excel_sheet, jprint, split_interface_name
+from ccutils.utils.common_utils import get_logger, load_excel_sheet, jprint
+from ccutils.utils import interface_names
 from ccutils.ccparser import BaseConfigParser, ConfigToJson
 import json
 
@@ -61,7 +62,8 @@ class ConfigMigration:
     def get_old_ctj(self):
         old_ctj = {}
         for old_hostname, config in self.old_configs.items():
-            old_ctj[old_hostname] = ConfigToJson(config=config)
+            # Only a few interfaces of each old config are usually needed, compute them on demand
+            old_ctj[old_hostname] = ConfigToJson(config=config, lazy=True)
         self.old_ctj = old_ctj
 
 
@@ -98,7 +100,7 @@ class ConfigMigration:
                 old_portchannel = "Port-channel{}".format(old_channel_group_number)
                 new_portchannel = self.get_new_interface(old_host=old_host, old_interface=old_portchannel)
                 if new_portchannel:
-                    new_channel_group_number = split_interface_name(new_portchannel)[1]
+                    new_channel_group_number = interface_names.parse(new_portchannel).number
                     new_interface_context = old_interface_context
                     new_interface_context["channel_group"]["channel_group_number"] = new_channel_group_number
                 else:
@@ -112,12 +114,16 @@ class ConfigMigration:
     def check_standby(self):
         groups = {}
         for old_hostname, old_ctj in self.old_ctj.items():
-            for interface, params in old_ctj.data["interfaces"].items():
-                if "standby" in params["flags"]:
-                    for group in params["l3"]["standby"]["groups"].keys():
+            # Read only standby of L3 interfaces instead of building whole interface data of the (lazy) ConfigToJson
+            for interface_line in old_ctj.get_ordered_interface_lines():
+                if "l3" not in interface_line.flags:
+                    continue
+                standby = interface_line.standby
+                if standby is not None:
+                    for group in standby["groups"].keys():
                         if group not in groups.keys():
                             groups[group] = []
-                        groups[group] += old_hostname, interface, params["l3"]["standby"]["groups"][group]["priority"]
+                        groups[group] += old_hostname, interface_line.name, standby["groups"][group]["priority"]
         
         for group, value in groups.items():
             line = [group]
@@ -1,8 +1,9 @@
 from ccutils.ccparser import BaseConfigParser, BaseConfigLine
-from ccutils.utils.common_utils import get_logger, interface_sort, UnsortableOrderedDict, has_old_pyyaml
-from ccutils.utils import CiscoRange
+from ccutils.utils.common_utils import get_logger, get_interface_sort_key, UnsortableOrderedDict, has_old_pyyaml, LazyMapping
+from ccutils.utils import ParseCache
 import re
 import json
+import functools
 import pathlib
 from collections import OrderedDict
 
@@ -11,191 +12,349 @@ class ConfigToJson:
     """
 
     """
-    def __init__(self, config, omit_empty=False, verbosity=3):
+    # Sections always present in data, as section: attribute of the config
+    _common_sections = [
+        ("hostname", "hostname"),
+        ("domain_name", "domain_name"),
+        ("name_servers", "name_servers"),
+        ("cdp", "cdp"),
+        ("vlans", "vlans"),
+        ("vrfs", "vrfs")
+    ]
+
+    # Interface data keys whose values depend on the rest of the config, as key: attribute of the interface
+    _config_dependent_keys = [
+        ("cdp", "cdp")
+    ]
+
+    # Methods wrapped by PropertyProfiler when the config is profiled
+    PROFILED_METHODS = ("parse_interfaces", "parse_interface", "parse_common", "get_common", "get_optional_common", "to_json", "to_yaml")
+
+    def __init__(self, config, omit_empty=False, verbosity=3, parse=True, lazy=False, cache_dir=None):
         """
 
         :param config: Reference to the parent BaseConfigParser object
         :param int verbosity: Logging output level
+        :param bool parse: Compute ``data`` right away. Set to ``False`` when only streaming the output with
+            :meth:`dump_json` or :meth:`dump_jsonl`
+        :param bool lazy: Make ``data`` (and ``data["interfaces"]``) a :class:`ccutils.utils.common_utils.LazyMapping`,
+            which computes each section and each interface on first access
+        :param cache_dir: Directory of on-disk parse cache (see :class:`ccutils.utils.ParseCache`). When set, ``data``
+            of previously seen configs is loaded from the cache. Not used in lazy mode or with ``parse=False``.
         """
         self.config = config
+        if getattr(config, "profiler", None) is not None:
+            config.profiler.attach(target=self.__class__, methods=self.PROFILED_METHODS)
         self.omit_empty = omit_empty
         self.logger = get_logger(name="CTJ", verbosity=verbosity)
         self.data = {
             "interfaces": {}
         }
-        self.parse_interfaces()
-        self.parse_common()
+        self._interfaces_parsed = False
+        self._common_parsed = False
+        # Interface lines the data["interfaces"] entries were computed from, as name: line
+        self._interface_lines = {}
+        self.parse_cache = ParseCache(cache_dir=cache_dir, verbosity=verbosity) if cache_dir else None
+        if lazy:
+            self.init_lazy_data()
+        elif parse:
+            self.parse()
+
+    def parse(self):
+        """
+        Compute ``data``, or load it from the parse cache if enabled.
+
+        :return:
+        """
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.get_key(
+                text="\n".join(self.config.config_lines_str),
+                namespace="{}-{}-{}".format(self.__class__.__name__, self.config.__class__.__name__, self.omit_empty)
+            )
+            data = self.parse_cache.get(key=cache_key)
+            if self.config.stats.enabled:
+                self.config.stats.record_cache(name="config_to_json_cache", hit=data is not None)
+            if data is not None:
+                self.data = data
+                self._interfaces_parsed = True
+                self._common_parsed = True
+                return
+        with self.config.stats.timer("config_to_json.interfaces"):
+            self.parse_interfaces()
+        with self.config.stats.timer("config_to_json.common"):
+            self.parse_common()
+        if cache_key is not None:
+            self.parse_cache.set(key=cache_key, entry=self.data)
+
+    def init_lazy_data(self):
+        """
+        Replace ``data`` with :class:`ccutils.utils.common_utils.LazyMapping` of the same structure.
+
+        :return:
+        """
+        interfaces = LazyMapping()
+        for interface in self.get_interface_lines():
+            interfaces.add_lazy(interface.name, functools.partial(self.parse_interface, interface=interface))
+        self.data = LazyMapping()
+        self.data["interfaces"] = interfaces
+        for section, attribute in self._common_sections:
+            self.data.add_lazy(section, functools.partial(getattr, self.config, attribute))
+        self.data.add_lazy_group(self.get_optional_common)
+        self._interfaces_parsed = True
+        self._common_parsed = True
 
     def parse_interfaces(self):
         """
 
         :return:
         """
-        interface_lines = list(filter(lambda x: "interface" in x.type, self.config.lines))
+        interface_lines = self.get_interface_lines()
         self.logger.debug(msg="Loaded {} interface lines.".format(len(interface_lines)))
         for interface in interface_lines:
-            port_mode = interface.port_mode
-            flags = interface.flags
-            self.data["interfaces"][interface.name] = {"flags": flags, "unprocessed_lines": interface.get_unprocessed(return_type="text")}
-
-            # Get Shutdown State
-            self.data["interfaces"][interface.name]["shutdown"] = interface.shutdown
+            self.data["interfaces"][interface.name] = self.parse_interface(interface=interface)
+            self._interface_lines[interface.name] = interface
+        self._interfaces_parsed = True
 
-            # Get Description
-            if interface.description or not self.omit_empty:
-                self.data["interfaces"][interface.name]["description"] = interface.description
-
-            # Get CDP
-            self.data["interfaces"][interface.name]["cdp"] = interface.cdp
+    def refresh(self):
+        """
+        Update ``data`` after the config was changed by :meth:`BaseConfigParser.update`. Only interfaces whose
+        lines were re-created by the update are parsed again, the other interfaces only get their config dependent
+        keys (such as ``cdp``) updated. Common sections are computed again.
 
-            # Get Logging events
-            if interface.logging_events or not self.omit_empty:
-                self.data["interfaces"][interface.name]["logging_events"] = interface.logging_events
+        :return:
+        """
+        if isinstance(self.data, LazyMapping):
+            self.init_lazy_data()
+            return
+        if self._interfaces_parsed:
+            old_interfaces = self.data["interfaces"]
+            interfaces = {}
+            interface_lines = {}
+            for interface in self.get_interface_lines():
+                name = interface.name
+                if self._interface_lines.get(name) is interface and name in old_interfaces:
+                    entry = old_interfaces[name]
+                    for key, attribute in self._config_dependent_keys:
+                        if key in entry:
+                            entry[key] = getattr(interface, attribute)
+                else:
+                    self.logger.debug(msg="Parsing changed interface {}".format(name))
+                    entry = self.parse_interface(interface=interface)
+                interfaces[name] = entry
+                interface_lines[name] = interface
+            self.data["interfaces"] = interfaces
+            self._interface_lines = interface_lines
+        if self._common_parsed:
+            for section in [x for x in self.data.keys() if x != "interfaces"]:
+                del self.data[section]
+            self.parse_common()
+
+    def get_interface_lines(self):
+        """
+        Return all interface lines of the config
 
-            # Get channel group
-            if interface.channel_group or not self.omit_empty:
-                self.data["interfaces"][interface.name]["channel_group"] = interface.channel_group
-            
-            # Get speed and duplex
-            if interface.speed or not self.omit_empty:
-                self.data["interfaces"][interface.name]["speed"] = interface.speed
-            if interface.duplex or not self.omit_empty:
-                self.data["interfaces"][interface.name]["duplex"] = interface.duplex
+        Returns:
+            list: List of interface lines (objects)
 
-            # Get Interface MTU
-            if interface.mtu or not self.omit_empty:
-                self.data["interfaces"][interface.name]["mtu"] = interface.mtu
+        """
+        return list(filter(lambda x: "interface" in x.type, self.config.lines))
 
-            # Get Interface MTU
-            if interface.bandwidth or not self.omit_empty:
-                self.data["interfaces"][interface.name]["bandwidth"] = interface.bandwidth
+    def parse_interface(self, interface):
+        """
+        Return data of single interface
 
-            # Get Interface Load-Interval
-            if interface.load_interval or not self.omit_empty:
-                self.data["interfaces"][interface.name]["load_interval"] = interface.load_interval
+        Args:
+            interface (:obj:`BaseInterfaceLine`): Interface line
 
-            # Get Service Policies
-            if interface.service_policy != {"input": None, "output": None} or not self.omit_empty:
-                self.data["interfaces"][interface.name]["service_policy"] = interface.service_policy
+        Returns:
+            dict: Data of the interface, as stored in ``data["interfaces"]``
 
-            # Get Service Instances
-            if interface.service_instances or not self.omit_empty:
-                self.data["interfaces"][interface.name]["service_instances"] = interface.service_instances
+        """
+        # All the values are read from the snapshot, computed once per interface
+        snapshot = interface.snapshot
+        port_mode = snapshot.port_mode
+        # Copy, so that adding flags below does not modify the cached property of the interface
+        flags = list(snapshot.flags)
+        entry = {"flags": flags, "unprocessed_lines": snapshot.unprocessed_lines}
+
+        # Get Shutdown State
+        entry["shutdown"] = snapshot.shutdown
+
+        # Get Description
+        if snapshot.description or not self.omit_empty:
+            entry["description"] = snapshot.description
+
+        # Get CDP
+        entry["cdp"] = snapshot.cdp
+
+        # Get Logging events
+        if snapshot.logging_events or not self.omit_empty:
+            entry["logging_events"] = snapshot.logging_events
+
+        # Get channel group
+        if snapshot.channel_group or not self.omit_empty:
+            entry["channel_group"] = snapshot.channel_group
+
+        # Get speed and duplex
+        if snapshot.speed or not self.omit_empty:
+            entry["speed"] = snapshot.speed
+        if snapshot.duplex or not self.omit_empty:
+            entry["duplex"] = snapshot.duplex
+
+        # Get Interface MTU
+        if snapshot.mtu or not self.omit_empty:
+            entry["mtu"] = snapshot.mtu
+
+        # Get Interface MTU
+        if snapshot.bandwidth or not self.omit_empty:
+            entry["bandwidth"] = snapshot.bandwidth
+
+        # Get Interface Load-Interval
+        if snapshot.load_interval or not self.omit_empty:
+            entry["load_interval"] = snapshot.load_interval
+
+        # Get Service Policies
+        if snapshot.service_policy != {"input": None, "output": None} or not self.omit_empty:
+            entry["service_policy"] = snapshot.service_policy
+
+        # Get Service Instances
+        if snapshot.service_instances or not self.omit_empty:
+            entry["service_instances"] = snapshot.service_instances
+
+        # Get negotiation
+        if snapshot.negotiation or not self.omit_empty:
+            entry["negotiation"] = snapshot.negotiation
+
+
+
+
+
+        if port_mode == "l3":
+            # Get IP addresses
+            entry["l3"] = {}
+            ip_addresses = snapshot.ip_addresses
+            if len(ip_addresses):
+                entry["l3"]["ip_addresses"] = ip_addresses
+            else:
+                entry["l3"]["ip_addresses"] = []
+            # Get VRF
+            if snapshot.vrf or not self.omit_empty:
+                entry["l3"]["vrf"] = snapshot.vrf
+            # TODO: Remove "ospf_priority"
+            # Get OSPF Priority
+            # entry["l3"]["ospf_priority"] = snapshot.ospf_priority
+            # Get standby
+            if snapshot.standby or not self.omit_empty:
+                entry["l3"]["standby"] = snapshot.standby
+                if entry["l3"]["standby"] is not None:
+                    entry["flags"].append("standby")
+            # Get Helper Address
+            if snapshot.helper_address or not self.omit_empty:
+                entry["l3"]["helper_addresses"] = snapshot.helper_address
+            ip_mtu = snapshot.ip_mtu
+            tcp_mss = snapshot.tcp_mss
+            if ip_mtu or not self.omit_empty:
+                entry["l3"]["ip_mtu"] = ip_mtu
+            if tcp_mss or not self.omit_empty:
+                entry["l3"]["tcp_mss"] = tcp_mss
+            if snapshot.encapsulation or not self.omit_empty:
+                entry["l3"]["encapsulation"] = snapshot.encapsulation
+            if snapshot.ospf or not self.omit_empty:
+                entry["l3"]["ospf"] = snapshot.ospf
+            if snapshot.isis or not self.omit_empty:
+                entry["l3"]["isis"] = snapshot.isis
+            # IP Unnumbered
+            if snapshot.ip_unnumbered_interface or not self.omit_empty:
+                entry["l3"]["unnumbered"] = snapshot.ip_unnumbered_interface
+
+        elif port_mode == "l2":
+
+            entry["l2"] = {}
+
+            # Get Native VLAN
+            if snapshot.native_vlan or not self.omit_empty:
+                entry["l2"]["native_vlan"] = snapshot.native_vlan
+
+            # Get Trunk Encapsulation
+            if snapshot.trunk_encapsulation or not self.omit_empty:
+                entry["l2"]["trunk_encapsulation"] = snapshot.trunk_encapsulation
+
+            # Get Switchport Mode
+            if snapshot.switchport_mode or not self.omit_empty:
+                entry["l2"]["mode"] = snapshot.switchport_mode
+
+            # Get Trunk Allowed VLANs
+            if snapshot.trunk_allowed_vlans or not self.omit_empty:
+                entry["l2"]["allowed_vlans"] = snapshot.trunk_allowed_vlans
+
+            # Get Access VLAN
+            if snapshot.access_vlan or not self.omit_empty:
+                entry["l2"]["access_vlan"] = snapshot.access_vlan
+
+            # Get Switchport Nonegotiate
+            if snapshot.switchport_nonegotiate or not self.omit_empty:
+                entry["l2"]["switchport_nonegotiate"] = snapshot.switchport_nonegotiate
+
+            # Get Voice VLAN
+            if snapshot.voice_vlan or not self.omit_empty:
+                entry["l2"]["voice_vlan"] = snapshot.voice_vlan
+
+            # Get Storm Control
+            if snapshot.storm_control or not self.omit_empty:
+                entry["l2"]["storm_control"] = snapshot.storm_control
+
+            # Get Device Tracking Policy
+            if snapshot.device_tracking_policy or not self.omit_empty:
+                entry["l2"]["device_tracking"] = {"policy": snapshot.device_tracking_policy}
+
+        if "tunnel" in flags:
+            entry["tunnel"] = snapshot.tunnel_properties
+        return entry
 
-            # Get negotiation
-            if interface.negotiation or not self.omit_empty:
-                self.data["interfaces"][interface.name]["negotiation"] = interface.negotiation
+    def parse_common(self):
+        self.data.update(self.get_common())
+        self._common_parsed = True
 
+    def get_common(self):
+        """
+        Return data of all the non-interface sections
 
+        Returns:
+            dict: Dictionary of ``section: data``
 
+        """
+        data = {}
+        for section, attribute in self._common_sections:
+            data[section] = getattr(self.config, attribute)
+        data.update(self.get_optional_common())
+        return data
 
+    def get_optional_common(self):
+        """
+        Return data of the non-interface sections which are omitted when empty and ``omit_empty`` is set
 
-            if port_mode == "l3":
-                # Get IP addresses
-                self.data["interfaces"][interface.name]["l3"] = {}
-                ip_addresses = interface.ip_addresses
-                if len(ip_addresses):
-                    self.data["interfaces"][interface.name]["l3"]["ip_addresses"] = ip_addresses
-                else:
-                    self.data["interfaces"][interface.name]["l3"]["ip_addresses"] = []
-                # Get VRF
-                if interface.vrf or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["vrf"] = interface.vrf
-                # TODO: Remove "ospf_priority"
-                # Get OSPF Priority
-                # self.data["interfaces"][interface.name]["l3"]["ospf_priority"] = interface.ospf_priority
-                # Get standby
-                if interface.standby or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["standby"] = interface.standby
-                    if self.data["interfaces"][interface.name]["l3"]["standby"] is not None:
-                        self.data["interfaces"][interface.name]["flags"].append("standby")
-                # Get Helper Address
-                if interface.helper_address or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["helper_addresses"] = interface.helper_address
-                ip_mtu = interface.ip_mtu
-                tcp_mss = interface.tcp_mss
-                if ip_mtu or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["ip_mtu"] = ip_mtu
-                if tcp_mss or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["tcp_mss"] = tcp_mss
-                if interface.encapsulation or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["encapsulation"] = interface.encapsulation
-                if interface.ospf or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["ospf"] = interface.ospf
-                if interface.isis or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["isis"] = interface.isis
-                # IP Unnumbered
-                if interface.ip_unnumbered_interface or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l3"]["unnumbered"] = interface.ip_unnumbered_interface
-
-            elif port_mode == "l2":
-
-                self.data["interfaces"][interface.name]["l2"] = {}
-
-                # Get Native VLAN
-                if interface.native_vlan or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["native_vlan"] = interface.native_vlan
-
-                # Get Trunk Encapsulation
-                if interface.trunk_encapsulation or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["trunk_encapsulation"] = interface.trunk_encapsulation
-
-                # Get Switchport Mode
-                if interface.switchport_mode or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["mode"] = interface.switchport_mode
-
-                # Get Trunk Allowed VLANs
-                if interface.trunk_allowed_vlans or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["allowed_vlans"] = interface.trunk_allowed_vlans
-
-                # Get Access VLAN
-                if interface.access_vlan or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["access_vlan"] = interface.access_vlan
-
-                # Get Switchport Nonegotiate
-                if interface.switchport_nonegotiate or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["switchport_nonegotiate"] = interface.switchport_nonegotiate
-                
-                # Get Voice VLAN
-                if interface.voice_vlan or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["voice_vlan"] = interface.voice_vlan
-
-                # Get Storm Control
-                if interface.storm_control or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["storm_control"] = interface.storm_control
-
-                # Get Device Tracking Policy
-                if interface.device_tracking_policy or not self.omit_empty:
-                    self.data["interfaces"][interface.name]["l2"]["device_tracking"] = {"policy": interface.device_tracking_policy}
-
-            if "tunnel" in flags:
-                self.data["interfaces"][interface.name]["tunnel"] = interface.tunnel_properties
+        Returns:
+            dict: Dictionary of ``section: data``
 
-    def parse_common(self):
-        # Get Hostname
-        self.data["hostname"] = self.config.hostname
-        # Get Domain name
-        self.data["domain_name"] = self.config.domain_name
-        # Get Name-Servers
-        self.data["name_servers"] = self.config.name_servers
-        self.data["cdp"] = self.config.cdp
-        self.data["vlans"] = self.config.vlans
-        self.data["vrfs"] = self.config.vrfs
+        """
+        data = {}
         try:
             if self.config.ntp or not self.omit_empty:
-                self.data["ntp"] = self.config.ntp
+                data["ntp"] = self.config.ntp
             if self.config.logging_servers or not self.omit_empty:
-                self.data["logging"] = self.config.logging
+                data["logging"] = self.config.logging
             if self.config.tacacs_servers or not self.omit_empty:
-                self.data["tacacs_servers"] = self.config.tacacs_servers
+                data["tacacs_servers"] = self.config.tacacs_servers
             if self.config.radius_servers or not self.omit_empty:
-                self.data["radius_servers"] = self.config.radius_servers
+                data["radius_servers"] = self.config.radius_servers
             if self.config.tacacs_groups or not self.omit_empty:
-                self.data["tacacs_groups"] = self.config.tacacs_groups
+                data["tacacs_groups"] = self.config.tacacs_groups
             if self.config.radius_groups or not self.omit_empty:
-                self.data["radius_groups"] = self.config.radius_groups
+                data["radius_groups"] = self.config.radius_groups
         except Exception as e:
             self.logger.error("Encountered Exception: {}".format(repr(e)))
+        return data
 
     def get_interface_list(self, flags_filter=None):
         interfaces = []
@@ -218,11 +377,143 @@ class ConfigToJson:
             (:obj:`OrderedDict`): Interface section as OrderedDict
 
         """
-        interfaces_crange = CiscoRange(list(self.data["interfaces"].keys()))
-        ordered_interfaces = OrderedDict(sorted(self.data["interfaces"].items(), key=lambda x: interface_sort(crange=interfaces_crange, name=x[0])))
+        interfaces = self.data["interfaces"]
+        ordered_interfaces = OrderedDict((x, interfaces[x]) for x in self.sort_interface_names(list(interfaces.keys())))
 
         return ordered_interfaces
 
+    @staticmethod
+    def sort_interface_names(names):
+        """
+        Sort interface names in the order used by :meth:`get_ordered_interfaces`
+
+        Args:
+            names (list): List of interface names
+
+        Returns:
+            list: Sorted list of interface names
+
+        """
+        return sorted(names, key=get_interface_sort_key)
+
+    def get_ordered_interface_lines(self):
+        """
+        Return interface lines in the same order as :meth:`get_ordered_interfaces`, without parsing the interfaces
+
+        Returns:
+            list: List of interface lines (objects)
+
+        """
+        interface_lines = OrderedDict((x.name, x) for x in self.get_interface_lines())
+        return [interface_lines[x] for x in self.sort_interface_names(list(interface_lines.keys()))]
+
+    def iter_interfaces(self):
+        """
+        Yield ``(name, data)`` of all interfaces, ordered as in :meth:`get_ordered_interfaces`. If the interfaces
+        were not parsed yet, each one is parsed only when requested and is not stored in ``data``. Properties of the
+        interface lines computed by parsing are not kept, those computed before are left in place.
+
+        Returns:
+            generator: Generator of ``(name, data)`` tuples
+
+        """
+        if self._interfaces_parsed:
+            interfaces = self.data["interfaces"]
+            for name in self.sort_interface_names(list(interfaces.keys())):
+                yield name, interfaces[name]
+        else:
+            for interface in self.get_ordered_interface_lines():
+                name = interface.name
+                cached = list(interface.cache_info())
+                data = self.parse_interface(interface=interface)
+                # Do not keep the properties computed here around, the data is not stored anyway
+                interface.clear_cache(keep=cached)
+                yield name, data
+
+    def iter_common(self):
+        """
+        Yield ``(section, data)`` of all the non-interface sections.
+
+        Returns:
+            generator: Generator of ``(section, data)`` tuples
+
+        """
+        if self._common_parsed:
+            for section, data in self.data.items():
+                if section != "interfaces":
+                    yield section, data
+        else:
+            for section, data in self.get_common().items():
+                yield section, data
+
+    def iter_json(self, indent=2):
+        """
+        Yield JSON formatted structure describing configuration in chunks, one interface (or section) at a time.
+        Joined chunks are equal to :meth:`to_json` output.
+
+        Args:
+            indent (int): Set JSON indent, defaults to 2
+
+        Returns:
+            generator: Generator of strings
+
+        """
+        if indent is None:
+            item_separator, newline, indent_string = ", ", "", ""
+        else:
+            item_separator, newline = ",", "\n"
+            indent_string = " " * indent if isinstance(indent, int) else indent
+
+        def dump(obj, level):
+            # Nested values have to be indented by the level they are placed in
+            return json.dumps(obj=obj, indent=indent).replace("\n", "\n" + indent_string * level)
+
+        yield "{" + newline + indent_string + json.dumps("interfaces") + ": {"
+        empty = True
+        for name, data in self.iter_interfaces():
+            yield ("" if empty else item_separator) + newline + indent_string * 2 + json.dumps(name) + ": " + dump(data, level=2)
+            empty = False
+        yield "}" if empty else newline + indent_string + "}"
+        for section, data in self.iter_common():
+            yield item_separator + newline + indent_string + json.dumps(section) + ": " + dump(data, level=1)
+        yield newline + "}"
+
+    def dump_json(self, fp, indent=2):
+        """
+        Write JSON formatted structure describing configuration to file-like object, one interface at a time.
+        Written content is equal to :meth:`to_json` output.
+
+        Args:
+            fp: File-like object supporting ``.write()``
+            indent (int): Set JSON indent, defaults to 2
+
+        Returns:
+            None
+
+        """
+        for chunk in self.iter_json(indent=indent):
+            fp.write(chunk)
+
+    def dump_jsonl(self, fp):
+        """
+        Write JSON-lines formatted structure describing configuration to file-like object. Each line is a JSON
+        object ``{"hostname": ..., "section": ..., "name": ..., "data": ...}``, one for each interface (``section``
+        is ``"interfaces"`` and ``name`` is name of the interface) and one for each of the other sections
+        (``name`` is ``null``).
+
+        Args:
+            fp: File-like object supporting ``.write()``
+
+        Returns:
+            None
+
+        """
+        hostname = self.config.hostname
+        for name, data in self.iter_interfaces():
+            fp.write(json.dumps({"hostname": hostname, "section": "interfaces", "name": name, "data": data}) + "\n")
+        for section, data in self.iter_common():
+            fp.write(json.dumps({"hostname": hostname, "section": section, "name": None, "data": data}) + "\n")
+
     def to_json(self, indent=2):
         """
         Return JSON formatted structure describing configuration
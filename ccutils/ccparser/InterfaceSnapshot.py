@@ -0,0 +1,96 @@
+class InterfaceSnapshot(object):
+    """
+    Values of all interface properties used by :class:`ConfigToJson`, read from the interface line at once and
+    cached on it as :attr:`BaseInterfaceLine.snapshot`.
+
+    The children of the interface are walked once by :meth:`BaseInterfaceLine.scan_children`, the properties are
+    then computed from its results. Properties of L3 interfaces (:attr:`L3_FIELDS`) are only read for interfaces
+    with ``port_mode`` ``"l3"``, those of L2 interfaces (:attr:`L2_FIELDS`) for ``"l2"`` and
+    :attr:`TUNNEL_FIELDS` for tunnels, the others are ``None``. Same for properties the line class does not define.
+
+    Values are shared with the cached properties of the line, so they should not be modified. Building the snapshot
+    computes all of its fields, code reading only a few properties (such as ``vrf`` and ``ipv4_addresses``) should
+    access them on the line directly.
+
+    Examples:
+
+        Example::
+
+            snapshot = interface_line.snapshot
+            snapshot.port_mode, snapshot.vrf, snapshot.ipv4_addresses
+            # Returns: ("l3", "MGMT", [{"address": "10.0.0.1", "mask": "255.255.255.0", "secondary": False}])
+
+    """
+
+    COMMON_FIELDS = (
+        "name", "port_mode", "flags", "unprocessed_lines", "shutdown", "description", "cdp", "logging_events",
+        "channel_group", "speed", "duplex", "mtu", "bandwidth", "load_interval", "service_policy",
+        "service_instances", "negotiation"
+    )
+    L3_FIELDS = (
+        "ip_addresses", "ipv4_addresses", "vrf", "standby", "helper_address", "ip_mtu", "tcp_mss", "encapsulation",
+        "ospf", "isis", "ip_unnumbered_interface"
+    )
+    L2_FIELDS = (
+        "native_vlan", "trunk_encapsulation", "switchport_mode", "trunk_allowed_vlans", "trunk_allowed_vlan_set",
+        "access_vlan", "switchport_nonegotiate", "voice_vlan", "storm_control", "device_tracking_policy"
+    )
+    TUNNEL_FIELDS = (
+        "tunnel_properties",
+    )
+    FIELDS = COMMON_FIELDS + L3_FIELDS + L2_FIELDS + TUNNEL_FIELDS
+
+    __slots__ = FIELDS
+
+    def __init__(self, **kwargs):
+        """
+
+        Args:
+            **kwargs: Values of :attr:`FIELDS`, missing ones are ``None``
+
+        """
+        for field in self.FIELDS:
+            setattr(self, field, kwargs.pop(field, None))
+        if kwargs:
+            raise TypeError("Unexpected fields: {}".format(", ".join(kwargs)))
+
+    @classmethod
+    def from_line(cls, line):
+        """
+        Read snapshot of interface line `line`.
+
+        Args:
+            line (:obj:`BaseInterfaceLine`): Interface line
+
+        Returns:
+            InterfaceSnapshot: Snapshot of the interface
+
+        """
+        line.scan_children()
+        line_class = type(line)
+        values = {"unprocessed_lines": line.get_unprocessed(return_type="text")}
+        fields = [x for x in cls.COMMON_FIELDS if x != "unprocessed_lines"]
+        port_mode = line.port_mode
+        if port_mode == "l3":
+            fields.extend(cls.L3_FIELDS)
+        elif port_mode == "l2":
+            fields.extend(cls.L2_FIELDS)
+        if "tunnel" in line.flags:
+            fields.extend(cls.TUNNEL_FIELDS)
+        for field in fields:
+            if hasattr(line_class, field):
+                values[field] = getattr(line, field)
+        return cls(**values)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, InterfaceSnapshot):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "<InterfaceSnapshot: {} ({})>".format(self.name, self.port_mode)
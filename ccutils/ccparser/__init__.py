@@ -1,4 +1,10 @@
+import glob
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ccutils.utils.common_utils import get_logger
 from ccutils.ccparser.BaseConfigLine import BaseConfigLine
+from ccutils.ccparser.InterfaceSnapshot import InterfaceSnapshot
 from ccutils.ccparser.BaseInterfaceLine import BaseInterfaceLine
 from ccutils.ccparser.BaseConfigParser import BaseConfigParser
 from ccutils.ccparser.ConfigToJson import ConfigToJson
@@ -7,13 +13,14 @@ from ccutils.ccparser.CiscoIosInterfaceLine import CiscoIosInterfaceLine
 from ccutils.ccparser.CiscoIosParser import CiscoIosParser
 
 
-def ConfigParser(config, device_type, verbosity=4):
+def ConfigParser(config, device_type, verbosity=4, **kwargs):
     """
     Factory function for getting Parser object
     Args:
         config:
         device_type:
         verbosity:
+        **kwargs: Passed to the Parser class, such as ``cache_dir``
 
     Returns:
         obj: Instance of proper Parsing class based on device_type
@@ -23,4 +30,72 @@ def ConfigParser(config, device_type, verbosity=4):
     if device_type == "ios":
         parser_class = CiscoIosParser
 
-    return parser_class(config=config, verbosity=verbosity)
\ No newline at end of file
+    return parser_class(config=config, verbosity=verbosity, **kwargs)
+
+
+def _parse_config_file(path, device_type, omit_empty, verbosity, cache_dir=None):
+    """
+    Worker function of :func:`parse_configs`, has to be module-level to be usable by the process pool.
+
+    Returns:
+        tuple: ``(hostname, data)``, falls back to the file name if the hostname is not configured
+
+    """
+    path = pathlib.Path(path)
+    config = ConfigParser(config=path, device_type=device_type, verbosity=verbosity, cache_dir=cache_dir)
+    data = ConfigToJson(config=config, omit_empty=omit_empty, verbosity=verbosity, cache_dir=cache_dir).data
+    return data.get("hostname") or path.stem, data
+
+
+def _get_config_paths(source):
+    if isinstance(source, (list, tuple, set)):
+        return [pathlib.Path(x) for x in source]
+    path = pathlib.Path(source)
+    if path.is_dir():
+        return sorted(x for x in path.iterdir() if x.is_file())
+    if path.is_file():
+        return [path]
+    return sorted(pathlib.Path(x) for x in glob.glob(str(source)) if os.path.isfile(x))
+
+
+def parse_configs(source, device_type="ios", processes=None, omit_empty=False, verbosity=3, cache_dir=None):
+    """
+    Parse multiple config files in parallel and yield their :class:`ConfigToJson` data as the results complete.
+
+    Args:
+        source (:obj:`pathlib.Path` or `str` or `list`): Directory containing config files, glob pattern
+            (such as ``"configs/*.txt"``) or list of paths
+        device_type (:obj:`str`, optional): Device type passed to :func:`ConfigParser`, defaults to ``"ios"``
+        processes (:obj:`int`, optional): Number of worker processes, defaults to number of CPUs. With
+            ``processes=1`` the files are parsed in the current process.
+        omit_empty (:obj:`bool`, optional): Passed to :class:`ConfigToJson`
+        verbosity (:obj:`int`, optional): Logging output level, defaults to 3: Warning
+        cache_dir (:obj:`pathlib.Path` or `str`, optional): Directory of on-disk parse cache shared by the workers,
+            see :class:`ccutils.utils.ParseCache`
+
+    Returns:
+        generator: Yields ``(hostname, data)`` tuples. Files which fail to parse are logged and skipped.
+
+    Example::
+
+        for hostname, data in parse_configs(source="/path/to/configs", processes=8):
+            print(hostname, len(data["interfaces"]))
+
+    """
+    logger = get_logger(name="parse_configs", verbosity=verbosity)
+    paths = _get_config_paths(source)
+    logger.info(msg="Parsing {} config files.".format(len(paths)))
+    if processes == 1:
+        for path in paths:
+            try:
+                yield _parse_config_file(path, device_type, omit_empty, verbosity, cache_dir)
+            except Exception as e:
+                logger.error(msg="Failed to parse config file '{}'. Exception: {}".format(path, repr(e)))
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {executor.submit(_parse_config_file, path, device_type, omit_empty, verbosity, cache_dir): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                logger.error(msg="Failed to parse config file '{}'. Exception: {}".format(futures[future], repr(e)))
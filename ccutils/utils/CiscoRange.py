@@ -1,10 +1,38 @@
-from collections import MutableSequence
+from collections.abc import MutableSequence
+import heapq
 import re
 import sys
 from ccutils.utils.common_utils import get_logger
+from ccutils.utils.InterfaceNameCache import interface_names
 import json
 
 class CiscoRange(MutableSequence):
+    """
+    Range of VLANs or interfaces, such as ``"1,3,4-6"`` or ``"Gi1/0/1-4, Gi1/0/10"``.
+
+    Members are stored as sorted, non-overlapping integer intervals per ``(prefix, slot path)`` key (for example
+    ``("Gi", (1, 0))``), members with channel or subinterface (``Se0/1/0:0``, ``Gi0/1.100``) are stored as
+    individual points. Set operations (``|``, ``&``, ``-``, ``^``), membership, length and compression work on the
+    intervals, strings of the individual members are only created when iterating or indexing the range.
+
+    Members are ordered by length of the slot path, slot path, number, channel and subinterface, so ``Gi0`` comes
+    before ``Po1.2500`` and ``Lo250``, which come before ``Gi0/0/0``. Members differing only by prefix are ordered
+    by the first occurrence of the prefix in the range, so ``"Te1/1/1,Gi1/1/1-2"`` keeps ``Te1/1/1`` first. Runs of
+    members with the same prefix are compressed even when they overlap members of other prefixes (``"Gi1-4,Te2-5"``
+    is compressed to ``["Gi1-4", "Te2-5"]``).
+
+    Examples:
+
+        Example::
+
+            crange = CiscoRange(text="1-10,20")
+            crange.compressed_list
+            # Returns: ["1-10", "20"]
+
+            (crange - CiscoRange(text="2-9")).to_string()
+            # Returns: "1,10,20"
+
+    """
 
     # TODO: Remove
     #PREFIX_REGEX = re.compile(pattern=r"^[A-z]{2,}")
@@ -22,73 +50,317 @@ class CiscoRange(MutableSequence):
     PREFIX_SLOT_REGEX = re.compile(pattern=r"(?P<prefix_slot>^[A-z\-]+(?=\d)(?:\d+/)*)(?P<number>\d+)", flags=re.MULTILINE)
     # PREFIX_SLOT_REGEX = re.compile(pattern=r"(?P<prefix_slot>^[A-z\-]+(?=\d)(?:\d+\/)*(?:\d+\.)?)(?P<number>\d+)", flags=re.MULTILINE)
 
+    # Whole item in one match: prefix, slot path, number or range, channel and subinterface
+    ITEM_REGEX = re.compile(pattern=r"^(?P<prefix>[A-z\-]*)(?P<slots>(?:\d+/)*)(?P<start>\d+)(?:\s*-\s*(?P<stop>\d+))?(?::(?P<channel>\d+))?(?:\.(?P<subint>\d+))?$")
+
 
     def __init__(self, text, verbosity=3):
         super(CiscoRange, self).__init__()
         self.logger = get_logger(name="CiscoRange", verbosity=verbosity)
+        self.verbosity = verbosity
         self.text = text
-        self._list = self.sort_list(data=self.split_to_list(data=self.text))
-        self.compressed_list = self.compress_list(data=self._list)
+        # (prefix, slots): [(start, stop), ...]
+        self._intervals = {}
+        # (prefix, slots, number, channel, subint) of members with channel or subinterface
+        self._points = set()
+        # Whether members have prefix, None while empty
+        self._prefixed = None
+        # prefix: order of its first occurrence, breaks ties of members differing only by prefix
+        self._prefixes = {}
+        self._expanded = None
+        self._compressed = None
+        if text is not None:
+            self._load(members=self._parse_data(data=text))
+
+    @property
+    def compressed_list(self):
+        if self._compressed is None:
+            self._compressed = self._compress()
+        return self._compressed
+
+    @property
+    def _list(self):
+        """
+        Expanded list of members (as strings), cached until the range is modified.
+        """
+        if self._expanded is None:
+            self._expanded = list(self._iter_strings())
+        return self._expanded
 
     def __delitem__(self, index):
-        del self._list[index]
-    
+        values = self._list[index]
+        self.remove(data=values if isinstance(values, list) else [values])
+
     def __getitem__(self, index):
         return self._list[index]
-    
+
     def __len__(self):
-        return len(self._list)
-    
+        return sum(stop - start + 1 for intervals in self._intervals.values() for start, stop in intervals) + len(self._points)
+
     def __setitem__(self, index, value):
-        self._list[index] = value
+        values = self._list[index]
+        self.remove(data=values if isinstance(values, list) else [values])
+        self.add(data=value)
+
+    def __iter__(self):
+        return self._iter_strings()
+
+    def __contains__(self, value):
+        try:
+            members = self._parse_data(data=[value])
+        except (ValueError, NotImplementedError):
+            return False
+        if len(members) != 1:
+            return False
+        prefix, slots, start, stop, channel, subint = members[0]
+        if channel is not None or subint is not None:
+            return (prefix, slots, start, channel, subint) in self._points
+        intervals = self._intervals.get((prefix, slots), [])
+        index = self._find_interval(intervals=intervals, number=start)
+        return index is not None and intervals[index][1] >= stop
 
     def __eq__(self, other):
-        return self._list == other._list
+        if isinstance(other, CiscoRange):
+            return self._intervals == other._intervals and self._points == other._points
+        if isinstance(other, (list, tuple)):
+            return self._list == list(other)
+        return NotImplemented
+
+    __hash__ = None
 
     def __sub__(self, other):
-        return self.sort_list(list(set(self._list) - set(other._list)))
+        return self._combine(other=other, operation=lambda a, b: a and not b)
 
     def __or__(self, other):
-        return self.sort_list(list(set(self._list) | set(other._list)))
+        return self._combine(other=other, operation=lambda a, b: a or b)
+
+    def __and__(self, other):
+        return self._combine(other=other, operation=lambda a, b: a and b)
 
     def __xor__(self, other):
-        return self.sort_list(list(set(self._list) ^ set(other._list)))
+        return self._combine(other=other, operation=lambda a, b: a != b)
 
     def insert(self, index, value):
-        self._list.insert(index, value)
+        """
+        Add `value` to the range. Members are always kept sorted, so `index` is ignored.
+        """
+        self.add(data=value)
 
     def __repr__(self):
         return "<CiscoRange: {}>".format(self.compressed_list)
 
     def add(self, data):
-        data = self.split_to_list(data=data)
-        if self.has_prefix(data=self._list):
-            if not self.has_prefix(data=data):
-                raise ValueError("Cannot merge prefixed and un-prefixed values!")
-        else:
-            if self.has_prefix(data=data):
-                raise ValueError("Cannot merge prefixed and un-prefixed values!")
-        _set = set(self._list)
-        _set.add(tuple(data))
-        self._list = self.sort_list(list(_set))
-        self.compressed_list = self.compress_list(data=self._list)
-    
+        members = self._parse_data(data=data)
+        self._check_merge(members=members)
+        other = CiscoRange(text=None, verbosity=self.verbosity)
+        other._load(members=members)
+        self._update(self._combine(other=other, operation=lambda a, b: a or b))
+
     def remove(self, data):
-        data = self.split_to_list(data=data)
-        if self.has_prefix(data=self._list):
-            if not self.has_prefix(data=data):
-                raise ValueError("Cannot merge prefixed and un-prefixed values!")
-        else:
-            if self.has_prefix(data=data):
-                raise ValueError("Cannot merge prefixed and un-prefixed values!")
-        for element in data:
-            try:
-                self._list.remove(element)
-            except Exception as e:
-                pass
-        self._list = self.sort_list(self._list)
-        self.compressed_list = self.compress_list(data=self._list)
+        members = self._parse_data(data=data)
+        self._check_merge(members=members)
+        other = CiscoRange(text=None, verbosity=self.verbosity)
+        other._load(members=members)
+        self._update(self._combine(other=other, operation=lambda a, b: a and not b))
+
+    def _check_merge(self, members):
+        if self._prefixed is not None and len(members) and any(bool(x[0]) != self._prefixed for x in members):
+            raise ValueError("Cannot merge prefixed and un-prefixed values!")
+
+    def _update(self, other):
+        self._intervals = other._intervals
+        self._points = other._points
+        self._prefixed = other._prefixed
+        self._prefixes = other._prefixes
+        self._expanded = None
+        self._compressed = None
+
+    def _load(self, members):
+        """
+        Add parsed `members` (tuples from :meth:`_parse_item`) to the range.
+        """
+        intervals = {}
+        for prefix, slots, start, stop, channel, subint in members:
+            self._prefixes.setdefault(prefix, len(self._prefixes))
+            if channel is not None or subint is not None:
+                self._points.add((prefix, slots, start, channel, subint))
+            else:
+                intervals.setdefault((prefix, slots), []).append((start, stop))
+        for key, values in intervals.items():
+            self._intervals[key] = self._merge_intervals(intervals=self._intervals.get(key, []) + values)
+        if len(members):
+            self._prefixed = bool(members[0][0])
+        self._expanded = None
+        self._compressed = None
+
+    @staticmethod
+    def _merge_intervals(intervals):
+        """
+        Sort `intervals` and merge the overlapping and adjacent ones.
+        """
+        results = []
+        for start, stop in sorted(intervals):
+            if results and start <= results[-1][1] + 1:
+                if stop > results[-1][1]:
+                    results[-1] = (results[-1][0], stop)
+            else:
+                results.append((start, stop))
+        return results
+
+    @staticmethod
+    def _combine_intervals(a, b, operation):
+        """
+        Apply `operation` (function of membership in `a` and in `b`) to two sorted lists of disjoint intervals,
+        in one pass over their boundaries.
+        """
+        bounds = sorted(set([x[0] for x in a] + [x[1] + 1 for x in a] + [x[0] for x in b] + [x[1] + 1 for x in b]))
+        results = []
+        index_a = index_b = 0
+        start = None
+        for bound in bounds:
+            while index_a < len(a) and a[index_a][1] < bound:
+                index_a += 1
+            while index_b < len(b) and b[index_b][1] < bound:
+                index_b += 1
+            inside = operation(index_a < len(a) and a[index_a][0] <= bound, index_b < len(b) and b[index_b][0] <= bound)
+            if inside and start is None:
+                start = bound
+            elif not inside and start is not None:
+                results.append((start, bound - 1))
+                start = None
+        return results
+
+    @staticmethod
+    def _find_interval(intervals, number):
+        """
+        Return index of the interval containing `number` or ``None``, by binary search.
+        """
+        low, high = 0, len(intervals)
+        while low < high:
+            middle = (low + high) // 2
+            if intervals[middle][1] < number:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(intervals) and intervals[low][0] <= number:
+            return low
+        return None
+
+    def _combine(self, other, operation):
+        if not isinstance(other, CiscoRange):
+            return NotImplemented
+        if self._prefixed is not None and other._prefixed is not None and self._prefixed != other._prefixed:
+            raise ValueError("Cannot merge prefixed and un-prefixed values!")
+        result = CiscoRange(text=None, verbosity=self.verbosity)
+        for prefix in list(self._prefixes) + list(other._prefixes):
+            result._prefixes.setdefault(prefix, len(result._prefixes))
+        for key in set(self._intervals) | set(other._intervals):
+            intervals = self._combine_intervals(a=self._intervals.get(key, []), b=other._intervals.get(key, []), operation=operation)
+            if len(intervals):
+                result._intervals[key] = intervals
+        result._points = set(x for x in self._points | other._points if operation(x in self._points, x in other._points))
+        if len(result._intervals) or len(result._points):
+            result._prefixed = self._prefixed if self._prefixed is not None else other._prefixed
+        return result
+
+    def _sort_key(self, prefix, slots, number, channel=None, subint=None):
+        return (len(slots), slots, number, channel or 0, subint or 0, self._prefixes.get(prefix, 0))
+
+    @staticmethod
+    def _format(prefix, slots, number, channel=None, subint=None):
+        text = "{}{}{}".format(prefix, "".join("{}/".format(x) for x in slots), number)
+        if channel is not None:
+            text += ":{}".format(channel)
+        if subint is not None:
+            text += ".{}".format(subint)
+        return text
+
+    def _iter_members(self):
+        """
+        Yield sort key and member tuple of all members, in order.
+        """
+        def iter_key(key):
+            prefix, slots = key
+            for start, stop in self._intervals[key]:
+                for number in range(start, stop + 1):
+                    yield self._sort_key(prefix, slots, number), (prefix, slots, number, None, None)
+
+        points = sorted((self._sort_key(*x), x) for x in self._points)
+        # On equal keys (such as "Gi2" and "Gi2:0") members without channel come first
+        return heapq.merge(*[iter_key(key) for key in self._intervals], points, key=lambda x: x[0])
+
+    def _iter_strings(self):
+        for _, member in self._iter_members():
+            yield self._format(*member)
+
+    def _compress(self):
+        # Runs (intervals) and points ordered by their first member. Points are output as they come, while
+        # run is output once the next one starts
+        entries = [(self._sort_key(prefix, slots, start), (prefix, slots, start, stop)) for (prefix, slots), intervals in self._intervals.items() for start, stop in intervals]
+        entries.extend((self._sort_key(*x), x) for x in self._points)
+        entries.sort(key=lambda x: x[0])
+        results = []
+        pending = None
+        for _, entry in entries:
+            if len(entry) == 5:
+                results.append(self._format(*entry))
+                continue
+            if pending is not None:
+                results.extend(self._format_run(*pending))
+            pending = entry
+        if pending is not None:
+            results.extend(self._format_run(*pending))
+        return results
 
+    def _format_run(self, prefix, slots, start, stop):
+        if start == stop:
+            return [self._format(prefix, slots, start)]
+        # Cisco VLAN range uses compression (eg. "1-3") only when the difference between start and stop is HIGHER than 1
+        # If difference is EQUAL to 1, each number is separate (eg. "1,2")
+        # Do this only for entries without prefix
+        if stop == start + 1 and prefix == "" and not len(slots):
+            return [str(start), str(stop)]
+        return ["{}-{}".format(self._format(prefix, slots, start), stop)]
+
+    def _parse_item(self, item):
+        """
+        Parse single item of the range (such as ``"Gi1/0/1-4"`` or ``"Se0/1/0:0.10"``).
+
+        Returns:
+            tuple: ``(prefix, slots, start, stop, channel, subint)``
+
+        Raises:
+            ValueError: If the item cannot be parsed
+            NotImplementedError: If the item combines range with channel or subinterface
+
+        """
+        if item[:1].isalpha():
+            # Interface names are shared with parsers, only ranges need to be matched here
+            parsed = interface_names.parse(item)
+            if parsed is not None and parsed.complete:
+                return parsed.type, parsed.path[:-1], parsed.path[-1], parsed.path[-1], parsed.channel, parsed.subint
+        match = self.ITEM_REGEX.match(item)
+        if match is None:
+            self.logger.error("Cannot parse item: {}".format(item))
+            raise ValueError("Cannot parse item: '{}'".format(item))
+        prefix, slots, start, stop, channel, subint = match.group("prefix", "slots", "start", "stop", "channel", "subint")
+        if stop is not None and (channel is not None or subint is not None):
+            self.logger.error("Subinterfaces or channels cannot be combined with ranges. Item: {}".format(item))
+            raise NotImplementedError("Subinterfaces or channels cannot be combined with ranges. Item: {}".format(item))
+        start = int(start)
+        stop = int(stop) if stop is not None else start
+        ERROR = "Given invalid range: '{}'. Start is bigger than stop!".format(item)
+        assert stop >= start, ERROR
+        slots = tuple(int(x) for x in slots.split("/")[:-1])
+        return prefix, slots, start, stop, self.int_or_none(channel), self.int_or_none(subint)
+
+    def _parse_data(self, data):
+        members = [self._parse_item(x) for x in self.split_text(text=data) or [] if x != ""]
+        if any(x[0] for x in members) and not all(x[0] for x in members):
+            self.logger.error(msg="Not all items contain prefixes.")
+            self.logger.error(msg="Found prefix inconsistency in given data.")
+            return []
+        return members
 
     def has_prefix(self, data):
         if isinstance(data, str):
@@ -99,7 +371,7 @@ class CiscoRange(MutableSequence):
             self.logger.error(msg="Unexpected data type given: {}".format(type(data)))
             data = []
         # Check if at least one item contains prefix
-        return bool(len(list(filter(lambda x: re.match(pattern=self.PREFIX_REGEX, string=x), data))))
+        return any(self.PREFIX_REGEX.match(x) for x in data)
 
     def check_prefix(self, data):
         if isinstance(data, str):
@@ -110,26 +382,24 @@ class CiscoRange(MutableSequence):
             self.logger.error(msg="Unexpected data type given: {}".format(type(data)))
             data = []
         # Check if all items have prefix
-        if len(data) == len(list(filter(lambda x: re.match(pattern=self.PREFIX_REGEX, string=x), data))):
+        if all(self.PREFIX_REGEX.match(x) for x in data):
             return True
         else:
             self.logger.error(msg="Not all items contain prefixes.")
             return False
 
     def split_to_list(self, data):
+        """
+        Return list of members of `data` in given order, without duplicates.
+        """
         _list = []
-        raw_list = self.split_text(text=data)
-        self.logger.debug("Raw List: {}".format(raw_list))
-        if self.has_prefix(data=raw_list) and not self.check_prefix(data=data):
-            self.logger.error(msg="Found prefix inconsistency in given data.")
-            self.logger.debug("Returning '{}' for data: '{}'".format(_list, data))
-            return _list
-        for item in raw_list:
-            results = self.split_item(item)
-            for res in results:
-                if res not in _list:
+        seen = set()
+        for item in self._parse_data(data=data):
+            for res in self._expand_item(*item):
+                if res not in seen:
+                    seen.add(res)
                     _list.append(res)
-        self.logger.debug("Returning '{}' for data: '{}'".format(_list, data))
+        self.logger.debug("Returning '%s' for data: '%s'", _list, data)
         return _list
 
 
@@ -146,7 +416,7 @@ class CiscoRange(MutableSequence):
                     else:
                         for subitem in [x.strip() for x in item.strip(",").split(",")]:
                             result.append(subitem)
-            self.logger.debug("Text Instance: List - Returning {} for text: '{}'".format(result, text))
+            self.logger.debug("Text Instance: List - Returning %s for text: '%s'", result, text)
             return result
         elif isinstance(text, str):
             try:
@@ -154,212 +424,27 @@ class CiscoRange(MutableSequence):
             except Exception as e:
                 self.logger.error(msg="{}".format(repr(e)))
             finally:
-                self.logger.debug("Text Instance: String - Returning {} for text: '{}'".format(result, text))
+                self.logger.debug("Text Instance: String - Returning %s for text: '%s'", result, text)
                 return result
         else:
             self.logger.error(msg="Unexpected data type given: {}".format(type(text)))
 
-    def split_item(self, item):
-        self.logger.debug("Working on Item: {}".format(item))
-        prefix_search = re.match(pattern=self.PREFIX_REGEX, string=item)
-        prefix = prefix_search.group(0) if prefix_search else ""
-        self.logger.debug(msg="Prefix: '{}'".format(prefix))
-        suffix_search = self.SUFFIX_REGEX.search(string=item)
-        if suffix_search:
-            suffix = suffix_search.group(0)
-            subint = self.SUBINT_REGEX.search(string=suffix).group("number") if self.SUBINT_REGEX.search(string=suffix) else None
-            channel = self.CHANNEL_REGEX.search(string=suffix).group("number") if self.CHANNEL_REGEX.search(string=suffix) else None
-            int_range = self.RANGE_REGEX.search(string=suffix).group(0) if self.RANGE_REGEX.search(string=suffix) else None
-            if channel and subint:
-                # Cut off channel and subint from suffix
-                cutoff_length = (len(channel) + len(subint) + 2)
-                suffix = suffix[:-cutoff_length]
-            elif channel and (not subint):
-                # Cut off channel from suffix
-                cutoff_length = (len(channel) + 1)
-                suffix = suffix[:-cutoff_length]
-            elif (not channel) and subint:
-                # Cut off subinterface from suffix, +1 for dot
-                cutoff_length = (len(subint) + 1)
-                suffix = suffix[:-cutoff_length]
-            self.logger.debug("Prefix: {} Suffix: {} IntRange: {} Channel: {} SubInt: {}".format(prefix, suffix, int_range, channel, subint))
+    def _expand_item(self, prefix, slots, start, stop, channel, subint):
+        return [self._format(prefix, slots, x, channel, subint) for x in range(start, stop + 1)]
 
-        else:
-            self.logger.error("Suffix regex did not match on item: {}".format(item))
-            suffix = ""
-        self.logger.debug(msg="Suffix: '{}'".format(suffix))
-        # Range and subinterface is not supported
-        if int_range and (channel or subint):
-            self.logger.error("Subinterfaces or channels cannot be combined with ranges. Item: {}".format(item))
-            raise NotImplementedError("Subinterfaces or channels cannot be combined with ranges. Item: {}".format(item))
-        elif int_range:
-            # Range, no Subinterface or Channel
-            base_suffix = suffix[:len(suffix) - len(int_range)]
-            self.logger.debug(msg="Base Suffix: '{}'".format(base_suffix))
-            start = int(int_range.split("-")[0].strip())
-            stop = int(int_range.split("-")[1].strip())
-            ERROR = "Given invalid range: '{}'. Start is bigger than stop!".format(item)
-            assert stop >= start, ERROR
-            number_range = range(start, stop+1)
-            result = ["{}{}{}".format(prefix, base_suffix, x) for x in number_range]
-            self.logger.debug("Result: {}".format(result))
-            return result
-        else:
-            # Channel, Subinterface, no Range
-            if channel and subint:
-                result = ["{}{}:{}.{}".format(prefix, suffix, channel, subint)]
-            # Channel, no Subinterface, no Range
-            elif channel and (not subint):
-                result = ["{}{}:{}".format(prefix, suffix, channel)]
-            # No Channel, Subinterface, no Range
-            elif (not channel) and subint:
-                result = ["{}{}.{}".format(prefix, suffix, subint)]
-            # No Channel, no Subinterface, no Range
-            else:
-                result = ["{}{}".format(prefix, suffix)]
-            self.logger.debug("Result: {}".format(result))
-            return result
+    def split_item(self, item):
+        result = self._expand_item(*self._parse_item(item))
+        self.logger.debug("Result: %s", result)
+        return result
 
     def sort_list(self, data):
-        if self.has_prefix(data=data):
-            results = []
-            temp_list = []
-            # Split item to list of prefixes and suffixes
-            for item in data:
-                try:
-                    prefix = self.PREFIX_REGEX.search(string=item).group(0)
-                except AttributeError as e:
-                    self.logger.error("Item '{}' did not match PREFIX_REGEX".format(item))
-                subint_search = self.SUBINT_REGEX.search(string=item)
-                subint = subint_search.group("number") if subint_search else None
-                channel_search = self.CHANNEL_REGEX.search(string=item)
-                channel = channel_search.group("number") if channel_search else None
-                suffix_list = []
-                cutoff_length = 0
-                if channel and subint:
-                    # Cut off channel and subint from suffix
-                    cutoff_length = (len(channel) + len(subint) + 2)
-                elif channel and (not subint):
-                    # Cut off channel from suffix
-                    cutoff_length = (len(channel) + 1)
-                elif (not channel) and subint:
-                    # Cut off subinterface from suffix, +1 for dot
-                    cutoff_length = (len(subint) + 1)
-
-                if cutoff_length > 0:
-                    suffix_list = [int(x) for x in self.SUFFIX_REGEX.search(string=item).group(0)[:-cutoff_length].split("/")]
-                else:
-                    suffix_list = [int(x) for x in self.SUFFIX_REGEX.search(string=item).group(0).split("/")]
-                temp_entry = {
-                    "item": item,
-                    "prefix": prefix,
-                    "suffix_list": suffix_list,
-                    "channel": self.int_or_none(channel),
-                    "subint": self.int_or_none(subint)
-                }
-                temp_list.append(temp_entry)
-
-            self.logger.debug(msg="TempList: {}".format(temp_list))
-            suffix_lengths = list(set([len(x["suffix_list"]) for x in temp_list]))
-            suffix_lengths.sort()
-            # Get items with same suffix length
-            for suffix_length in suffix_lengths:
-                items = list(filter(lambda x: len(x["suffix_list"]) == suffix_length, temp_list))
-                self.logger.debug(msg="SuffixLength: {}: {}".format(suffix_length, items))
-                # Assign numeric values to items based on suffixes
-                for item in items:
-                    number = 0
-                    reverse_suffix = list(item["suffix_list"])
-                    reverse_suffix.reverse()
-                    for index, value in enumerate(reverse_suffix):
-                        number += int(100*value) * 100**(index+2)
-                    if item["channel"] is not None:
-                        number += item["channel"] * 10e4
-                    if item["subint"] is not None:
-                        number += item["subint"]
-                    item["number"] = number
-                    self.logger.debug("Prefix: {} SuffixList: {}, Channel: {}, SubInt: {}, Value: {} ".format(
-                        item["prefix"], item["suffix_list"], item["channel"], item["subint"], item["number"]))
-                sorted_items = list(items)
-                sorted_items.sort(key=lambda x: x["number"])
-                for item in sorted_items:
-                    results.append(item["item"])
-                self.logger.debug(msg="SortedItems: {}".format(sorted_items))
-
-            self.logger.debug(msg="Results: {}".format(results))
-            return results        
-        else:
-            temp_list = [int(x) for x in data]
-            temp_list.sort()
-            
-            return ["{}".format(x) for x in temp_list]
+        members = [self._parse_item(x) for x in data]
+        # Stable sort, members differing only by prefix keep their order
+        members.sort(key=lambda x: (len(x[1]), x[1], x[2], x[4] or 0, x[5] or 0))
+        return [self._format(prefix, slots, start, channel, subint) for prefix, slots, start, _, channel, subint in members]
 
     def compress_list(self, data):
-        results = []
-        prefix = ""
-        entry = []
-        for index, item in enumerate(data):
-            current_prefix = ""
-            match = re.match(pattern=self.PREFIX_SLOT_REGEX, string=item)
-            if match:
-                current_prefix = match.group("prefix_slot")
-                subint_search = self.SUBINT_REGEX.search(string=item)
-                subint = subint_search.group("number") if subint_search else None
-                channel_search = self.CHANNEL_REGEX.search(string=item)
-                channel = channel_search.group("number") if channel_search else None
-                if (subint is not None) or (channel is not None):
-                    results.append(item)
-                    continue
-                item = int(match.group("number"))
-            else:
-                item = int(item)
-            if not len(entry):
-                self.logger.debug(msg="BEFORE: CurrentPrefix: '{}'; CurrentItem: '{}'; CurrentEntry: '{}'; Prefix: '{}'".format(current_prefix, item, entry, prefix))
-                entry.append(item)
-                prefix = current_prefix
-            elif len(entry) == 1:
-                self.logger.debug(msg="BEFORE: CurrentPrefix: '{}'; CurrentItem: '{}'; CurrentEntry: '{}'; Prefix: '{}'".format(current_prefix, item, entry, prefix))
-                if current_prefix == prefix:
-                    if entry[0] == item-1:
-                        entry.append(item)
-                    else:
-                        results.append("{}{}".format(prefix, *entry))
-                        entry = [item]
-                else:
-                    results.append("{}{}".format(prefix, *entry))
-                    entry = [item]
-                    prefix = current_prefix
-            elif len(entry) == 2:
-                self.logger.debug(msg="BEFORE: CurrentPrefix: '{}'; CurrentItem: '{}'; CurrentEntry: '{}'; Prefix: '{}'".format(current_prefix, item, entry, prefix))
-                if current_prefix == prefix:
-                    if entry[1] == item-1:
-                        # Increase entry[1]
-                        entry[1] += 1
-                    else:
-                        # Cisco VLAN range uses compression (eg. "1-3") only when the difference between start and stop is HIGHER than 1
-                        # If difference is EQUAL to 1, each number is separate (eg. "1,2")
-                        #Do this only for entries without prefix
-                        if (entry[1] == entry[0] + 1) and prefix == "":
-                            results.append("{}".format(entry[0]))
-                            results.append("{}".format(entry[1]))
-                        else:
-                            results.append("{}{}-{}".format(prefix, *entry))
-                        entry = [item]
-                else:
-                    results.append("{}{}-{}".format(prefix, *entry))
-                    entry = [item]
-                    prefix = current_prefix
-        
-        if len(entry) == 1:
-            results.append("{}{}".format(prefix, *entry))
-        elif len(entry) == 2:
-            if (entry[1] == entry[0] + 1) and prefix == "":
-                results.append("{}".format(entry[0]))
-                results.append("{}".format(entry[1]))
-            else:
-                results.append("{}{}-{}".format(prefix, *entry))
-        
-        return results
+        return CiscoRange(text=list(data), verbosity=self.verbosity).compressed_list
 
     @staticmethod
     def int_or_none(item):
@@ -383,10 +468,10 @@ def main():
     text4 = "Fa0, Fa0/3-6, Fa0/1-2, Fa2/3-4 Fa2/0/10-11, Fa1/0/3-4"
     text3 = "1,2,10,15,19,21,22,24,27,30,31,55,58,66,100-102,"
     crange = CiscoRange(text=text)
-    
+
     crange.add("22-24")
     print(crange)
 
 
 if __name__ == "__main__":
-     main()
\ No newline at end of file
+     main()
@@ -2,8 +2,7 @@ import pathlib
 import unicodedata
 import yaml
 import re
-from ccutils.utils.common_utils import get_logger, interface_sort
-from ccutils.utils.CiscoRange import CiscoRange
+from ccutils.utils.common_utils import get_logger, get_interface_sort_key
 from ccutils.utils.CustomAnsibleDumper import CustomAnsibleDumper
 from collections import OrderedDict
 from pprint import pprint
@@ -129,8 +128,7 @@ class ExcelInventory(object):
             raise HostDoesNotExist(msg)
         if "interfaces" not in self.host_vars[host].keys():
             return OrderedDict()
-        interfaces_crange = CiscoRange(list(self.host_vars[host]["interfaces"].keys()))
-        ordered_interfaces = OrderedDict(sorted(self.host_vars[host]["interfaces"].items(), key=lambda x: interface_sort(crange=interfaces_crange, name=x[0])))
+        ordered_interfaces = OrderedDict(sorted(self.host_vars[host]["interfaces"].items(), key=lambda x: get_interface_sort_key(x[0])))
         return ordered_interfaces
 
     def dump_hosts(self, outputfile):
@@ -0,0 +1,196 @@
+import re
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+
+SHORT_INTERFACE_TYPES = [
+    "Eth", "Et", "Se", "Fa", "Gi", "Te", "Twe", "Fo", "Hu", "Po", "Tu", "Vl", "Lo", "pw"
+]
+LONG_INTERFACE_TYPES = [
+    "Ethernet", "Ethernet", "Serial", "FastEthernet", "GigabitEthernet",
+    "TenGigabitEthernet", "TwentyFiveGigE", "FortyGigabitEthernet", "HundredGigE", "Port-channel", "Tunnel",
+    "Vlan", "Loopback", "pseudowire"
+]
+# First occurrence wins, same as list.index()
+SHORT_TO_LONG = {}
+LONG_TO_SHORT = {}
+for _short, _long in zip(SHORT_INTERFACE_TYPES, LONG_INTERFACE_TYPES):
+    SHORT_TO_LONG.setdefault(_short, _long)
+    LONG_TO_SHORT.setdefault(_long, _short)
+
+
+class InterfaceName(namedtuple("InterfaceName", ["name", "type", "number", "path", "channel", "subint"])):
+    """
+    Interface name split to its parts, for example ``Serial0/1/0:0.20`` is
+    ``InterfaceName(name="Serial0/1/0:0.20", type="Serial", number="0/1/0:0.20", path=(0, 1, 0), channel=0, subint=20)``.
+
+    Strings are interned, so names of the same interface of many configs share one object.
+    """
+
+    __slots__ = ()
+
+    @property
+    def complete(self):
+        """
+        ``False`` if the name contains text after the number (which is not part of the type and number)
+        """
+        return len(self.type) + len(self.number) == len(self.name)
+
+    @property
+    def long_type(self):
+        if self.type in SHORT_TO_LONG:
+            return SHORT_TO_LONG[self.type]
+        return self.type
+
+    @property
+    def short_type(self):
+        if self.type in SHORT_TO_LONG:
+            return self.type
+        return LONG_TO_SHORT.get(self.type, self.type)
+
+    @property
+    def long_name(self):
+        return self.long_type + self.number
+
+    @property
+    def short_name(self):
+        return self.short_type + self.number
+
+    @property
+    def sort_key(self):
+        """
+        Key ordering interfaces by length of the slot path, slot path, number, channel and subinterface, see
+        :func:`ccutils.utils.common_utils.get_interface_sort_key`
+        """
+        return (len(self.path) - 1, self.path[:-1], self.path[-1], self.channel or 0, self.subint or 0)
+
+
+class InterfaceNameCache(object):
+    """
+    Parser of interface names, keeping the results of recently parsed names in a bounded LRU cache.
+
+    Each name is split to :class:`InterfaceName` by one regex match, repeated lookups of the same name (which is
+    common across configs of many devices) return the same object. Used by :func:`split_interface_name`,
+    :func:`convert_interface_name` and :func:`get_interface_sort_key` of :mod:`ccutils.utils.common_utils`,
+    ``flags`` of interface lines and :class:`ccutils.utils.CiscoRange`. Shared instance is
+    ``ccutils.utils.interface_names``.
+
+    Examples:
+
+        Example::
+
+            from ccutils.utils import interface_names
+
+            interface_names.parse("Gi1/0/1.100")
+            # Returns: InterfaceName(name="Gi1/0/1.100", type="Gi", number="1/0/1.100", path=(1, 0, 1), channel=None, subint=100)
+
+            interface_names.convert("Gi1/0/1.100", out="long")
+            # Returns: "GigabitEthernet1/0/1.100"
+
+    """
+
+    INTERFACE_NAME_REGEX = re.compile(pattern=r"(?P<type>[A-z]{2,}(?:[A-z\-])*)(?P<number>(?P<path>\d+(?:\/\d+)*)(?:\:(?P<channel>\d+))?(?:\.(?P<subint>\d+))?)")
+
+    def __init__(self, max_size=4096):
+        """
+
+        Args:
+            max_size (:obj:`int`, optional): Maximum number of names kept in the cache, defaults to 4096
+
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _parse(self, name):
+        match = self.INTERFACE_NAME_REGEX.match(name)
+        if match is None:
+            return None
+        type_, number, path, channel, subint = match.group("type", "number", "path", "channel", "subint")
+        return InterfaceName(
+            name=sys.intern(name),
+            type=sys.intern(type_),
+            number=sys.intern(number),
+            path=tuple(int(x) for x in path.split("/")),
+            channel=int(channel) if channel is not None else None,
+            subint=int(subint) if subint is not None else None
+        )
+
+    def parse(self, name):
+        """
+        Return `name` split to :class:`InterfaceName`, from the cache if possible.
+
+        Args:
+            name (str): Interface name, such as ``"GigabitEthernet1/0/1"``
+
+        Returns:
+            InterfaceName: Parsed name or ``None`` if `name` is not a string or not a valid interface name
+
+        """
+        if not isinstance(name, str):
+            return None
+        with self._lock:
+            if name in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(name)
+                return self._cache[name]
+            self.misses += 1
+        result = self._parse(name)
+        with self._lock:
+            self._cache[name] = result
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def convert(self, name, out="long"):
+        """
+        Convert `name` to long (``GigabitEthernet1/0/1``) or short (``Gi1/0/1``) form. Names of unknown types are
+        returned unchanged.
+
+        Args:
+            name (str): Interface name
+            out (:obj:`str`, optional): ``"long"`` or ``"short"``
+
+        Returns:
+            str: Converted name
+
+        """
+        parsed = self.parse(name)
+        if parsed is None:
+            return name
+        if out == "long" and parsed.type in SHORT_TO_LONG:
+            return SHORT_TO_LONG[parsed.type] + parsed.number
+        if out == "short" and parsed.type in LONG_TO_SHORT and parsed.type not in SHORT_TO_LONG:
+            return LONG_TO_SHORT[parsed.type] + parsed.number
+        return name
+
+    def cache_info(self):
+        """
+        Return statistics of the cache.
+
+        Returns:
+            dict: Dictionary with keys ``hits``, ``misses``, ``size`` and ``max_size``
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.max_size
+        }
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self):
+        return "<InterfaceNameCache cached={}>".format(len(self._cache))
+
+
+#: Cache shared by parsers, config lines and CiscoRange
+interface_names = InterfaceNameCache()
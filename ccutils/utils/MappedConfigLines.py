@@ -0,0 +1,122 @@
+import mmap
+import re
+from array import array
+from collections.abc import Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class MappedConfigLines(Sequence):
+    """
+    Read-only view of (non-empty) lines of a config file, backed by memory-mapped file.
+
+    Only start and end offsets of the lines are kept in memory (as ``array``), text of a line is decoded each time
+    it is accessed. Lines can be replaced by assigning new text, replaced lines are stored in memory, while
+    assigning the text the line already has is a no-op. Lines are split on ``\\n``, ``\\r\\n`` and ``\\r``, same as
+    :meth:`pathlib.Path.read_text` with universal newlines does.
+
+    Examples:
+
+        Example::
+
+            lines = MappedConfigLines(path="/path/to/config_file.txt")
+            print(len(lines), lines[0])
+
+    """
+
+    _line_regex = re.compile(pattern=rb"( *)[^\r\n]*")
+    # Bytes which might be whitespace removed by str.strip(), non-ASCII bytes are included as they could be part
+    # of encoded unicode whitespace
+    _whitespace_bytes = bytes(int(chr(x).isspace() or x > 127) for x in range(256))
+
+    def __init__(self, path, encoding="utf-8"):
+        """
+
+        Args:
+            path (:obj:`pathlib.Path` or `str`): Path to config file
+            encoding (:obj:`str`, optional): Encoding of the config file, defaults to ``utf-8``
+
+        """
+        self.path = path
+        self.encoding = encoding
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self._mmap = b""
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._indents = array("H")
+        for m in self._line_regex.finditer(self._mmap):
+            # Empty lines are skipped
+            if m.end() == m.start():
+                continue
+            self._starts.append(m.start())
+            self._ends.append(m.end())
+            self._indents.append(m.end(1) - m.start())
+        # Line number: text, for replaced lines
+        self._overrides = {}
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index in self._overrides:
+            return self._overrides[index]
+        return self._mmap[self._starts[index]:self._ends[index]].decode(self.encoding)
+
+    def __setitem__(self, index, text):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MappedConfigLines assignment index out of range")
+        if index not in self._overrides and self._mmap[self._starts[index]:self._ends[index]] == text.encode(self.encoding):
+            return
+        self._overrides[index] = text
+
+    def get_indents(self):
+        """
+        Return number of leading spaces of the lines, as found in the file (ignoring replaced lines).
+
+        Returns:
+            array: ``array("H")`` of indents
+
+        """
+        return self._indents
+
+    def get_unstripped(self):
+        """
+        Return numbers of the lines which might contain whitespace other than indentation, which would be removed by
+        ``str.strip()`` (as found in the file, ignoring replaced lines). Only the first character after the indent
+        and the last character of each line are checked.
+
+        Returns:
+            list: Sorted list of line numbers
+
+        """
+        if not len(self):
+            return []
+        if numpy is not None:
+            data = numpy.frombuffer(self._mmap, dtype=numpy.uint8)
+            whitespace = numpy.frombuffer(self._whitespace_bytes, dtype=numpy.uint8)
+            starts = numpy.array(self._starts, dtype=numpy.int64)
+            ends = numpy.array(self._ends, dtype=numpy.int64)
+            firsts = numpy.minimum(starts + numpy.array(self._indents, dtype=numpy.int64), ends - 1)
+            return numpy.flatnonzero(whitespace[data[firsts]] | whitespace[data[ends - 1]]).tolist()
+        whitespace = self._whitespace_bytes
+        data = self._mmap
+        return [
+            number for number, (start, end, indent) in enumerate(zip(self._starts, self._ends, self._indents))
+            if whitespace[data[min(start + indent, end - 1)]] or whitespace[data[end - 1]]
+        ]
+
+    def __repr__(self):
+        return "<MappedConfigLines path='{}' lines={} replaced={}>".format(self.path, len(self), len(self._overrides))
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import time
+from ccutils.utils.common_utils import get_logger
+
+
+class ParseCache(object):
+    """
+    On-disk cache of parsing results, keyed by hash of the config text, ccutils version and :attr:`FORMAT_VERSION`.
+
+    Entries are written atomically (to a temporary file which is then renamed), so the cache directory can be shared
+    by multiple concurrent processes. Once the total size of the entries exceeds `max_size`, least recently used
+    entries are removed.
+
+    Note: Entries are stored using ``pickle``, only point the cache to a directory you trust.
+    """
+
+    # Version of the cached results. Increase it with every change of the parsed lines or ConfigToJson output
+    # (which does not always come with new ccutils version), so that entries created before are not used.
+    FORMAT_VERSION = 2
+    SUFFIX = ".pickle"
+    TMP_SUFFIX = ".tmp"
+    # Temporary files older than this (in seconds) were left behind by crashed writers
+    TMP_MAX_AGE = 3600
+
+    def __init__(self, cache_dir, max_size=256 * 1024 * 1024, verbosity=3):
+        """
+
+        Args:
+            cache_dir (:obj:`pathlib.Path` or `str`): Path to cache directory, created if it does not exist
+            max_size (:obj:`int`, optional): Maximum total size of cache entries in bytes, defaults to 256 MiB
+            verbosity (:obj:`int`, optional): Logging output level, defaults to 3: Warning
+
+        """
+        self.logger = get_logger(name="ParseCache", verbosity=verbosity)
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @classmethod
+    def get_key(cls, text, namespace=""):
+        """
+        Return cache key for given text.
+
+        Args:
+            text (str): Config text
+            namespace (:obj:`str`, optional): Distinguishes different kinds of entries for the same text, such as
+                name of the class which produced them
+
+        Returns:
+            str: Hex digest of the key
+
+        """
+        import ccutils
+        key = hashlib.sha256()
+        for part in [ccutils.__version__, str(cls.FORMAT_VERSION), namespace, text]:
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def _get_path(self, key):
+        return self.cache_dir.joinpath(key + self.SUFFIX)
+
+    def get(self, key):
+        """
+        Return cached entry, or ``None`` on cache miss.
+
+        Args:
+            key (str): Cache key, see :meth:`get_key`
+
+        Returns:
+            Cached object or ``None``
+
+        """
+        path = self._get_path(key)
+        try:
+            with path.open(mode="rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.logger.debug(msg="Cache miss: {}".format(key))
+            return None
+        except Exception as e:
+            self.logger.warning(msg="Removing invalid cache entry '{}'. Exception: {}".format(path, repr(e)))
+            self._remove(path)
+            return None
+        try:
+            # Mark entry as recently used
+            os.utime(str(path))
+        except OSError:
+            pass
+        self.logger.debug(msg="Cache hit: {}".format(key))
+        return entry
+
+    def set(self, key, entry):
+        """
+        Store entry in the cache and evict least recently used entries if the cache is over `max_size`.
+
+        Args:
+            key (str): Cache key, see :meth:`get_key`
+            entry: Any picklable object
+
+        Returns:
+            None
+
+        """
+        fd, tmp_path = tempfile.mkstemp(prefix="." + key, suffix=self.TMP_SUFFIX, dir=str(self.cache_dir))
+        try:
+            with os.fdopen(fd, mode="wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, str(self._get_path(key)))
+        except Exception as e:
+            self.logger.error(msg="Failed to write cache entry {}. Exception: {}".format(key, repr(e)))
+            self._remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the total size of the cache is within `max_size`.
+
+        Returns:
+            None
+
+        """
+        entries = []
+        total_size = 0
+        now = time.time()
+        for dir_entry in os.scandir(str(self.cache_dir)):
+            try:
+                stat = dir_entry.stat()
+            except FileNotFoundError:
+                # Removed by other process in the meantime
+                continue
+            if dir_entry.name.endswith(self.TMP_SUFFIX):
+                if now - stat.st_mtime > self.TMP_MAX_AGE:
+                    self._remove(dir_entry.path)
+                continue
+            if dir_entry.name.endswith(self.SUFFIX):
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                total_size += stat.st_size
+        for mtime, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.logger.debug(msg="Evicting cache entry: {}".format(path))
+            self._remove(path)
+            total_size -= size
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+
+        Returns:
+            None
+
+        """
+        for path in self.cache_dir.glob("*" + self.SUFFIX):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(str(path))
+        except OSError:
+            pass
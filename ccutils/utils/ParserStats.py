@@ -0,0 +1,198 @@
+import timeit
+import contextlib
+import threading
+
+
+class ParserStats(object):
+    """
+    Instrumentation of a parser: stage timings, regex evaluation counts per pattern, cached property hits and misses
+    and compute times of cached properties. Every :class:`ccutils.ccparser.BaseConfigParser` has one as ``stats``,
+    enabled by ``BaseConfigParser(..., stats=True)`` (or by passing ``stats_hook``).
+
+    Recorded are:
+
+    - ``stages`` - time of parsing stages (``read``, ``fix_indents``, ``create_cfg_line_objects``,
+      ``load_cache_entry``, ``update``) and of :class:`ccutils.ccparser.ConfigToJson` sections
+      (``config_to_json.interfaces``, ``config_to_json.common``)
+    - ``regexes`` - number of lines each pattern was evaluated against by ``find_objects``, ``re_search``,
+      ``re_match`` and ``re_search_children`` (lines skipped by literal prefilters are not counted)
+    - ``cache`` - hits and misses of cached properties and of the on-disk parse cache
+    - ``properties`` - number of computations and total time of cached properties, as ``Class.property``. Times
+      are inclusive, they contain the time of other properties computed along the way.
+
+    The optional `hook` is called as ``hook(event, name, value)`` for each recorded stage (``"stage"``, name, seconds)
+    and property computation (``"property"``, name, seconds), and with ``("summary", None, stats.to_dict())`` by
+    :meth:`export`, which can be used to push the data to a metrics system.
+
+    Examples:
+
+        Example::
+
+            config = ConfigParser(config=path, device_type="ios", stats=True)
+            ConfigToJson(config=config)
+            print(config.stats.get_top_properties(n=5))
+            # Returns: [("CiscoIosInterfaceLine.standby", {"count": 120, "time": 0.0213}), ...]
+
+    """
+
+    #: ``True`` while any instance is enabled, checked by cached properties before looking up the stats of the
+    #: instance
+    active = False
+    # Number of enabled instances
+    _enabled_count = 0
+    _lock = threading.RLock()
+
+    def __init__(self, enabled=True, hook=None):
+        """
+
+        Args:
+            enabled (:obj:`bool`, optional): Record the stats, defaults to ``True``
+            hook (:obj:`callable`, optional): Function called as ``hook(event, name, value)``, see above
+
+        """
+        self.hook = hook
+        # PropertyProfiler receiving regex counts, see BaseConfigParser(..., profile=True)
+        self.profiler = None
+        self.enabled = False
+        self.stages = {}
+        self.regexes = {}
+        self.cache = {}
+        self.properties = {}
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        with self._lock:
+            if not self.enabled:
+                self.enabled = True
+                ParserStats._enabled_count += 1
+                ParserStats.active = True
+
+    def disable(self):
+        with self._lock:
+            if self.enabled:
+                self.enabled = False
+                ParserStats._enabled_count -= 1
+                ParserStats.active = ParserStats._enabled_count > 0
+
+    def __del__(self):
+        # Stats of garbage collected parsers no longer keep the cached properties on the stats path
+        if getattr(self, "enabled", False):
+            self.disable()
+
+    def reset(self):
+        """
+        Remove all recorded data.
+
+        Returns:
+            None
+
+        """
+        self.stages = {}
+        self.regexes = {}
+        self.cache = {}
+        self.properties = {}
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        """
+        Context manager recording time of the block as `stage` (if enabled).
+
+        Args:
+            stage (str): Name of the stage
+
+        """
+        if not self.enabled:
+            yield
+            return
+        start = timeit.default_timer()
+        try:
+            yield
+        finally:
+            self.record_stage(name=stage, seconds=timeit.default_timer() - start)
+
+    @staticmethod
+    def _add(table, name, seconds):
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = {"count": 0, "time": 0.0}
+        entry["count"] += 1
+        entry["time"] += seconds
+
+    def record_stage(self, name, seconds):
+        self._add(table=self.stages, name=name, seconds=seconds)
+        if self.hook is not None:
+            self.hook("stage", name, seconds)
+
+    def record_property(self, name, seconds):
+        self._add(table=self.properties, name=name, seconds=seconds)
+        if self.hook is not None:
+            self.hook("property", name, seconds)
+
+    def count_regex(self, pattern, count=1):
+        """
+        Add `count` evaluations of `pattern` (compiled pattern or string).
+        """
+        key = getattr(pattern, "pattern", pattern)
+        self.regexes[key] = self.regexes.get(key, 0) + count
+        if self.profiler is not None:
+            self.profiler.count_regex(pattern=key, count=count)
+
+    def record_cache(self, name, hit):
+        """
+        Record hit (or miss) of cache `name` (such as ``"properties"`` or ``"parse_cache"``).
+        """
+        entry = self.cache.get(name)
+        if entry is None:
+            entry = self.cache[name] = {"hits": 0, "misses": 0}
+        entry["hits" if hit else "misses"] += 1
+
+    def get_top_properties(self, n=10):
+        """
+        Return `n` properties with the largest total compute time.
+
+        Returns:
+            list: List of ``(name, {"count": int, "time": float})``
+
+        """
+        return sorted(self.properties.items(), key=lambda x: -x[1]["time"])[:n]
+
+    def get_top_regexes(self, n=10):
+        """
+        Return `n` most evaluated patterns.
+
+        Returns:
+            list: List of ``(pattern, count)``
+
+        """
+        return sorted(self.regexes.items(), key=lambda x: -x[1])[:n]
+
+    def to_dict(self):
+        """
+        Return copy of recorded data as JSON-serializable dictionary.
+
+        Returns:
+            dict: Dictionary with keys ``stages``, ``regexes``, ``cache`` and ``properties``
+
+        """
+        return {
+            "stages": {k: dict(v) for k, v in self.stages.items()},
+            "regexes": {str(k): v for k, v in self.regexes.items()},
+            "cache": {k: dict(v) for k, v in self.cache.items()},
+            "properties": {k: dict(v) for k, v in self.properties.items()}
+        }
+
+    def export(self):
+        """
+        Pass :meth:`to_dict` to the hook (if set).
+
+        Returns:
+            dict: Recorded data
+        """
+        data = self.to_dict()
+        if self.hook is not None:
+            self.hook("summary", None, data)
+        return data
+
+    def __repr__(self):
+        return "<ParserStats enabled={} stages={} regexes={} properties={}>".format(self.enabled, len(self.stages), len(self.regexes), len(self.properties))
@@ -0,0 +1,140 @@
+import functools
+import re
+from ccutils.utils.common_utils import get_query_plan
+
+
+class PatternSet(object):
+    """
+    Set of patterns evaluated against a (single line) text in one scan.
+
+    Patterns are merged into a single regex, in which each pattern is an optional lookahead with a tagged group,
+    so all the patterns are searched from the beginning of the text independently of each other (same as running
+    ``pattern.search(text)`` for each of them) and named groups of each pattern are renamed to avoid collisions.
+    Patterns which cannot be merged (using numbered backreferences, global inline flags, ``re.ASCII``, ...) are
+    searched separately.
+
+    Examples:
+
+        Example::
+
+            pattern_set = PatternSet.get(patterns=(
+                re.compile(r"^ntp server(?: vrf \\S+)? (?P<server>\\S+)"),
+                re.compile(r"vrf (?P<vrf>\\S+)"),
+                re.compile(r"key (?P<key>\\d+)")
+            ))
+            print(pattern_set.search("ntp server vrf MGMT 10.0.0.1 key 1"))
+            # Returns: [(0, {"server": "10.0.0.1"}), (1, {"vrf": "MGMT"}), (2, {"key": "1"})]
+
+    """
+
+    # Flags which can be applied to a part of the regex, see _get_source
+    SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+    _group_name_regex = re.compile(pattern=r"\(\?P(?P<kind>[<=])(?P<name>\w+)(?P<end>[>)])")
+    _unsupported_regex = re.compile(pattern=r"^\(\?[aiLmsux]+\)|\\[1-9]|\(\?\(")
+
+    def __init__(self, patterns):
+        """
+
+        Args:
+            patterns (:obj:`list`): List of compiled patterns (``str`` patterns are compiled without flags)
+
+        """
+        self.patterns = tuple(x if not isinstance(x, str) else re.compile(pattern=x) for x in patterns)
+        # [(index of pattern, tag group, [(original group name, renamed group)])]
+        self._groups = []
+        self._separate = []
+        parts = []
+        for index, pattern in enumerate(self.patterns):
+            source = self._get_source(index=index, pattern=pattern)
+            if source is None:
+                self._separate.append(index)
+            else:
+                parts.append(source)
+        self._regex = re.compile(pattern="".join(parts)) if parts else None
+        # Replace group names with numbers in the merged regex, so that results can be read from match.regs and
+        # match.groups() directly
+        if self._regex is not None:
+            groupindex = self._regex.groupindex
+            self._groups = [
+                (index, groupindex[tag], [(name, groupindex[renamed]) for name, renamed in groups])
+                for index, tag, groups in self._groups
+            ]
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def get(cls, patterns):
+        """
+        Return (cached) PatternSet for given tuple of `patterns`.
+
+        Args:
+            patterns (:obj:`tuple`): Tuple of compiled patterns
+
+        Returns:
+            PatternSet: Pattern set
+
+        """
+        return cls(patterns=patterns)
+
+    def _get_source(self, index, pattern):
+        """
+        Return source of `pattern` to be merged into the single regex, or ``None`` if it needs to be searched
+        separately.
+        """
+        if not isinstance(pattern.pattern, str) or self._unsupported_regex.search(pattern.pattern):
+            return None
+        flags = ""
+        for flag, letter in self.SCOPED_FLAGS.items():
+            if pattern.flags & flag:
+                flags += letter
+        if pattern.flags & (re.ASCII | re.LOCALE):
+            return None
+        groups = [(name, "_{}_{}".format(index, name)) for name in pattern.groupindex.keys()]
+        body = self._group_name_regex.sub(lambda m: "(?P{}_{}_{}{}".format(m.group("kind"), index, m.group("name"), m.group("end")), pattern.pattern)
+        if flags:
+            body = "(?{}:{})".format(flags, body)
+        # Patterns anchored to the beginning can only match at position 0 of a single line
+        lead = "" if get_query_plan(pattern).prefix is not None else "(?s:.*?)"
+        source = "(?:(?={}(?P<_{}>{})))?".format(lead, index, body)
+        try:
+            compiled = re.compile(pattern=source)
+        except re.error:
+            return None
+        tag = "_{}".format(index)
+        if set(compiled.groupindex.keys()) != set([x[1] for x in groups] + [tag]):
+            return None
+        self._groups.append((index, tag, groups))
+        return source
+
+    def search(self, text):
+        """
+        Search `text` for all the patterns.
+
+        Args:
+            text (str): Text to search (single line)
+
+        Returns:
+            list: List of ``(index of pattern, dictionary of named groups)`` for each pattern which matched, sorted
+            by index
+
+        """
+        results = []
+        if self._regex is not None:
+            m = self._regex.match(text)
+            spans = m.regs
+            values = None
+            for index, tag, groups in self._groups:
+                if spans[tag][0] != -1:
+                    if values is None:
+                        values = m.groups()
+                    results.append((index, {name: values[number - 1] for name, number in groups}))
+        for index in self._separate:
+            m = self.patterns[index].search(text)
+            if m:
+                results.append((index, m.groupdict()))
+        if self._separate:
+            results.sort(key=lambda x: x[0])
+        return results
+
+    def __repr__(self):
+        return "<PatternSet patterns={} separate={}>".format(len(self.patterns), len(self._separate))
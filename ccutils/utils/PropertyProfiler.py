@@ -0,0 +1,289 @@
+import functools
+import threading
+from timeit import default_timer
+
+
+def _get_class_attribute(target, name, inherited=False):
+    """
+    Return attribute `name` of class `target` (or its bases, only bases if `inherited`) without invoking descriptors.
+    """
+    for klass in target.__mro__[1:] if inherited else target.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    return None
+
+
+def get_profiler(obj):
+    """
+    Return :class:`PropertyProfiler` of a parser, or of the parser of a config line or :class:`ConfigToJson`, or
+    ``None``.
+    """
+    profiler = getattr(obj, "profiler", None)
+    if profiler is None:
+        profiler = getattr(getattr(obj, "config", None), "profiler", None)
+    return profiler if isinstance(profiler, PropertyProfiler) else None
+
+
+def profiled(func, name=None):
+    """
+    Decorator recording calls of `func` to the profiler of the instance (see :func:`get_profiler`). Without profiler
+    the function is called directly.
+
+    Args:
+        func: Function (method or property getter) to wrap
+        name (:obj:`str`, optional): Name used in the report, defaults to qualified name of `func`
+
+    Returns:
+        function: Wrapped function
+
+    """
+    name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profiler = get_profiler(self)
+        if profiler is None:
+            return func(self, *args, **kwargs)
+        profiler.enter(name)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            profiler.exit()
+    wrapper.__profiled__ = func
+    return wrapper
+
+
+class PropertyProfiler(object):
+    """
+    Profiler of properties (and selected methods) of parser classes, enabled per parser instance by
+    ``BaseConfigParser(..., profile=True)``, so that a single slow config can be diagnosed without profiling the whole
+    process.
+
+    For each property it records number of calls (including those served from cache), cumulative time (including
+    nested properties), own time (excluding them) and patterns the property evaluated, with the number of lines they
+    were evaluated against. Own times are also aggregated per call stack, which can be saved in the collapsed stack
+    format of flamegraph tools by :meth:`save_collapsed`.
+
+    Properties are wrapped at class level by :meth:`attach` when the first profiled parser of the class is
+    created. This affects the whole process: while any profiled parser exists, all instances of its classes (and
+    :class:`ConfigToJson`) go through the wrappers, instances without profiler only pay for looking the profiler up.
+    The original properties are restored once all the profilers attached to the class are detached, which happens
+    when their parsers are garbage collected, by :meth:`detach` or at the end of ``with parser.profiler:`` block.
+
+    Examples:
+
+        Example::
+
+            config = ConfigParser(config=path, device_type="ios", profile=True)
+            ConfigToJson(config=config)
+            print(config.profiler.format_report(sort_by="own_time", n=10))
+            config.profiler.save_collapsed("config.folded")
+            # flamegraph.pl config.folded > config.svg
+
+    """
+
+    SORT_KEYS = ("time", "own_time", "calls", "regexes")
+
+    # Number of attached profilers per instrumented class
+    _attached = {}
+    _attach_lock = threading.Lock()
+
+    def __init__(self):
+        # Name: {"calls": int, "time": float, "own_time": float, "regexes": {pattern: count}}
+        self.entries = {}
+        # "outer;inner": own time
+        self.stacks = {}
+        # Frames of the properties being computed, as [name, start, time of nested calls]
+        self._stack = []
+        # Classes instrumented by attach()
+        self._targets = []
+
+    @classmethod
+    def instrument(cls, target, methods=(), exclude=("logger", )):
+        """
+        Wrap all public properties of class `target` (including inherited ones) and given `methods` by
+        :func:`profiled`. Already wrapped attributes are skipped.
+
+        Args:
+            target (type): Class to instrument
+            methods (:obj:`tuple`, optional): Names of methods to wrap as well
+            exclude (:obj:`tuple`, optional): Names of properties not to wrap
+
+        Returns:
+            None
+
+        """
+        for name in dir(target):
+            if name.startswith("_") or name in exclude:
+                continue
+            value = _get_class_attribute(target, name)
+            if isinstance(value, property) and value.fget is not None and not hasattr(value.fget, "__profiled__"):
+                setattr(target, name, property(profiled(value.fget, name="{}.{}".format(target.__name__, name)), value.fset, value.fdel, value.__doc__))
+            elif name in methods and callable(value) and not hasattr(value, "__profiled__"):
+                setattr(target, name, profiled(value, name="{}.{}".format(target.__name__, name)))
+
+    @classmethod
+    def uninstrument(cls, target):
+        """
+        Restore attributes of class `target` wrapped by :meth:`instrument`.
+
+        Returns:
+            None
+        """
+        for name, value in list(vars(target).items()):
+            if isinstance(value, property) and hasattr(value.fget, "__profiled__"):
+                original = value.fget.__profiled__
+                inherited = _get_class_attribute(target, name, inherited=True)
+                if isinstance(inherited, property) and inherited.fget is original:
+                    # Wrapper of inherited property, the base class has the original
+                    delattr(target, name)
+                else:
+                    setattr(target, name, property(original, value.fset, value.fdel, value.__doc__))
+            elif hasattr(value, "__profiled__"):
+                if _get_class_attribute(target, name, inherited=True) is value.__profiled__:
+                    delattr(target, name)
+                else:
+                    setattr(target, name, value.__profiled__)
+
+    def attach(self, target, methods=()):
+        """
+        Instrument class `target` (see :meth:`instrument`) until this profiler is detached. Class stays
+        instrumented while at least one profiler is attached to it.
+
+        Args:
+            target (type): Class to instrument
+            methods (:obj:`tuple`, optional): Names of methods to wrap as well
+
+        Returns:
+            None
+
+        """
+        with self._attach_lock:
+            if target in self._targets:
+                return
+            self.instrument(target=target, methods=methods)
+            self._targets.append(target)
+            self._attached[target] = self._attached.get(target, 0) + 1
+
+    def detach(self):
+        """
+        Detach the profiler from all the classes it was attached to, restoring original properties of the classes
+        no other profiler is attached to. Calls made after that are not recorded.
+
+        Returns:
+            None
+        """
+        with self._attach_lock:
+            for target in self._targets:
+                count = self._attached.get(target, 0) - 1
+                if count > 0:
+                    self._attached[target] = count
+                else:
+                    self._attached.pop(target, None)
+                    self.uninstrument(target=target)
+            self._targets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.detach()
+
+    def enter(self, name):
+        self._stack.append([name, default_timer(), 0.0])
+
+    def exit(self):
+        name, start, nested = self._stack.pop()
+        elapsed = default_timer() - start
+        entry = self._get_entry(name)
+        entry["calls"] += 1
+        own = elapsed - nested
+        entry["own_time"] += own
+        # Recursive calls are counted once in the cumulative time
+        if not any(frame[0] == name for frame in self._stack):
+            entry["time"] += elapsed
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        key = ";".join([frame[0] for frame in self._stack] + [name])
+        self.stacks[key] = self.stacks.get(key, 0.0) + own
+
+    def _get_entry(self, name):
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = {"calls": 0, "time": 0.0, "own_time": 0.0, "regexes": {}}
+        return entry
+
+    def count_regex(self, pattern, count=1):
+        """
+        Add `count` evaluations of `pattern` (string) to the property being computed.
+        """
+        if self._stack:
+            regexes = self._get_entry(self._stack[-1][0])["regexes"]
+            regexes[pattern] = regexes.get(pattern, 0) + count
+
+    def reset(self):
+        self.entries = {}
+        self.stacks = {}
+
+    def get_report(self, sort_by="time", n=None):
+        """
+        Return profiled properties sorted by `sort_by`, descending.
+
+        Args:
+            sort_by (:obj:`str`, optional): One of ``time``, ``own_time``, ``calls`` or ``regexes`` (number of
+                evaluations of all patterns)
+            n (:obj:`int`, optional): Return only first `n` entries
+
+        Returns:
+            list: List of dictionaries with keys ``name``, ``calls``, ``time``, ``own_time`` and ``regexes``
+
+        Raises:
+            ValueError: If `sort_by` is not valid
+
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError("Invalid sort_by '{}', expected one of {}".format(sort_by, self.SORT_KEYS))
+        rows = [dict(entry, name=name) for name, entry in self.entries.items()]
+        if sort_by == "regexes":
+            rows.sort(key=lambda x: -sum(x["regexes"].values()))
+        else:
+            rows.sort(key=lambda x: -x[sort_by])
+        return rows[:n] if n else rows
+
+    def format_report(self, sort_by="time", n=20):
+        """
+        Return :meth:`get_report` as text table.
+
+        Returns:
+            str: Report
+        """
+        lines = ["{:<48}{:>10}{:>14}{:>14}{:>12}".format("property", "calls", "time [ms]", "own [ms]", "regexes")]
+        for row in self.get_report(sort_by=sort_by, n=n):
+            lines.append("{:<48}{:>10}{:>14.3f}{:>14.3f}{:>12}".format(
+                row["name"][:47], row["calls"], row["time"] * 1000, row["own_time"] * 1000, sum(row["regexes"].values())
+            ))
+        return "\n".join(lines)
+
+    def get_collapsed(self):
+        """
+        Return own times per call stack in the collapsed stack format (``outer;inner <microseconds>`` per line),
+        as used by flamegraph tools.
+
+        Returns:
+            str: Collapsed stacks
+        """
+        return "".join("{} {}\n".format(stack, int(round(seconds * 1e6))) for stack, seconds in sorted(self.stacks.items()))
+
+    def save_collapsed(self, path):
+        with open(path, "w") as f:
+            f.write(self.get_collapsed())
+
+    def to_dict(self):
+        return {
+            "entries": {k: dict(v, regexes=dict(v["regexes"])) for k, v in self.entries.items()},
+            "stacks": dict(self.stacks)
+        }
+
+    def __repr__(self):
+        return "<PropertyProfiler entries={}>".format(len(self.entries))
+
@@ -0,0 +1,154 @@
+import re
+import threading
+from collections import OrderedDict
+
+
+class RegexRegistry(object):
+    """
+    Registry of compiled regular expressions.
+
+    Patterns used across parser and line classes are registered under a name (see :meth:`register`). Ad-hoc
+    patterns given as strings (for example to :meth:`BaseConfigParser.find_objects`) are compiled using
+    :meth:`compile`, which keeps the most recently used ones in a bounded cache and counts hits and misses. Unlike
+    raising ``re._MAXCACHE``, this does not change the global state of the ``re`` module.
+
+    Registered patterns are also put to the cache of ad-hoc patterns (pre-warming it), so compiling the same
+    string again does not need to compile it.
+
+    Examples:
+
+        Example::
+
+            from ccutils.utils import regex_registry
+
+            pattern = regex_registry.register(name="hostname", regex=r"^hostname (?P<hostname>\\S+)")
+            regex_registry.get(name="hostname") is pattern
+            # Returns: True
+
+            regex_registry.compile(regex=r"^hostname (?P<hostname>\\S+)") is pattern
+            # Returns: True
+
+    """
+
+    def __init__(self, max_size=1024):
+        """
+
+        Args:
+            max_size (:obj:`int`, optional): Maximum number of ad-hoc patterns kept in the cache, defaults to 1024
+
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._named = {}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name, regex, flags=0):
+        """
+        Compile `regex` and register it under `name`.
+
+        Args:
+            name (str): Name of the pattern
+            regex (str): Regex string
+            flags (:obj:`int`, optional): Flags for regex pattern
+
+        Returns:
+            re.Pattern: Compiled pattern
+
+        Raises:
+            ValueError: If a different pattern is already registered under `name`
+
+        """
+        pattern = self.compile(regex=regex, flags=flags)
+        with self._lock:
+            registered = self._named.setdefault(name, pattern)
+        if (registered.pattern, registered.flags) != (pattern.pattern, pattern.flags):
+            raise ValueError("Pattern '{}' is already registered as '{}'.".format(name, registered.pattern))
+        return registered
+
+    def get(self, name):
+        """
+        Return pattern registered under `name`.
+
+        Args:
+            name (str): Name of the pattern
+
+        Returns:
+            re.Pattern: Compiled pattern
+
+        Raises:
+            KeyError: If no pattern is registered under `name`
+
+        """
+        return self._named[name]
+
+    def compile(self, regex, flags=0):
+        """
+        Return compiled `regex`, from the cache if possible. Anything else than ``str`` or ``bytes`` is passed to
+        :func:`re.compile` directly (not cached), so it behaves the same way.
+
+        Args:
+            regex (:obj:`str` or :obj:`bytes`): Regex string
+            flags (:obj:`int`, optional): Flags for regex pattern
+
+        Returns:
+            re.Pattern: Compiled pattern
+
+        Raises:
+            re.error: If `regex` is invalid
+
+        """
+        if not isinstance(regex, (str, bytes)):
+            return re.compile(pattern=regex, flags=flags)
+        key = (regex, flags)
+        with self._lock:
+            pattern = self._cache.get(key)
+            if pattern is not None:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return pattern
+            self.misses += 1
+        pattern = re.compile(pattern=regex, flags=flags)
+        with self._lock:
+            self._cache[key] = pattern
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return pattern
+
+    def cache_info(self):
+        """
+        Return statistics of the cache of ad-hoc patterns.
+
+        Returns:
+            dict: Dictionary with keys ``hits``, ``misses``, ``size``, ``max_size`` and ``named`` (number of
+            registered patterns)
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "named": len(self._named)
+        }
+
+    def clear_cache(self):
+        """
+        Remove all ad-hoc patterns from the cache and reset the counters. Registered patterns are kept.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._cache = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self):
+        return "<RegexRegistry named={} cached={}>".format(len(self._named), len(self._cache))
+
+
+#: Registry shared by all parser and line classes
+regex_registry = RegexRegistry()
@@ -0,0 +1,240 @@
+from ccutils.utils.CiscoRange import CiscoRange
+
+
+class VlanSet(object):
+    """
+    Immutable set of VLAN IDs (1-4094) stored as a 4096-bit bitmap (Python ``int``, bit `n` set for VLAN `n`).
+
+    Set operations (``|``, ``&``, ``-``, ``^``, ``~``), comparisons, membership and length are bitwise operations
+    on the bitmap, so comparing allowed VLANs of thousands of trunks with VLANs defined on the switch does not
+    create any strings. Used by :attr:`CiscoIosInterfaceLine.trunk_allowed_vlan_set` and
+    :attr:`CiscoIosParser.vlan_set`.
+
+    Examples:
+
+        Example::
+
+            allowed = VlanSet("1-10,20,4000-4094")
+            defined = VlanSet([1, 2, 3, 20])
+            (allowed - defined).to_string()
+            # Returns: "4-10,4000-4094"
+
+            len(allowed), 20 in allowed, "21" in allowed
+            # Returns: (106, True, False)
+
+            VlanSet(CiscoRange("1-3")) == VlanSet("1,2,3")
+            # Returns: True
+
+    """
+
+    MIN_VLAN = 1
+    MAX_VLAN = 4094
+    # Bits of all valid VLAN IDs
+    ALL_MASK = ((1 << (MAX_VLAN + 1)) - 1) ^ ((1 << MIN_VLAN) - 1)
+
+    __slots__ = ("_bitmap", )
+
+    def __init__(self, data=None):
+        """
+
+        Args:
+            data: VLANs as Cisco range string (``"1-10,20"``, ``"all"`` or ``"none"``), VLAN ID (``int``),
+                :class:`CiscoRange`, :class:`VlanSet` or iterable of VLAN IDs (``int`` or ``str``)
+
+        Raises:
+            ValueError: If `data` contains invalid VLAN ID or range
+
+        """
+        if data is None:
+            bitmap = 0
+        elif isinstance(data, VlanSet):
+            bitmap = data._bitmap
+        elif isinstance(data, str):
+            bitmap = self._parse_text(text=data)
+        elif isinstance(data, int):
+            bitmap = self._range_mask(start=data, stop=data)
+        elif isinstance(data, CiscoRange):
+            bitmap = 0
+            for key, intervals in data._intervals.items():
+                if key != ("", ()):
+                    raise ValueError("Cannot convert prefixed CiscoRange to VlanSet: {}".format(data.to_string()))
+                for start, stop in intervals:
+                    bitmap |= self._range_mask(start=start, stop=stop)
+        else:
+            bitmap = 0
+            for item in data:
+                bitmap |= self._parse_text(text=item) if isinstance(item, str) else self._range_mask(start=item, stop=item)
+        self._bitmap = bitmap
+
+    @classmethod
+    def from_bitmap(cls, bitmap):
+        """
+        Create set from bitmap (``int``), bits outside of the valid VLAN IDs are ignored.
+        """
+        vlan_set = cls()
+        vlan_set._bitmap = bitmap & cls.ALL_MASK
+        return vlan_set
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Create set from bytes returned by :meth:`to_bytes`.
+        """
+        return cls.from_bitmap(int.from_bytes(data, byteorder="little"))
+
+    @classmethod
+    def _range_mask(cls, start, stop):
+        start, stop = int(start), int(stop)
+        if not cls.MIN_VLAN <= start <= stop <= cls.MAX_VLAN:
+            raise ValueError("Invalid VLAN range: {}-{}".format(start, stop))
+        return ((1 << (stop - start + 1)) - 1) << start
+
+    @classmethod
+    def _parse_text(cls, text):
+        text = text.strip()
+        if text == "none" or text == "":
+            return 0
+        if text == "all":
+            return cls.ALL_MASK
+        bitmap = 0
+        for item in text.split(","):
+            item = item.strip()
+            if item == "":
+                continue
+            start, _, stop = item.partition("-")
+            try:
+                bitmap |= cls._range_mask(start=start, stop=stop or start)
+            except (TypeError, ValueError):
+                raise ValueError("Invalid VLAN range: '{}'".format(item))
+        return bitmap
+
+    @property
+    def bitmap(self):
+        return self._bitmap
+
+    def to_bytes(self):
+        """
+        Return bitmap as 512 bytes (little endian).
+        """
+        return self._bitmap.to_bytes(length=(self.MAX_VLAN + 2) // 8, byteorder="little")
+
+    def __iter__(self):
+        bitmap = self._bitmap
+        while bitmap:
+            lowest = bitmap & -bitmap
+            yield lowest.bit_length() - 1
+            bitmap ^= lowest
+
+    def __len__(self):
+        return bin(self._bitmap).count("1")
+
+    def __bool__(self):
+        return self._bitmap != 0
+
+    def __contains__(self, vlan_id):
+        try:
+            vlan_id = int(vlan_id)
+        except (TypeError, ValueError):
+            return False
+        return vlan_id >= 0 and bool(self._bitmap >> vlan_id & 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+        return self._bitmap == other._bitmap
+
+    def __hash__(self):
+        return hash(self._bitmap)
+
+    @staticmethod
+    def _get_bitmap(other):
+        return other._bitmap if isinstance(other, VlanSet) else VlanSet(other)._bitmap
+
+    def __or__(self, other):
+        return self.from_bitmap(self._bitmap | self._get_bitmap(other))
+
+    def __and__(self, other):
+        return self.from_bitmap(self._bitmap & self._get_bitmap(other))
+
+    def __sub__(self, other):
+        return self.from_bitmap(self._bitmap & ~self._get_bitmap(other))
+
+    def __xor__(self, other):
+        return self.from_bitmap(self._bitmap ^ self._get_bitmap(other))
+
+    def __invert__(self):
+        return self.from_bitmap(~self._bitmap)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+    symmetric_difference = __xor__
+
+    def __le__(self, other):
+        return self._bitmap & ~self._get_bitmap(other) == 0
+
+    def __ge__(self, other):
+        return self._get_bitmap(other) & ~self._bitmap == 0
+
+    def __lt__(self, other):
+        return self <= other and self._bitmap != self._get_bitmap(other)
+
+    def __gt__(self, other):
+        return self >= other and self._bitmap != self._get_bitmap(other)
+
+    issubset = __le__
+    issuperset = __ge__
+
+    def isdisjoint(self, other):
+        return self._bitmap & self._get_bitmap(other) == 0
+
+    def get_ranges(self):
+        """
+        Return list of ``(start, stop)`` tuples of consecutive VLANs.
+        """
+        ranges = []
+        bitmap = self._bitmap
+        while bitmap:
+            start = (bitmap & -bitmap).bit_length() - 1
+            shifted = bitmap >> start
+            # Adding 1 clears the trailing run of ones
+            length = (shifted ^ (shifted + 1)).bit_length() - 1
+            ranges.append((start, start + length - 1))
+            bitmap &= ~(((1 << length) - 1) << start)
+        return ranges
+
+    @property
+    def compressed_list(self):
+        """
+        Cisco-style compressed list, same as :attr:`CiscoRange.compressed_list` (``["1", "2", "4-10"]``)
+        """
+        results = []
+        for start, stop in self.get_ranges():
+            if start == stop:
+                results.append(str(start))
+            elif stop == start + 1:
+                results.extend([str(start), str(stop)])
+            else:
+                results.append("{}-{}".format(start, stop))
+        return results
+
+    def to_string(self):
+        return ",".join(self.compressed_list)
+
+    def to_list(self):
+        return list(self)
+
+    def to_crange(self):
+        """
+        Return VLANs as :class:`CiscoRange`
+        """
+        crange = CiscoRange(text=None)
+        crange._load(members=[("", (), start, stop, None, None) for start, stop in self.get_ranges()])
+        return crange
+
+    def __repr__(self):
+        return "<VlanSet: {}>".format(self.to_string())
@@ -1,2 +1,10 @@
 from ccutils.utils.CiscoRange import CiscoRange
+from ccutils.utils.InterfaceNameCache import InterfaceName, InterfaceNameCache, interface_names
+from ccutils.utils.VlanSet import VlanSet
 from ccutils.utils.JsonValidator import JsonValidator
+from ccutils.utils.ParseCache import ParseCache
+from ccutils.utils.MappedConfigLines import MappedConfigLines
+from ccutils.utils.PatternSet import PatternSet
+from ccutils.utils.RegexRegistry import RegexRegistry, regex_registry
+from ccutils.utils.ParserStats import ParserStats
+from ccutils.utils.PropertyProfiler import PropertyProfiler, profiled
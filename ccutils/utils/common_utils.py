@@ -3,7 +3,17 @@ import pathlib
 import logging
 import sys
 import re
-from collections import OrderedDict
+import functools
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from timeit import default_timer
+from ccutils.utils.ParserStats import ParserStats
+from ccutils.utils.InterfaceNameCache import interface_names, SHORT_TO_LONG, LONG_TO_SHORT
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 INTERFACE_FLAGS_SUBSTRING_MAP = {
     "physical": [
@@ -38,6 +48,91 @@ class UnsortableOrderedDict(OrderedDict):
         return UnsortableList(OrderedDict.items(self, *args, **kwargs))
 
 
+class LazyMapping(MutableMapping):
+    """
+    Mapping with values computed on first access.
+
+    Values are added either one by one with :meth:`add_lazy` (key is known upfront, value is computed by calling
+    `loader()` on first access), or in groups with :meth:`add_lazy_group` (`loader()` returns dictionary of
+    key/values, keys are only known once loaded). Groups are loaded as soon as any missing key is requested, or when
+    iterating over the mapping. Order of the keys is the order in which they were added.
+
+    Note: Being a ``MutableMapping``, not a ``dict``, it has to be converted with ``dict()`` before passing it to
+    ``json.dumps``.
+    """
+
+    class _Pending(object):
+        __slots__ = ("loader", )
+
+        def __init__(self, loader):
+            self.loader = loader
+
+    class _PendingGroup(_Pending):
+        __slots__ = ()
+
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    def add_lazy(self, key, loader):
+        self._entries[key] = self._Pending(loader)
+
+    def add_lazy_group(self, loader):
+        group = self._PendingGroup(loader)
+        self._entries[group] = group
+
+    def is_loaded(self, key):
+        """
+        Check whether the value of `key` has already been computed.
+        """
+        return key in self._entries and not isinstance(self._entries[key], self._Pending)
+
+    def _load_groups(self):
+        groups = [x for x in self._entries.keys() if isinstance(x, self._PendingGroup)]
+        if not groups:
+            return
+        entries = OrderedDict()
+        for key, value in self._entries.items():
+            if isinstance(key, self._PendingGroup):
+                entries.update(key.loader())
+            else:
+                entries[key] = value
+        self._entries = entries
+
+    def __getitem__(self, key):
+        if key not in self._entries:
+            self._load_groups()
+        value = self._entries[key]
+        if isinstance(value, self._Pending):
+            value = self._entries[key] = value.loader()
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._entries:
+            self._load_groups()
+        self._entries[key] = value
+
+    def __delitem__(self, key):
+        if key not in self._entries:
+            self._load_groups()
+        del self._entries[key]
+
+    def __contains__(self, key):
+        if key not in self._entries:
+            self._load_groups()
+        return key in self._entries
+
+    def __iter__(self):
+        self._load_groups()
+        return iter(list(self._entries.keys()))
+
+    def __len__(self):
+        self._load_groups()
+        return len(self._entries)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self.keys()))
+
+
 def get_logger(name, verbosity=4):
     """
     """
@@ -54,10 +149,11 @@ def get_logger(name, verbosity=4):
     single_formatter_string = '[%(asctime)s] [%(levelname)s]\t[%(name)s][%(module)s][%(funcName)s]\t%(message)s'
 
     logger = logging.getLogger(name)
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter(single_formatter_string)
-    handler.setFormatter(formatter)
+    # Handler is only created for new loggers
     if not len(logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(single_formatter_string)
+        handler.setFormatter(formatter)
         logger.addHandler(handler)
     logger.setLevel(verbosity_map[verbosity])
 
@@ -76,6 +172,214 @@ def get_logger(name, verbosity=4):
 logger = get_logger(__name__, verbosity=3)
 
 
+def cached_property(func):
+    """
+    Read-only property, computed on first access and stored in the ``_cache`` dictionary of the instance.
+
+    Unlike ``@property @functools.lru_cache()`` the values live (and die) with the instance, so they do not keep the
+    instance alive and are not evicted by other instances. Use ``clear_cache()`` of the instance to invalidate them.
+
+    Args:
+        func: Getter function
+
+    Returns:
+        property: Cached property
+
+    """
+    key = func.__name__
+
+    @functools.wraps(func)
+    def getter(self):
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        try:
+            value = cache[key]
+        except KeyError:
+            if ParserStats.active:
+                return _compute_with_stats(obj=self, cache=cache, key=key, func=func)
+            value = cache[key] = func(self)
+            return value
+        if ParserStats.active:
+            _record_hit(obj=self)
+        return value
+    return property(getter)
+
+
+def cached_method(func):
+    """
+    Same as :func:`cached_property`, but for methods. Results are stored per arguments (which must be hashable).
+
+    Args:
+        func: Method
+
+    Returns:
+        function: Cached method
+
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        key = (name, args, tuple(sorted(kwargs.items()))) if args or kwargs else name
+        try:
+            value = cache[key]
+        except KeyError:
+            if ParserStats.active:
+                return _compute_with_stats(obj=self, cache=cache, key=key, func=lambda obj: func(obj, *args, **kwargs))
+            value = cache[key] = func(self, *args, **kwargs)
+            return value
+        if ParserStats.active:
+            _record_hit(obj=self)
+        return value
+    return wrapper
+
+
+def get_stats(obj):
+    """
+    Return enabled :class:`ccutils.utils.ParserStats` of a parser or of the parser of a config line, or ``None``.
+    """
+    stats = getattr(obj, "stats", None)
+    if stats is None:
+        stats = getattr(getattr(obj, "config", None), "stats", None)
+    if isinstance(stats, ParserStats) and stats.enabled:
+        return stats
+    return None
+
+
+def _record_hit(obj):
+    stats = get_stats(obj)
+    if stats is not None:
+        stats.record_cache(name="properties", hit=True)
+
+
+def _compute_with_stats(obj, cache, key, func):
+    """
+    Compute cached property (or method) `func`, recording the miss and compute time to the stats of `obj`.
+    """
+    stats = get_stats(obj)
+    if stats is None:
+        value = cache[key] = func(obj)
+        return value
+    start = default_timer()
+    value = cache[key] = func(obj)
+    stats.record_cache(name="properties", hit=False)
+    stats.record_property(name="{}.{}".format(type(obj).__name__, key if isinstance(key, str) else key[0]), seconds=default_timer() - start)
+    return value
+
+
+class QueryPlan(namedtuple("QueryPlan", ["prefix", "substrings"])):
+    """
+    Literal text required by a pattern, used to skip lines which cannot match it without running the regex.
+    See :func:`get_query_plan`.
+
+    Checking the prefix with ``str.startswith`` is not faster than running the (anchored) regex itself, so it is
+    only used to look up candidate lines in an index. Substring checks (``in``) are much cheaper than searching
+    for a pattern not starting with literal text.
+
+    Attributes:
+        prefix (str): Text every matching line starts with, ``None`` if the pattern is not anchored to the beginning
+        substrings (tuple): Texts every matching line contains (longest first)
+
+    """
+    __slots__ = ()
+
+
+# Marker of "\s" in the required sequence of pattern, see _get_required_sequence
+_SPACE = object()
+
+
+def _get_required_sequence(items):
+    """
+    Flatten parsed regex `items` into sequence of characters every match has to contain (in this order, at
+    consecutive positions unless separated by ``None``). ``_SPACE`` marks ``\\s``.
+    """
+    sequence = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            sequence.append(chr(av))
+        elif op is sre_parse.IN and av == [(sre_parse.CATEGORY, sre_parse.CATEGORY_SPACE)]:
+            sequence.append(_SPACE)
+        elif op is sre_parse.SUBPATTERN:
+            add_flags, del_flags = av[1:3]
+            if add_flags or del_flags:
+                # Scoped inline flags such as (?i:...) may change what the literals match
+                sequence.append(None)
+            else:
+                sequence.extend(_get_required_sequence(av[-1]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            # Content is required at least once, but may be followed by more repetitions
+            sequence.append(None)
+            sequence.extend(_get_required_sequence(av[2]))
+            sequence.append(None)
+        else:
+            sequence.append(None)
+    return sequence
+
+
+@functools.lru_cache(maxsize=1024)
+def get_query_plan(pattern):
+    """
+    Inspect compiled `pattern` and return :class:`QueryPlan` with literal text required by it - the prefix of
+    patterns anchored to the beginning and substrings which every match (using ``re.search``) has to contain.
+    Leading ``\\s`` is treated as space, as config lines are indented by spaces only (see
+    :meth:`BaseConfigParser.fix_indents`).
+
+    Examples:
+
+        Example::
+
+            get_query_plan(re.compile(r"^ ip address (?P<ip>\\S+) (?P<mask>\\S+)"))
+            # Returns: QueryPlan(prefix=' ip address ', substrings=())
+
+            get_query_plan(re.compile(r"switchport trunk allowed vlan( add)? (\\S+)"))
+            # Returns: QueryPlan(prefix=None, substrings=('switchport trunk allowed vlan',))
+
+    Args:
+        pattern (:obj:`re.Pattern`): Compiled pattern
+
+    Returns:
+        QueryPlan: Query plan, with no prefix and substrings if no literal text could be found (for example with
+        case insensitive patterns)
+
+    """
+    if pattern.flags & re.IGNORECASE or not isinstance(pattern.pattern, str):
+        return QueryPlan(prefix=None, substrings=())
+    try:
+        items = list(sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return QueryPlan(prefix=None, substrings=())
+    prefix = None
+    if len(items) and items[0] in [(sre_parse.AT, sre_parse.AT_BEGINNING), (sre_parse.AT, sre_parse.AT_BEGINNING_STRING)]:
+        items = items[1:]
+        prefix = ""
+    sequence = _get_required_sequence(items)
+    if prefix is not None:
+        for position, char in enumerate(sequence):
+            if char is _SPACE and not prefix.strip(" "):
+                char = " "
+            if not isinstance(char, str):
+                sequence = sequence[position:]
+                break
+            prefix += char
+        else:
+            sequence = []
+    substrings = []
+    run = ""
+    for char in sequence + [None]:
+        if isinstance(char, str):
+            run += char
+        else:
+            if len(run) > 1:
+                substrings.append(run)
+            run = ""
+    substrings.sort(key=len, reverse=True)
+    return QueryPlan(prefix=prefix, substrings=tuple(substrings))
+
+
 def load_json(path):
     path = check_path(path)
     data = None
@@ -90,6 +394,8 @@ def split_interface_name(interface: str):
     This function takes in interface string such as "GigabitEthernet0/10" and returns a list containing name and number,
     such as ["GigabitEthernet", "0/10"]
 
+    Names are parsed by shared :class:`ccutils.utils.InterfaceNameCache`, so each name is only matched once.
+
     Args:
         interface (str): Interface to perform split on
 
@@ -97,15 +403,12 @@ def split_interface_name(interface: str):
         list: List containing name and number of interface, such as ``["GigabitEthernet", "0/10"]``
 
     """
-    #pattern = re.compile(pattern=r"(?P<name>^[A-z\-]+(?=\d))(?P<number>[\d+\/]+)")
-    pattern = re.compile(pattern=r"(?P<name>[A-z]{2,}(?:[A-z\-])*)(?P<number>\d+(?:\/\d+)*(?:\:\d+)?(?:\.\d+)?)")
-    try:
-        match = re.match(pattern=pattern, string=interface)
-    except TypeError as e:
+    if not isinstance(interface, str):
         logger.error("Expected string or bytes-like object, cannot match on '{}'".format(type(interface)))
         return None
-    if match:
-        return [match.group("name"), match.group("number")]
+    parsed = interface_names.parse(interface)
+    if parsed:
+        return [parsed.type, parsed.number]
     else:
         logger.error("Given interface {} did not match parsing pattern.".format(interface))
         return None
@@ -121,52 +424,13 @@ def convert_interface_name(interface: str, out: str="long"):
     :rtype: str
     :return: Interface string
     """
-    short = [
-        "Eth", "Et", "Se", "Fa", "Gi", "Te", "Twe", "Fo", "Hu", "Po", "Tu", "Vl", "Lo", "pw"
-    ]
-    long = [
-        "Ethernet", "Ethernet", "Serial", "FastEthernet", "GigabitEthernet",
-        "TenGigabitEthernet", "TwentyFiveGigE", "FortyGigabitEthernet", "HundredGigE", "Port-channel", "Tunnel",
-        "Vlan", "Loopback", "pseudowire"
-    ]
     interface_s = split_interface_name(interface)
     if interface_s is None:
         logger.error("Cannot convert given interface.")
         return interface
-    else:
-        given_form = None
-        index = None
-        name, number = interface_s
-        if name in short:
-            given_form = "short"
-            index = short.index(name)
-        elif name in long:
-            given_form = "long"
-            index = long.index(name)
-        else:
-            given_form = "unknown"
-            logger.warning("Got unknown interface name: '{}'".format(name))
-
-        if out == "long":
-            # Return full version
-            if given_form == "long":
-                return interface
-            elif given_form == "short":
-                return long[index] + number
-            else:
-                # Error
-                return interface
-        elif out == "short":
-            # Return full version
-            if given_form == "short":
-                return interface
-            elif given_form == "long":
-                return short[index] + number
-            else:
-                # Error
-                return interface
-        else:
-            return interface
+    if interface_s[0] not in SHORT_TO_LONG and interface_s[0] not in LONG_TO_SHORT:
+        logger.warning("Got unknown interface name: '{}'".format(interface_s[0]))
+    return interface_names.convert(interface, out=out)
 
 
 def match_to_json(match, groups):
@@ -283,9 +547,35 @@ def check_path(path, create=False):
     return return_path
 
 
+def get_interface_sort_key(name):
+    """
+    Return key for sorting interface names, in the same order as members of :class:`ccutils.utils.CiscoRange`:
+    by length of the slot path, slot path, number, channel and subinterface, so ``Gi0`` comes before
+    ``Po1.2500`` and ``Lo250``, which come before ``Gi0/0/0``. The type is not part of the key, so (stable)
+    ``sorted()`` keeps names differing only by type (``Gi1/0/1`` and ``Ap1/0/1``) in the given order. Names which
+    cannot be parsed are ordered last, alphabetically. Names are parsed by shared :class:`ccutils.utils.InterfaceNameCache`, so sorting a list of
+    names does not parse any name more than once.
+
+    Args:
+        name (str): Interface name, such as ``"GigabitEthernet1/0/1.100"``
+
+    Returns:
+        tuple: Sort key ``(slot path length, slot path, number, channel, subinterface)``, missing channel and
+        subinterface are ``0``
+
+    """
+    parsed = interface_names.parse(name)
+    if parsed is None or not parsed.complete:
+        return (sys.maxsize, (), 0, 0, 0, name)
+    return parsed.sort_key
+
+
 def interface_sort(crange, name):
-    index = crange._list.index(name)
-    return crange._list.index(name)
+    """
+    Return sort key of interface `name`. Kept for compatibility, `crange` is not used anymore, use
+    :func:`get_interface_sort_key` instead.
+    """
+    return get_interface_sort_key(name)
 
 
 def jprint(data, indent=2):
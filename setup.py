@@ -1,11 +1,16 @@
+import re
 from setuptools import setup, find_packages
 
+# Version is defined in ccutils/__init__.py only
+with open("ccutils/__init__.py", "r") as fs:
+    version = re.search(r"^__version__ = [\"']([^\"']+)[\"']", fs.read(), flags=re.MULTILINE).group(1)
+
 with open("requirements.txt", "r") as fs:
     reqs = [r for r in fs.read().splitlines() if (len(r) > 0 and not r.startswith("#"))]
 
 setup(
     name='ccutils',
-    version='0.2.18',
+    version=version,
     packages=find_packages(exclude=["test", "examples"]),
     url='https://github.org/mihudec/ccutils',
     license='',
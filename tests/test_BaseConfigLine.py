@@ -26,6 +26,73 @@ class TestBaseConfigParser(unittest.TestCase):
                 parent = config_line
                 self.assertEqual(parent.number, test)
 
+    def test_get_parent(self):
+        wanted_results = {
+            0: None,
+            1: 0,
+            2: 1,
+            7: 0,
+            8: None,
+            13: 10
+        }
+        for test, want in wanted_results.items():
+            with self.subTest(msg=test):
+                parent = self.config.lines[test].get_parent
+                have = parent.number if parent is not None else None
+                self.assertEqual(want, have)
+
+    def test_get_parents(self):
+        wanted_results = {
+            0: [],
+            1: [0],
+            3: [0, 1],
+            14: [9, 10]
+        }
+        for test, want in wanted_results.items():
+            with self.subTest(msg=test):
+                have = [x.number for x in self.config.lines[test].get_parents]
+                self.assertEqual(want, have)
+
+    def test_get_children(self):
+        wanted_results = {
+            0: [1, 2, 3, 4, 5, 6, 7],
+            1: [2, 3, 4, 5, 6],
+            2: [],
+            8: [],
+            10: [11, 12, 13, 14]
+        }
+        for test, want in wanted_results.items():
+            with self.subTest(msg=test):
+                have = [x.number for x in self.config.lines[test].get_children()]
+                self.assertEqual(want, have)
+
+    def test_is_parent(self):
+        wanted_results = {
+            0: True,
+            1: True,
+            2: False,
+            8: False,
+            9: True,
+            16: False
+        }
+        for test, want in wanted_results.items():
+            with self.subTest(msg=test):
+                self.assertEqual(want, self.config.lines[test].is_parent)
+
+    def test_type(self):
+        wanted_results = {
+            0: ["parent", "interface"],
+            1: ["parent", "child"],
+            2: ["child"],
+            7: ["comment"],
+            8: ["comment"],
+            9: ["parent", "interface"]
+        }
+        for test, want in wanted_results.items():
+            with self.subTest(msg=test):
+                self.assertEqual(want, self.config.lines[test].type)
+                self.assertEqual(want, self.config.lines[test].get_type)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,16 @@
 import unittest
 import pathlib
 import json
-from ccutils.ccparser import BaseConfigParser, ConfigToJson
+import gc
+import sys
+import re
+import weakref
+import logging
+from unittest import mock
+from ccutils.ccparser import BaseConfigParser, ConfigToJson, ConfigParser
+from ccutils.utils import MappedConfigLines
+
+BaseConfigParserModule = sys.modules[BaseConfigParser.__module__]
 
 DEBUG = False
 VERBOSITY = 5 if DEBUG else 3
@@ -49,7 +58,153 @@ interface GigabitEthernet1/0/3
         result = config1.get_section_by_parents(["interface GigabitEthernet1/0/2"])
         print(result)
 
+    def test_cache(self):
+        config = BaseConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/vlans_test.txt"), verbosity=VERBOSITY)
+        name_servers = config.name_servers
+        self.assertIs(name_servers, config.name_servers)
+        self.assertIn("name_servers", config.cache_info()["parser"])
+        config.clear_cache()
+        self.assertEqual({}, config.cache_info()["parser"])
+        self.assertEqual(name_servers, config.name_servers)
+        self.assertIsNot(name_servers, config.name_servers)
+
+    def test_cache_does_not_keep_parser_alive(self):
+        config = BaseConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/vlans_test.txt"), verbosity=VERBOSITY)
+        config.name_servers
+        for line in config.lines:
+            line.get_parents
+        del line
+        ref = weakref.ref(config)
+        del config
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_find_objects(self):
+        regexes = [
+            r"^interface", r"^interface Gi", r"^interface\s", r"^ switchport", r"^ switchport mode ", r"^\sswitchport\saccess",
+            r"^vlan (?P<vlan_id>\d+)", r"^(?:ip )?vrf(?: definition)? (?P<vrf_name>\S+)", r"^ip", r"^\s", r"^!", r"^a|^i",
+            r"description", r"(?i)^INTERFACE", r"^(?i:INTERFACE) ", r"^ (?i:SWITCHPORT) mode"
+        ]
+        for test in ["interface_l2_test", "vlans_test", "cisco_ios_vrf_definition"]:
+            config = BaseConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/{}.txt".format(test)), verbosity=VERBOSITY)
+            for regex in regexes:
+                with self.subTest(msg="{} {}".format(test, regex)):
+                    pattern = re.compile(pattern=regex, flags=re.MULTILINE)
+                    want = [x for x in config.lines if pattern.search(x.text)]
+                    self.assertEqual(want, config.find_objects(regex=regex))
+
+    def test_fix_indents(self):
+        config_lines = [
+            "interface GigabitEthernet1/0/1",
+            "   description Test ",
+            "   service-policy input POLICY",
+            "      no shutdown",
+            "\tend"
+        ]
+        want = [
+            "interface GigabitEthernet1/0/1",
+            " description Test",
+            " service-policy input POLICY",
+            "  no shutdown",
+            "end"
+        ]
+        numpy = BaseConfigParserModule.numpy
+        for use_numpy in [True, False]:
+            with self.subTest(msg="numpy" if use_numpy else "array"):
+                if use_numpy and numpy is None:
+                    self.skipTest("NumPy is not installed")
+                BaseConfigParserModule.numpy = numpy if use_numpy else None
+                try:
+                    config = BaseConfigParser(config=list(config_lines), verbosity=VERBOSITY)
+                    self.assertEqual(want, config.config_lines_str)
+                    # Already normalized lines are not re-written
+                    normalized = list(want)
+                    config = BaseConfigParser(config=normalized, verbosity=VERBOSITY)
+                    for original, fixed in zip(normalized, config.config_lines_str):
+                        self.assertIs(original, fixed)
+                finally:
+                    BaseConfigParserModule.numpy = numpy
+
+    def test_memory_map(self):
+        for test in ["vlans_test", "interface_l2_test", "cisco_ios_vrf_definition"]:
+            with self.subTest(msg=test):
+                path = pathlib.Path(__file__).parent.joinpath("resources/{}.txt".format(test))
+                want = ConfigParser(config=path, device_type="ios", verbosity=VERBOSITY)
+                config = ConfigParser(config=path, device_type="ios", verbosity=VERBOSITY, memory_map=True)
+                self.assertIsInstance(config.config_lines_str, MappedConfigLines)
+                self.assertEqual(want.config_lines_str, list(config.config_lines_str))
+                self.assertEqual([x.get_type for x in want.lines], [x.get_type for x in config.lines])
+                self.assertEqual(ConfigToJson(config=want, verbosity=VERBOSITY).data, ConfigToJson(config=config, verbosity=VERBOSITY).data)
+
+    def test_debug_logging(self):
+        config_lines = ["hostname Test", "interface Vlan1", " description Test"]
+        with mock.patch.object(logging.Logger, "debug", autospec=True) as debug:
+            config = BaseConfigParser(config=config_lines, verbosity=3)
+            config.lines[0].re_search(regex=r"^interface")
+            config.lines[0].get_parents
+            config.find_objects(regex=r"^interface")
+        # Only the messages logged once per parsing, none per line or per query
+        self.assertEqual([x for x in debug.call_args_list if "ConfigLine objects" not in str(x) and "Treating config" not in str(x)], [])
+        try:
+            config = BaseConfigParser(config=config_lines, verbosity=5)
+            with self.assertLogs(logger="BaseConfigLine", level="DEBUG") as logs:
+                config.lines[0].re_search(regex=r"^interface")
+            self.assertIn("Given regex '^interface' did not match.", logs.output[0])
+        finally:
+            BaseConfigParser(config=config_lines, verbosity=VERBOSITY)
+
+    def test_update(self):
+        text1 = """
+hostname RouterA
+!
+interface GigabitEthernet1/0/1
+ switchport mode trunk
+!
+interface GigabitEthernet1/0/2
+ switchport mode access
+ switchport access vlan 10
+!
+end
+"""
+        text2 = """
+hostname RouterA
+no cdp run
+!
+interface GigabitEthernet1/0/1
+ switchport mode trunk
+!
+interface GigabitEthernet1/0/2
+ switchport mode access
+ switchport access vlan 20
+!
+interface GigabitEthernet1/0/3
+!
+end
+"""
+        config = ConfigParser(config=text1, device_type="ios", verbosity=VERBOSITY)
+        ctj = ConfigToJson(config=config, verbosity=VERBOSITY)
+        lazy_ctj = ConfigToJson(config=config, verbosity=VERBOSITY, lazy=True)
+        lazy_ctj.to_json()
+        first_interface = config.lines[2]
+        self.assertTrue(first_interface.cdp)
+        result = config.update(config=text2)
+        want = ConfigParser(config=text2, device_type="ios", verbosity=VERBOSITY)
+        self.assertEqual([str(x) for x in want.lines], [str(x) for x in config.lines])
+        self.assertEqual([x.get_parent.number for x in want.lines if x.get_parent], [x.get_parent.number for x in config.lines if x.get_parent])
+        self.assertEqual([x.number for x in want.lines if x.is_parent], [x.number for x in config.lines if x.is_parent])
+        self.assertIs(first_interface, config.lines[3])
+        self.assertEqual(3, first_interface.number)
+        self.assertEqual(["no cdp run", "interface GigabitEthernet1/0/2", " switchport mode access", " switchport access vlan 20", "interface GigabitEthernet1/0/3"], [x.text for x in result["added"] if x.text != "!"])
+        self.assertEqual(["interface GigabitEthernet1/0/2", " switchport mode access", " switchport access vlan 10"], [x for x in result["removed"] if x != "!"])
+        # Depends on global CDP setting
+        self.assertFalse(first_interface.cdp)
+        ctj.refresh()
+        want_ctj = ConfigToJson(config=want, verbosity=VERBOSITY)
+        self.assertEqual(want_ctj.data, ctj.data)
+        lazy_ctj.refresh()
+        self.assertEqual(want_ctj.to_json(), lazy_ctj.to_json())
+        self.assertEqual(want_ctj.data, ConfigToJson(config=config, verbosity=VERBOSITY).data)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
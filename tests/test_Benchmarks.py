@@ -0,0 +1,68 @@
+import unittest
+import json
+from ccutils.benchmarks import BenchmarkSuite, generate_config
+from ccutils.ccparser import ConfigParser, ConfigToJson
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_generate_config(self):
+        config_lines = generate_config(interfaces=16, vlans=10, vrfs=2, ntp_servers=2)
+        self.assertEqual(config_lines, generate_config(interfaces=16, vlans=10, vrfs=2, ntp_servers=2))
+        config = ConfigParser(config=config_lines, device_type="ios", verbosity=2)
+        self.assertEqual(len(list(config.interface_lines)), 16)
+        self.assertEqual(len(config.vlans), 10)
+        self.assertEqual(len(config.vrfs), 2)
+        self.assertEqual(len(config.ntp["servers"]), 2)
+        data = ConfigToJson(config=config, verbosity=2).data
+        self.assertEqual(data["interfaces"]["Vlan2"]["l3"]["vrf"], "VRF-0")
+        self.assertEqual(len(data["interfaces"]["GigabitEthernet1/0/2"]["service_instances"]), 2)
+
+    def test_generate_config_valid(self):
+        # More SVIs than generated VLANs and VLAN IDs up to 4094
+        for kwargs in [{"interfaces": 200, "vlans": 5}, {"interfaces": 200, "vlans": 4094}]:
+            with self.subTest(msg=kwargs):
+                config = ConfigParser(config=generate_config(**kwargs), device_type="ios", verbosity=2)
+                data = ConfigToJson(config=config, verbosity=2).data
+                self.assertEqual(len(data["interfaces"]), kwargs["interfaces"])
+                self.assertTrue(all(1 <= int(x) <= 4094 for x in config.vlans.keys()))
+                addresses = []
+                for name, interface in data["interfaces"].items():
+                    if name.startswith("Vlan"):
+                        self.assertLessEqual(int(name[4:]), 4094)
+                    if "l2" in interface and isinstance(interface["l2"]["allowed_vlans"], list):
+                        self.assertTrue(all(1 <= int(x) <= 4094 for x in interface["l2"]["allowed_vlans"]))
+                    if "l3" in interface:
+                        addresses.extend(x["ip_address"] for x in interface["l3"]["ip_addresses"])
+                self.assertEqual(len(addresses), len(set(addresses)))
+                self.assertEqual(len(addresses), kwargs["interfaces"] // 8)
+
+    def test_run(self):
+        suite = BenchmarkSuite(interfaces=16, vlans=10, vrfs=2, repeat=1, verbosity=VERBOSITY)
+        results = suite.run()
+        self.assertEqual(list(results["stages"].keys()), list(BenchmarkSuite.STAGES))
+        self.assertEqual(results["meta"]["lines"], len(suite.config_lines))
+        for stage in ["parse", "fix_indents", "config_to_json"]:
+            with self.subTest(msg=stage):
+                self.assertGreater(results["stages"][stage]["lines_per_s"], 0)
+                self.assertGreater(results["stages"][stage]["peak_memory"], 0)
+        self.assertIn("standby", results["properties"])
+        # Results are JSON serializable and comparable
+        results = json.loads(json.dumps(results))
+        comparison = BenchmarkSuite.compare(old=results, new=results)
+        self.assertEqual(comparison["parse"]["ratio"], 1.0)
+        self.assertEqual(comparison["property:standby"]["ratio"], 1.0)
+        self.assertIn("config_to_json", BenchmarkSuite.format_report(results=results, comparison=comparison))
+
+    def test_run_stages(self):
+        suite = BenchmarkSuite(interfaces=8, repeat=1, memory=False, verbosity=VERBOSITY)
+        results = suite.run(stages=["parse"])
+        self.assertEqual(list(results["stages"].keys()), ["generate", "parse"])
+        self.assertNotIn("peak_memory", results["stages"]["parse"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import pathlib
 import json
-from ccutils.ccparser import ConfigParser
+from ccutils.ccparser import ConfigParser, BaseConfigLine, InterfaceSnapshot
 from ccutils.utils.common_utils import jprint
 
 DEBUG = False
@@ -56,6 +56,66 @@ class TestL3Interface(unittest.TestCase):
                 have = interface_line.standby
                 self.assertEqual(want, have)
 
+    def test_scan_children(self):
+        for interface_line in self.config.interface_lines:
+            for patterns in interface_line._get_scanner_table().values():
+                for pattern in patterns:
+                    with self.subTest(msg="{} {}".format(interface_line.name, pattern.pattern)):
+                        want = BaseConfigLine._search_children(interface_line, pattern=pattern)
+                        have = interface_line.re_search_children(regex=pattern)
+                        self.assertEqual(want, have)
+
+    def test_snapshot(self):
+        for interface_line in self.config.interface_lines:
+            with self.subTest(msg=interface_line.name):
+                snapshot = interface_line.snapshot
+                self.assertIs(snapshot, interface_line.snapshot)
+                self.assertEqual(interface_line.port_mode, snapshot.port_mode)
+                self.assertEqual(interface_line.get_unprocessed(return_type="text"), snapshot.unprocessed_lines)
+                if snapshot.port_mode == "l3":
+                    self.assertEqual(interface_line.ipv4_addresses, snapshot.ipv4_addresses)
+                    self.assertEqual(interface_line.vrf, snapshot.vrf)
+                    self.assertIsNone(snapshot.access_vlan)
+                with self.assertRaises(AttributeError):
+                    snapshot.unknown_field = None
+
+    def test_vrf_ipv4_physical_addresses(self):
+        for interface_line in self.config.interface_lines:
+            if interface_line.port_mode != "l3" or not interface_line.ipv4_addresses:
+                continue
+            with self.subTest(msg=interface_line.name):
+                have = self.config.vrf_ipv4_physical_addresses(vrf=interface_line.vrf or "global")
+                for address in interface_line.ipv4_addresses:
+                    self.assertIn(address["address"], have)
+
+
+class TestInterfaceLines(unittest.TestCase):
+    config_lines = [
+        "interface Vlan10",
+        " ip address 10.0.0.1 255.255.255.0",
+        " ip address 10.0.1.1 255.255.255.0 secondary",
+        " standby 1 ip 10.0.0.254",
+        " some unknown command",
+        "!",
+        "interface GigabitEthernet0/1",
+        " ip unnumbered Loopback0",
+        "!"
+    ]
+
+    def get_interface(self, name):
+        config = ConfigParser(config=self.config_lines, device_type="ios", verbosity=VERBOSITY)
+        return [x for x in config.interface_lines if x.name == name][0]
+
+    def test_get_unprocessed(self):
+        # "ip address" lines match more than one of the patterns
+        interface_line = self.get_interface("Vlan10")
+        self.assertEqual([" some unknown command"], interface_line.get_unprocessed(return_type="text"))
+
+    def test_ip_unnumbered_interface(self):
+        interface_line = self.get_interface("GigabitEthernet0/1")
+        self.assertEqual("Loopback0", interface_line.ipv4_unnumbered_interface)
+        self.assertEqual("Loopback0", interface_line.ip_unnumbered_interface)
+
 
 class TestL2Interface(unittest.TestCase):
     test_file_base = "cisco_ios_interface_l2_tests"
@@ -74,3 +134,13 @@ class TestL2Interface(unittest.TestCase):
                 have = interface_line.dhcp_snooping
                 self.assertEqual(want, have)
 
+    def test_snapshot(self):
+        for interface_line in self.config.interface_lines:
+            with self.subTest(msg=interface_line.name):
+                snapshot = interface_line.snapshot
+                self.assertIsInstance(snapshot, InterfaceSnapshot)
+                self.assertEqual(interface_line.port_mode, snapshot.port_mode)
+                if snapshot.port_mode == "l2":
+                    self.assertEqual(interface_line.switchport_mode, snapshot.switchport_mode)
+                    self.assertEqual(interface_line.trunk_allowed_vlan_set, snapshot.trunk_allowed_vlan_set)
+                    self.assertIsNone(snapshot.ipv4_addresses)
@@ -90,5 +90,50 @@ class TestCiscoRange(unittest.TestCase):
                 # print(cr.compressed_list)
                 self.assertEqual(cr.compressed_list, tests[test]["result"])
 
+    def test_set_operations(self):
+        a = CiscoRange("1-1000,2000-3000", verbosity=VERBOSITY)
+        b = CiscoRange("500-2500", verbosity=VERBOSITY)
+        self.assertEqual((a - b).compressed_list, ["1-499", "2501-3000"])
+        self.assertEqual((a | b).compressed_list, ["1-3000"])
+        self.assertEqual((a & b).compressed_list, ["500-1000", "2000-2500"])
+        self.assertEqual((a ^ b).compressed_list, ["1-499", "1001-1999", "2501-3000"])
+        self.assertEqual(len(a), 2001)
+        self.assertIn("600", a)
+        self.assertIn("1000", a)
+        self.assertNotIn("1500", a)
+        self.assertEqual(a - b, CiscoRange("1-499,2501-3000", verbosity=VERBOSITY))
+        c = CiscoRange("Gi1/0/1-48, Gi1/0/1.100, Te1/1/1-4", verbosity=VERBOSITY)
+        d = CiscoRange("Gi1/0/10-20, Te1/1/2", verbosity=VERBOSITY)
+        self.assertEqual((c - d).compressed_list, ["Gi1/0/1.100", "Gi1/0/1-9", "Gi1/0/21-48", "Te1/1/1", "Te1/1/3-4"])
+        self.assertIn("Gi1/0/1.100", c)
+        self.assertIn("Gi1/0/5-6", c)
+        self.assertNotIn("Gi1/0/1.200", c)
+        with self.assertRaises(ValueError):
+            a | c
+
+    def test_add_remove(self):
+        cr = CiscoRange("1-10", verbosity=VERBOSITY)
+        cr.add("22-24")
+        cr.remove("3-5,7")
+        self.assertEqual(cr.compressed_list, ["1", "2", "6", "8-10", "22-24"])
+        self.assertEqual(cr[2], "6")
+        del cr[0]
+        cr.insert(0, "100")
+        self.assertEqual(cr.to_string(), "2,6,8-10,22-24,100")
+        with self.assertRaises(ValueError):
+            cr.add("Gi1/0/1")
+
+    def test_mixed_prefixes(self):
+        # Members differing only by prefix are ordered by first occurrence of the prefix
+        cr = CiscoRange("Te1/1/1,Gi1/1/1,Gi1/1/2", verbosity=VERBOSITY)
+        self.assertEqual(cr.compressed_list, ["Te1/1/1", "Gi1/1/1-2"])
+        self.assertEqual(list(cr), ["Te1/1/1", "Gi1/1/1", "Gi1/1/2"])
+        cr = CiscoRange("Gi1/0/1,Ap1/0/1,Gi1/0/2", verbosity=VERBOSITY)
+        self.assertEqual(list(cr), ["Gi1/0/1", "Ap1/0/1", "Gi1/0/2"])
+        cr = cr | CiscoRange("Te1/0/1", verbosity=VERBOSITY)
+        self.assertEqual(list(cr), ["Gi1/0/1", "Ap1/0/1", "Te1/0/1", "Gi1/0/2"])
+        self.assertEqual(CiscoRange("Gi1-4,Te2-5", verbosity=VERBOSITY).compressed_list, ["Gi1-4", "Te2-5"])
+        self.assertEqual(cr.sort_list(["Te1/1/1", "Gi1/0/1", "Gi1/1/1"]), ["Gi1/0/1", "Te1/1/1", "Gi1/1/1"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
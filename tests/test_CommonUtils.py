@@ -1,6 +1,8 @@
 import unittest
-from ccutils.utils.common_utils import split_interface_name, convert_interface_name
+from ccutils.utils.common_utils import split_interface_name, convert_interface_name, LazyMapping, get_query_plan, get_logger, get_interface_sort_key
 import json
+import re
+import logging
 
 DEBUG = False
 VERBOSITY = 5 if DEBUG else 3
@@ -35,5 +37,63 @@ class TestCommonUtils(unittest.TestCase):
                 have = convert_interface_name(interface=interface, out="short")
                 self.assertEqual(want, have)
 
+    def test_get_interface_sort_key(self):
+        names = ["GigabitEthernet0/2/1", "Loopback250", "GigabitEthernet0/0/10", "Port-channel1.2500", "Vlan1", "Serial0/1/0:0.20",
+                 "Serial0/1/0:0.10", "GigabitEthernet0/0/2", "GigabitEthernet0", "Cellular0/1/0", "NVI"]
+        want = ["GigabitEthernet0", "Vlan1", "Port-channel1.2500", "Loopback250", "GigabitEthernet0/0/2", "GigabitEthernet0/0/10",
+                "Cellular0/1/0", "Serial0/1/0:0.10", "Serial0/1/0:0.20", "GigabitEthernet0/2/1", "NVI"]
+        self.assertEqual(sorted(names, key=get_interface_sort_key), want)
+        self.assertEqual(get_interface_sort_key("Gi1/0/1.100"), (2, (1, 0), 1, 0, 100))
+        # Names differing only by type keep their order
+        names = ["GigabitEthernet1/0/1", "AppGigabitEthernet1/0/1", "GigabitEthernet1/0/2", "TenGigabitEthernet1/1/1",
+                 "GigabitEthernet1/1/1"]
+        self.assertEqual(sorted(names, key=get_interface_sort_key), names)
+
+    def test_get_query_plan(self):
+        testmap = {
+            r"^ntp server (\S+)": ("ntp server ", ()),
+            r"^\sip\saddress\s(\S+)": (" ip", ("address", )),
+            r"^(?:ip )?vrf(?: definition)? (?P<vrf_name>\S+)": ("", ("vrf", )),
+            r"switchport trunk allowed vlan( add)? (\S+)": (None, ("switchport trunk allowed vlan", )),
+            r"(?:ab)+cdef": (None, ("cdef", "ab")),
+            r"^a|^b": ("", ()),
+            r"(?i)^ntp": (None, ()),
+            r"^(?i:NTP) server (\S+)": ("", (" server ", )),
+            r"^ntp (?i:SERVER)": ("ntp ", ()),
+            r"^ntp (?-i:server)": ("ntp ", ()),
+        }
+        for regex, want in testmap.items():
+            with self.subTest(msg=regex):
+                plan = get_query_plan(re.compile(pattern=regex, flags=re.MULTILINE))
+                self.assertEqual(want, (plan.prefix, plan.substrings))
+
+    def test_get_logger(self):
+        logger = get_logger(name="TestCommonUtils", verbosity=3)
+        self.assertIs(logger, get_logger(name="TestCommonUtils", verbosity=5))
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertEqual(logger.level, logging.DEBUG)
+
+    def test_lazy_mapping(self):
+        calls = []
+
+        def loader(key, value):
+            calls.append(key)
+            return value
+
+        data = LazyMapping()
+        data["a"] = 1
+        data.add_lazy("b", lambda: loader("b", 2))
+        data.add_lazy_group(lambda: {k: loader(k, v) for k, v in {"c": 3, "d": 4}.items()})
+        data.add_lazy("e", lambda: loader("e", 5))
+        self.assertEqual(2, data["b"])
+        self.assertEqual(2, data["b"])
+        self.assertEqual(["b"], calls)
+        self.assertFalse(data.is_loaded("e"))
+        self.assertEqual(["a", "b", "c", "d", "e"], list(data.keys()))
+        self.assertEqual(["b", "c", "d"], calls)
+        self.assertEqual({"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}, dict(data))
+        self.assertEqual(["b", "c", "d", "e"], calls)
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
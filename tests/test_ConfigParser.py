@@ -1,6 +1,6 @@
 import unittest
 import pathlib
-from ccutils.ccparser import ConfigParser, CiscoIosParser
+from ccutils.ccparser import ConfigParser, CiscoIosParser, ConfigToJson, parse_configs
 from ccutils.utils.common_utils import jprint
 import json
 
@@ -165,5 +165,25 @@ class TestConfigParser01(unittest.TestCase):
         jprint(have)
 
 
+class TestParseConfigs(unittest.TestCase):
+
+    resources_path = pathlib.Path(__file__).parent.joinpath("resources")
+    test_files = ["global_config_01", "interface_l2_test", "vlans_test"]
+
+    def test_parse_configs(self):
+        paths = [self.resources_path.joinpath("{}.txt".format(x)) for x in self.test_files]
+        want = {}
+        for path in paths:
+            want[path.stem] = ConfigToJson(config=ConfigParser(config=path, device_type="ios", verbosity=VERBOSITY), verbosity=VERBOSITY).data
+        for processes in [1, 2]:
+            with self.subTest(msg=processes):
+                have = dict(parse_configs(source=paths, processes=processes, verbosity=VERBOSITY))
+                self.assertEqual(want, have)
+
+    def test_parse_configs_glob(self):
+        have = [x[0] for x in parse_configs(source=str(self.resources_path.joinpath("vlans_*.txt")), processes=1, verbosity=VERBOSITY)]
+        self.assertEqual(["vlans_test"], have)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
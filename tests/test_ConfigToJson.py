@@ -1,6 +1,7 @@
 import unittest
 import pathlib
 import json
+import io
 from ccutils.ccparser import ConfigParser, ConfigToJson
 
 
@@ -21,5 +22,71 @@ class TestConfigToJson(unittest.TestCase):
                 print(json.dumps(ctj.data, indent=2))
                 self.assertDictEqual(ctj.data, result)
 
+    def test_dump_json(self):
+        tests = ["interface_l2_test", "global_config_01", "interface_service_instances_test"]
+        for test in tests:
+            config = ConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/{}.txt".format(test)), device_type="ios", verbosity=3)
+            want_ctj = ConfigToJson(config=config, verbosity=3)
+            for indent in [2, 4, None]:
+                for parse in [True, False]:
+                    with self.subTest(msg="{} indent={} parse={}".format(test, indent, parse)):
+                        ctj = ConfigToJson(config=config, verbosity=3, parse=parse)
+                        fp = io.StringIO()
+                        ctj.dump_json(fp=fp, indent=indent)
+                        self.assertEqual(want_ctj.to_json(indent=indent), fp.getvalue())
+
+    def test_iter_interfaces(self):
+        config = ConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/interface_l2_test.txt"), device_type="ios", verbosity=3)
+        want = ConfigToJson(config=config, verbosity=3).get_ordered_interfaces()
+        config.clear_cache()
+        interface = next(config.interface_lines)
+        flags = interface.flags
+        cached = set(interface.cache_info())
+        have = dict(ConfigToJson(config=config, verbosity=3, parse=False).iter_interfaces())
+        self.assertEqual(dict(want), have)
+        # Properties computed by the caller are kept, those computed by the generator are dropped
+        self.assertEqual(cached, set(interface.cache_info()))
+        self.assertIs(flags, interface.flags)
+
+    def test_dump_jsonl(self):
+        config = ConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/interface_l2_test.txt"), device_type="ios", verbosity=3)
+        want = ConfigToJson(config=config, verbosity=3).data
+        fp = io.StringIO()
+        ConfigToJson(config=config, verbosity=3, parse=False).dump_jsonl(fp=fp)
+        have = {"interfaces": {}}
+        for line in fp.getvalue().splitlines():
+            record = json.loads(line)
+            if record["section"] == "interfaces":
+                have["interfaces"][record["name"]] = record["data"]
+            else:
+                have[record["section"]] = record["data"]
+        self.assertEqual(json.loads(json.dumps(want)), have)
+
+    def test_lazy(self):
+        config = ConfigParser(config=pathlib.Path(__file__).parent.joinpath("resources/interface_l2_test.txt"), device_type="ios", verbosity=3)
+        want = ConfigToJson(config=config, verbosity=3)
+        config.clear_cache()
+        ctj = ConfigToJson(config=config, verbosity=3, lazy=True)
+        interface = list(want.data["interfaces"].keys())[0]
+        self.assertEqual(want.data["vlans"], ctj.data["vlans"])
+        self.assertEqual(want.data["interfaces"][interface], ctj.data["interfaces"][interface])
+        self.assertEqual([interface], [x for x in ctj.data["interfaces"].keys() if ctj.data["interfaces"].is_loaded(x)])
+        self.assertEqual(want.to_json(), ctj.to_json())
+
+    def test_interface_order(self):
+        # Interfaces with the same slot path and number keep the order of the config
+        names = ["GigabitEthernet1/0/1", "AppGigabitEthernet1/0/1", "GigabitEthernet1/0/2", "TenGigabitEthernet1/1/1",
+                 "GigabitEthernet1/1/1", "Vlan1", "Loopback0"]
+        lines = []
+        for name in names:
+            lines.extend(["interface {}".format(name), " no ip address", "!"])
+        config = ConfigParser(config=lines, device_type="ios", verbosity=3)
+        want = ["Loopback0", "Vlan1", "GigabitEthernet1/0/1", "AppGigabitEthernet1/0/1", "GigabitEthernet1/0/2",
+                "TenGigabitEthernet1/1/1", "GigabitEthernet1/1/1"]
+        ctj = ConfigToJson(config=config, verbosity=3)
+        self.assertEqual(want, list(ctj.get_ordered_interfaces().keys()))
+        self.assertEqual(want, list(json.loads(ctj.to_json())["interfaces"].keys()))
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from ccutils.utils import InterfaceName, InterfaceNameCache, interface_names
+from ccutils.utils.common_utils import convert_interface_name
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestInterfaceNameCache(unittest.TestCase):
+
+    def test_parse(self):
+        tests = {
+            "GigabitEthernet1/0/1": InterfaceName(name="GigabitEthernet1/0/1", type="GigabitEthernet", number="1/0/1", path=(1, 0, 1), channel=None, subint=None),
+            "Po10.20": InterfaceName(name="Po10.20", type="Po", number="10.20", path=(10, ), channel=None, subint=20),
+            "Serial0/1/0:0.20": InterfaceName(name="Serial0/1/0:0.20", type="Serial", number="0/1/0:0.20", path=(0, 1, 0), channel=0, subint=20),
+            "1/0/1": None,
+            None: None
+        }
+        cache = InterfaceNameCache()
+        for name, want in tests.items():
+            with self.subTest(msg=name):
+                self.assertEqual(cache.parse(name), want)
+        parsed = cache.parse("Gi1/0/1.100")
+        self.assertIs(cache.parse("Gi1/0/1.100"), parsed)
+        self.assertEqual(parsed.long_name, "GigabitEthernet1/0/1.100")
+        self.assertEqual(parsed.short_name, "Gi1/0/1.100")
+        self.assertEqual(parsed.sort_key, (2, (1, 0), 1, 0, 100))
+        self.assertTrue(parsed.complete)
+        self.assertFalse(cache.parse("Gi1/0/1-4").complete)
+
+    def test_cache(self):
+        cache = InterfaceNameCache(max_size=2)
+        for name in ("Gi1", "Gi2", "Gi1", "Gi3", "Gi2"):
+            cache.parse(name)
+        self.assertEqual(cache.cache_info(), {"hits": 1, "misses": 4, "size": 2, "max_size": 2})
+        cache.clear_cache()
+        self.assertEqual(cache.cache_info()["size"], 0)
+
+    def test_convert(self):
+        tests = [
+            ("FastEthernet0/20", "short", "Fa0/20"),
+            ("Fa0/20", "long", "FastEthernet0/20"),
+            ("Eth1/1", "long", "Ethernet1/1"),
+            ("Ethernet1/1", "short", "Eth1/1"),
+            ("Port-channel10.20", "short", "Po10.20"),
+            ("Vl10", "short", "Vl10"),
+            ("BDI10", "short", "BDI10")
+        ]
+        for name, out, want in tests:
+            with self.subTest(msg=name):
+                self.assertEqual(interface_names.convert(name, out=out), want)
+                self.assertEqual(convert_interface_name(name, out=out), want)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import pathlib
+import tempfile
+import os
+from ccutils.ccparser import ConfigParser, ConfigToJson
+from ccutils.utils import ParseCache
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestParseCache(unittest.TestCase):
+
+    test_file_path = pathlib.Path(__file__).parent.joinpath("resources/interface_l2_test.txt")
+
+    def test_parser_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            want = ConfigParser(config=self.test_file_path, device_type="ios", verbosity=VERBOSITY)
+            ConfigParser(config=self.test_file_path, device_type="ios", verbosity=VERBOSITY, cache_dir=cache_dir)
+            self.assertEqual(1, len(list(pathlib.Path(cache_dir).glob("*.pickle"))))
+            have = ConfigParser(config=self.test_file_path, device_type="ios", verbosity=VERBOSITY, cache_dir=cache_dir)
+            self.assertEqual([str(x) for x in want.lines], [str(x) for x in have.lines])
+            self.assertEqual([x.__class__ for x in want.lines], [x.__class__ for x in have.lines])
+            self.assertEqual([x.number for x in want.lines[0].get_children()], [x.number for x in have.lines[0].get_children()])
+            self.assertEqual([x.name for x in want.interface_lines], [x.name for x in have.interface_lines])
+
+    def test_config_to_json_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = ConfigParser(config=self.test_file_path, device_type="ios", verbosity=VERBOSITY)
+            want = ConfigToJson(config=config, verbosity=VERBOSITY).data
+            ConfigToJson(config=config, verbosity=VERBOSITY, cache_dir=cache_dir)
+            config = ConfigParser(config=self.test_file_path, device_type="ios", verbosity=VERBOSITY)
+            have = ConfigToJson(config=config, verbosity=VERBOSITY, cache_dir=cache_dir).data
+            self.assertEqual(want, have)
+            # Served from the cache, interfaces were not parsed again
+            self.assertFalse(any(x._cache for x in config.interface_lines))
+
+    def test_get_key(self):
+        key = ParseCache.get_key(text="hostname R1", namespace="CiscoIosParser")
+        self.assertEqual(key, ParseCache.get_key(text="hostname R1", namespace="CiscoIosParser"))
+        self.assertNotEqual(key, ParseCache.get_key(text="hostname R2", namespace="CiscoIosParser"))
+        self.assertNotEqual(key, ParseCache.get_key(text="hostname R1", namespace="ConfigToJson"))
+
+        # Entries of previous format version are not used
+        class NextParseCache(ParseCache):
+            FORMAT_VERSION = ParseCache.FORMAT_VERSION + 1
+        self.assertNotEqual(key, NextParseCache.get_key(text="hostname R1", namespace="CiscoIosParser"))
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ParseCache(cache_dir=cache_dir, verbosity=VERBOSITY)
+            keys = [cache.get_key(text=str(x)) for x in range(5)]
+            for i, key in enumerate(keys):
+                cache.set(key=key, entry="x" * 1000)
+                os.utime(str(cache._get_path(key)), (i, i))
+            # Reading an entry marks it as recently used
+            cache.get(key=keys[0])
+            entry_size = cache._get_path(keys[0]).stat().st_size
+            cache.max_size = 3 * entry_size
+            cache.evict()
+            have = [x for x in keys if cache._get_path(x).exists()]
+            self.assertEqual([keys[0], keys[3], keys[4]], have)
+
+    def test_invalid_entry(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ParseCache(cache_dir=cache_dir, verbosity=1)
+            key = cache.get_key(text="hostname R1")
+            cache._get_path(key).write_bytes(b"invalid")
+            self.assertIsNone(cache.get(key=key))
+            self.assertFalse(cache._get_path(key).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import pathlib
+import json
+import gc
+from ccutils.ccparser import ConfigParser, ConfigToJson
+from ccutils.utils import ParserStats
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestParserStats(unittest.TestCase):
+
+    path = pathlib.Path(__file__).parent.joinpath("resources/interface_l2_test.txt")
+
+    def test_disabled(self):
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY)
+        self.assertFalse(config.stats.enabled)
+        ConfigToJson(config=config, verbosity=VERBOSITY)
+        self.assertEqual(config.stats.to_dict(), {"stages": {}, "regexes": {}, "cache": {}, "properties": {}})
+
+    def test_stats(self):
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, stats=True)
+        self.assertTrue(config.stats.enabled)
+        for stage in ["read", "fix_indents", "create_cfg_line_objects"]:
+            with self.subTest(msg=stage):
+                self.assertEqual(config.stats.stages[stage]["count"], 1)
+        config.find_objects(regex=r"^interface Ethernet0/0$")
+        self.assertEqual(config.stats.regexes["^interface Ethernet0/0$"], 1)
+        interface = next(config.interface_lines)
+        interface.description
+        cache = dict(config.stats.cache["properties"])
+        interface.description
+        self.assertEqual(config.stats.properties["CiscoIosInterfaceLine.description"]["count"], 1)
+        self.assertEqual(config.stats.cache["properties"], {"hits": cache["hits"] + 1, "misses": cache["misses"]})
+        ConfigToJson(config=config, verbosity=VERBOSITY)
+        self.assertIn("config_to_json.interfaces", config.stats.stages)
+        self.assertIn("CiscoIosInterfaceLine.flags", dict(config.stats.get_top_properties(n=100)))
+        self.assertGreater(config.stats.get_top_regexes(n=1)[0][1], 0)
+        json.dumps(config.stats.to_dict())
+        config.stats.reset()
+        self.assertEqual(config.stats.properties, {})
+
+    def test_hook(self):
+        events = []
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, stats_hook=lambda *args: events.append(args))
+        self.assertTrue(config.stats.enabled)
+        self.assertIn(("stage", "fix_indents"), [x[:2] for x in events])
+        config.hostname
+        self.assertIn(("property", "CiscoIosParser.hostname"), [x[:2] for x in events])
+        data = config.stats.export()
+        self.assertEqual(events[-1], ("summary", None, data))
+
+    def test_timer(self):
+        stats = ParserStats(enabled=False)
+        with stats.timer("test"):
+            pass
+        self.assertEqual(stats.stages, {})
+        stats.enable()
+        with stats.timer("test"):
+            pass
+        self.assertEqual(stats.stages["test"]["count"], 1)
+
+    def test_active(self):
+        gc.collect()
+        self.assertFalse(ParserStats.active)
+        stats = ParserStats()
+        other = ParserStats()
+        other.enable()
+        self.assertTrue(ParserStats.active)
+        other.disable()
+        other.disable()
+        self.assertTrue(ParserStats.active)
+        stats.disable()
+        self.assertFalse(ParserStats.active)
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, stats=True)
+        self.assertTrue(ParserStats.active)
+        del config
+        gc.collect()
+        self.assertFalse(ParserStats.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import re
+from ccutils.utils import PatternSet
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestPatternSet(unittest.TestCase):
+
+    patterns = (
+        re.compile(r"^ntp server(?: vrf \S+)? (?P<server>\S+)"),
+        re.compile(r"vrf (?P<vrf>\S+)"),
+        re.compile(r"key (?P<key>\d+)"),
+        re.compile(r"(?P<prefer>prefer)"),
+        re.compile(r"(?P<name>key)(?P=name)? (?P<value>\d)"),
+        re.compile(r"(?P<source>source \S+)", flags=re.IGNORECASE),
+        re.compile(r"(\w+) \1"),
+        re.compile(r"(?i)VRF")
+    )
+
+    def test_search(self):
+        texts = [
+            "ntp server 10.0.0.1",
+            "ntp server vrf MGMT 10.0.0.1 key 1 prefer",
+            "ntp peer vrf MGMT 10.0.0.1 SOURCE Loopback0",
+            "logging host 10.0.0.1 vrf vrf MGMT",
+            ""
+        ]
+        pattern_set = PatternSet.get(patterns=self.patterns)
+        self.assertIs(pattern_set, PatternSet.get(patterns=self.patterns))
+        # Backreference by number and global inline flags are searched separately
+        self.assertEqual([6, 7], pattern_set._separate)
+        for text in texts:
+            with self.subTest(msg=text):
+                want = [(i, x.search(text).groupdict()) for i, x in enumerate(self.patterns) if x.search(text)]
+                self.assertEqual(want, pattern_set.search(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
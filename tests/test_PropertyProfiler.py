@@ -0,0 +1,104 @@
+import unittest
+import pathlib
+import tempfile
+import gc
+from ccutils.ccparser import ConfigParser, ConfigToJson, CiscoIosInterfaceLine
+from ccutils.utils import PropertyProfiler
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestPropertyProfiler(unittest.TestCase):
+
+    path = pathlib.Path(__file__).parent.joinpath("resources/cisco_ios_L3_interfaces_address_test.txt")
+
+    def test_profile(self):
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, profile=True)
+        ConfigToJson(config=config, verbosity=VERBOSITY)
+        profiler = config.profiler
+        self.assertEqual(profiler.entries["ConfigToJson.parse_interface"]["calls"], 2)
+        self.assertIn("CiscoIosInterfaceLine.standby", profiler.entries)
+        self.assertNotIn("CiscoIosInterfaceLine.logger", profiler.entries)
+        standby = profiler.entries["CiscoIosInterfaceLine.standby"]
+        self.assertGreaterEqual(standby["time"], standby["own_time"])
+        self.assertTrue(any("standby" in x for x in standby["regexes"]))
+        report = profiler.get_report(sort_by="own_time")
+        self.assertEqual([x["own_time"] for x in report], sorted([x["own_time"] for x in report], reverse=True))
+        self.assertEqual(len(profiler.get_report(sort_by="calls", n=3)), 3)
+        with self.assertRaises(ValueError):
+            profiler.get_report(sort_by="name")
+        self.assertIn("CiscoIosInterfaceLine.standby", profiler.format_report(n=None))
+        collapsed = profiler.get_collapsed().splitlines()
+        self.assertIn("ConfigToJson.parse_interfaces;ConfigToJson.parse_interface;CiscoIosInterfaceLine.snapshot;CiscoIosInterfaceLine.standby", [x.rsplit(" ", 1)[0] for x in collapsed])
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath("config.folded")
+            profiler.save_collapsed(path)
+            self.assertEqual(path.read_text().splitlines(), collapsed)
+
+    def test_not_profiled(self):
+        ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, profile=True)
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY)
+        self.assertIsNone(config.profiler)
+        data = ConfigToJson(config=config, verbosity=VERBOSITY).data
+        self.assertEqual(data["interfaces"]["Vlan100"]["l3"]["vrf"], "TEST")
+
+    def test_detach(self):
+        def get_attributes(target):
+            return {k: getattr(v, "fget", v) for k, v in vars(target).items()}
+
+        def is_instrumented(target, name):
+            return hasattr(vars(target).get(name, None), "__profiled__") or hasattr(getattr(vars(target).get(name, None), "fget", None), "__profiled__")
+
+        gc.collect()
+        attributes = get_attributes(CiscoIosInterfaceLine)
+        config = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, profile=True)
+        ConfigToJson(config=config, verbosity=VERBOSITY)
+        other = ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, profile=True)
+        self.assertTrue(is_instrumented(CiscoIosInterfaceLine, "standby"))
+        self.assertTrue(is_instrumented(ConfigToJson, "parse_interface"))
+        # Classes stay instrumented while another profiler is attached
+        other.profiler.detach()
+        self.assertTrue(is_instrumented(CiscoIosInterfaceLine, "standby"))
+        del config
+        gc.collect()
+        self.assertFalse(is_instrumented(CiscoIosInterfaceLine, "standby"))
+        self.assertFalse(is_instrumented(CiscoIosInterfaceLine, "flags"))
+        self.assertFalse(is_instrumented(ConfigToJson, "parse_interface"))
+        # Wrappers of inherited properties are not left behind on the subclass
+        self.assertEqual(attributes, get_attributes(CiscoIosInterfaceLine))
+        with ConfigParser(config=self.path, device_type="ios", verbosity=VERBOSITY, profile=True).profiler:
+            self.assertTrue(is_instrumented(CiscoIosInterfaceLine, "standby"))
+        self.assertFalse(is_instrumented(CiscoIosInterfaceLine, "standby"))
+
+    def test_instrument(self):
+        class Dummy(object):
+            def __init__(self, profiler):
+                self.profiler = profiler
+
+            @property
+            def outer(self):
+                return self.inner + 1
+
+            @property
+            def inner(self):
+                return 1
+
+            def method(self):
+                return self.outer
+
+        getter = vars(Dummy)["outer"].fget
+        PropertyProfiler.instrument(target=Dummy, methods=("method", ))
+        self.assertIs(vars(Dummy)["outer"].fget.__profiled__, getter)
+        profiler = PropertyProfiler()
+        self.assertEqual(Dummy(profiler=profiler).method(), 2)
+        self.assertEqual(Dummy(profiler=None).method(), 2)
+        self.assertEqual(sorted(profiler.stacks.keys()), ["Dummy.method", "Dummy.method;Dummy.outer", "Dummy.method;Dummy.outer;Dummy.inner"])
+        self.assertEqual(profiler.entries["Dummy.inner"]["calls"], 1)
+        PropertyProfiler.uninstrument(target=Dummy)
+        self.assertIs(vars(Dummy)["outer"].fget, getter)
+        self.assertFalse(hasattr(vars(Dummy)["method"], "__profiled__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import re
+from ccutils.utils import RegexRegistry, regex_registry
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestRegexRegistry(unittest.TestCase):
+
+    def test_compile(self):
+        registry = RegexRegistry(max_size=2)
+        first = registry.compile(regex=r"^hostname (?P<hostname>\S+)")
+        self.assertIs(first, registry.compile(regex=r"^hostname (?P<hostname>\S+)"))
+        self.assertEqual(registry.cache_info()["hits"], 1)
+        self.assertEqual(registry.cache_info()["misses"], 1)
+        # Flags are part of the key
+        self.assertIsNot(first, registry.compile(regex=r"^hostname (?P<hostname>\S+)", flags=re.MULTILINE))
+        # Least recently used pattern is evicted
+        registry.compile(regex=r"^hostname (?P<hostname>\S+)")
+        registry.compile(regex=r"^interface (?P<name>\S+)")
+        self.assertEqual(registry.cache_info()["size"], 2)
+        self.assertIs(first, registry.compile(regex=r"^hostname (?P<hostname>\S+)"))
+        self.assertEqual(registry.cache_info()["misses"], 3)
+        # Compiled patterns are returned as they are
+        self.assertIs(first, registry.compile(regex=first))
+        with self.assertRaises(re.error):
+            registry.compile(regex=r"(")
+        with self.assertRaises(TypeError):
+            registry.compile(regex=[r"^hostname"])
+        registry.clear_cache()
+        self.assertEqual(registry.cache_info(), {"hits": 0, "misses": 0, "size": 0, "max_size": 2, "named": 0})
+
+    def test_register(self):
+        registry = RegexRegistry()
+        pattern = registry.register(name="hostname", regex=r"^hostname (?P<hostname>\S+)", flags=re.MULTILINE)
+        self.assertIs(pattern, registry.get(name="hostname"))
+        # Registering the same pattern again returns the registered one
+        self.assertIs(pattern, registry.register(name="hostname", regex=r"^hostname (?P<hostname>\S+)", flags=re.MULTILINE))
+        # Registered patterns pre-warm the cache
+        self.assertIs(pattern, registry.compile(regex=r"^hostname (?P<hostname>\S+)", flags=re.MULTILINE))
+        with self.assertRaises(ValueError):
+            registry.register(name="hostname", regex=r"^hostname (?P<hostname>\S+)")
+        with self.assertRaises(KeyError):
+            registry.get(name="domain_name")
+        self.assertEqual(registry.cache_info()["named"], 1)
+
+    def test_shared_registry(self):
+        from ccutils.ccparser import BaseConfigParser, CiscoIosParser
+        self.assertIs(regex_registry.get(name="vrf_name"), BaseConfigParser._vrf_name_regex)
+        self.assertIs(CiscoIosParser._domain_name_regex, BaseConfigParser._domain_name_regex)
+        _maxcache = re._MAXCACHE
+        BaseConfigParser(config=["hostname Test"])
+        self.assertEqual(re._MAXCACHE, _maxcache)
+
+if __name__ == '__main__':
+    unittest.main()
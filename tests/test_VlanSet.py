@@ -0,0 +1,76 @@
+import unittest
+from ccutils.ccparser import ConfigParser
+from ccutils.utils import VlanSet, CiscoRange
+
+DEBUG = False
+VERBOSITY = 5 if DEBUG else 3
+
+
+class TestVlanSet(unittest.TestCase):
+
+    def test_create(self):
+        tests = {
+            "String": ("1,3,4-6,8, 11 - 20, 9", ["1", "3-6", "8", "9", "11-20"]),
+            "List": ([1, "2", "10-12"], ["1", "2", "10-12"]),
+            "Int": (4094, ["4094"]),
+            "CiscoRange": (CiscoRange("100-200,300"), ["100-200", "300"]),
+            "None": ("none", []),
+            "All": ("all", ["1-4094"])
+        }
+        for test, (data, result) in tests.items():
+            with self.subTest(msg=test):
+                self.assertEqual(VlanSet(data).compressed_list, result)
+        for data in ("0", "4095", "10-5", "10,abc", [5000]):
+            with self.subTest(msg=data):
+                with self.assertRaises(ValueError):
+                    VlanSet(data)
+
+    def test_operations(self):
+        allowed = VlanSet("1-10,20,4000-4094")
+        defined = VlanSet([1, 2, 3, 20])
+        self.assertEqual((allowed - defined).to_string(), "4-10,4000-4094")
+        self.assertEqual((allowed & defined), defined)
+        self.assertEqual((allowed | "30").to_string(), "1-10,20,30,4000-4094")
+        self.assertEqual((allowed ^ VlanSet("5-25")).to_string(), "1-4,11-19,21-25,4000-4094")
+        self.assertEqual((~allowed).to_string(), "11-19,21-3999")
+        self.assertEqual(len(allowed), 106)
+        self.assertIn(20, allowed)
+        self.assertIn("4094", allowed)
+        self.assertNotIn("21", allowed)
+        self.assertTrue(defined <= allowed)
+        self.assertTrue(defined < allowed)
+        self.assertFalse(allowed <= defined)
+        self.assertTrue(defined.isdisjoint("4-19"))
+        self.assertEqual(list(VlanSet("3,1-2")), [1, 2, 3])
+        self.assertEqual(VlanSet.from_bytes(allowed.to_bytes()), allowed)
+        self.assertEqual(len(allowed.to_bytes()), 512)
+        self.assertEqual(allowed.to_crange().compressed_list, allowed.compressed_list)
+        self.assertEqual(len({VlanSet("1-2"), VlanSet([1, 2])}), 1)
+
+    def test_config(self):
+        config = ConfigParser(config=[
+            "vlan 10", " name VLAN10", "vlan 20", " name VLAN20",
+            "interface GigabitEthernet1/0/1", " switchport mode trunk", " switchport trunk allowed vlan 10,20,30-32",
+            " switchport trunk allowed vlan add 40",
+            "interface GigabitEthernet1/0/2", " switchport mode trunk", " switchport trunk allowed vlan none",
+            "interface GigabitEthernet1/0/3", " switchport mode access",
+            "interface GigabitEthernet1/0/4", " switchport mode trunk", " switchport trunk allowed vlan 10-20",
+            " switchport trunk allowed vlan remove 3", " switchport trunk allowed vlan remove 12-14",
+            "interface GigabitEthernet1/0/5", " switchport mode trunk", " switchport trunk allowed vlan except 2-4093",
+            " switchport trunk allowed vlan add 100"
+        ], device_type="ios", verbosity=VERBOSITY)
+        interfaces = {x.name: x for x in config.interface_lines}
+        self.assertEqual(config.vlan_set, VlanSet("10,20"))
+        self.assertEqual(interfaces["GigabitEthernet1/0/1"].trunk_allowed_vlan_set - config.vlan_set, VlanSet("30-32,40"))
+        self.assertEqual(interfaces["GigabitEthernet1/0/1"].trunk_allowed_vlans, ["10", "20", "30", "31", "32", "40"])
+        self.assertEqual(interfaces["GigabitEthernet1/0/2"].trunk_allowed_vlan_set, VlanSet())
+        self.assertEqual(interfaces["GigabitEthernet1/0/2"].trunk_allowed_vlans, "none")
+        self.assertIsNone(interfaces["GigabitEthernet1/0/3"].trunk_allowed_vlan_set)
+        self.assertIsNone(interfaces["GigabitEthernet1/0/3"].trunk_allowed_vlans)
+        self.assertEqual(interfaces["GigabitEthernet1/0/4"].trunk_allowed_vlan_set, VlanSet("10,11,15-20"))
+        self.assertEqual(interfaces["GigabitEthernet1/0/5"].trunk_allowed_vlan_set, VlanSet("1,100,4094"))
+        self.assertEqual(interfaces["GigabitEthernet1/0/5"].trunk_allowed_vlans, ["1", "100", "4094"])
+
+
+if __name__ == '__main__':
+    unittest.main()